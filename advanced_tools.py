@@ -2,47 +2,77 @@
 Advanced 3D modeling tools for complex model generation
 """
 from typing import Any, Dict, List, Optional, Tuple
+from array import array
 import logging
-from blender_integration import blender_manager
+import os
+import uuid
+import mesh_utils
+from blender_integration import DEFAULT_TIMEOUT, get_blender_manager, noop_result
 
 logger = logging.getLogger(__name__)
 
+def _write_mesh_payload(coords: array, loop_start: array, loop_total: array, vertex_index: array) -> str:
+    """Write packed mesh arrays to a binary sidecar file for bulk upload.
+    
+    The file holds float32 coordinates followed by int32 loop_start,
+    loop_total and vertex_index arrays, in the layout Mesh.foreach_set expects.
+    
+    Returns:
+        Path of the sidecar file
+    """
+    path = os.path.join(get_blender_manager().temp_dir, f"mesh_{uuid.uuid4().hex}.bin")
+    with open(path, "wb") as f:
+        for data in (coords, loop_start, loop_total, vertex_index):
+            data.tofile(f)
+    return path
+
 def create_mesh_from_vertices(vertices: List[Tuple[float, float, float]], 
                              faces: List[List[int]], 
-                             name: str = "CustomMesh") -> Dict[str, Any]:
+                             name: str = "CustomMesh",
+                             clear_scene: bool = True) -> Dict[str, Any]:
     """Create a custom mesh from vertices and faces.
     
     Args:
-        vertices: List of (x, y, z) vertex coordinates
-        faces: List of face indices (each face is a list of vertex indices)
+        vertices: List (or (N, 3) numpy array) of (x, y, z) vertex coordinates
+        faces: List of face indices (each face is a list of vertex indices), or an
+            (F, K) numpy array of faces with K corners each
         name: Name for the mesh object
+        clear_scene: Delete all existing objects first
     
     Returns:
-        Dictionary with creation result
+        Dictionary with creation result; "degenerate_faces" lists the indices of
+        faces with zero area (no defined normal)
     """
-    vertices_str = str(vertices).replace("'", "")
-    faces_str = str(faces).replace("'", "")
-    
-    operations = [
-        f'import bmesh',
-        f'mesh = bpy.data.meshes.new("{name}")',
-        f'obj = bpy.data.objects.new("{name}", mesh)',
-        f'bpy.context.collection.objects.link(obj)',
-        f'bm = bmesh.new()',
-        f'vertices = {vertices_str}',
-        f'faces = {faces_str}',
-        f'for v in vertices:',
-        f'    bm.verts.new(v)',
-        f'bm.verts.ensure_lookup_table()',
-        f'for f in faces:',
-        f'    bm.faces.new([bm.verts[i] for i in f])',
-        f'bm.to_mesh(mesh)',
-        f'bm.free()',
-        f'results.append({{"object": "{name}", "type": "custom_mesh", "vertices": len(vertices), "faces": len(faces)}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    manager = get_blender_manager()
+    coords, loop_start, loop_total, vertex_index = mesh_utils.pack_mesh(vertices, faces)
+    error = mesh_utils.validate_mesh(coords, loop_total, vertex_index)
+    if error is not None:
+        return {
+            "success": False,
+            "error": error
+        }
+    bounds = mesh_utils.compute_bounds(coords)
+    normals = mesh_utils.compute_face_normals(coords, loop_start, loop_total, vertex_index)
+    degenerate_faces = [index for index, normal in enumerate(normals) if not any(normal)]
+    corner_count = len(vertex_index)
+    args = {
+        "vertex_count": len(vertices),
+        "face_count": len(faces),
+        "corner_count": corner_count,
+        "name": name
+    }
+    # The in-process module reads the arrays directly; Blender processes get them
+    # through a sidecar file in the memory-backed session directory
+    if manager.in_process:
+        args["arrays"] = (coords, loop_start, loop_total, vertex_index)
+        payload_path = None
+    else:
+        payload_path = args["payload_path"] = _write_mesh_payload(coords, loop_start, loop_total, vertex_index)
+    # Large meshes get a time budget that grows with their size
+    timeout = max(DEFAULT_TIMEOUT, 5 + 1e-4 * (len(vertices) + corner_count))
+    result = manager.run_op("create_mesh_from_vertices", args, timeout, clear_scene)
+    if payload_path is not None and not result.get("deferred"):
+        os.remove(payload_path)
     
     return {
         "success": result["success"],
@@ -50,6 +80,8 @@ def create_mesh_from_vertices(vertices: List[Tuple[float, float, float]],
         "object_type": "custom_mesh",
         "vertex_count": len(vertices),
         "face_count": len(faces),
+        "bounds": bounds,
+        "degenerate_faces": degenerate_faces,
         "blender_output": result.get("stdout", ""),
         "errors": result.get("stderr", "") if not result["success"] else None
     }
@@ -65,24 +97,7 @@ def extrude_face(object_name: str, face_index: int, distance: float = 1.0) -> Di
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'import bmesh',
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bm = bmesh.from_mesh(obj.data)',
-        f'bm.faces.ensure_lookup_table()',
-        f'face = bm.faces[{face_index}]',
-        f'bmesh.ops.extrude_discrete_faces(bm, faces=[face])',
-        f'bmesh.ops.translate(bm, vec=(0, 0, {distance}), verts=face.verts)',
-        f'bm.to_mesh(obj.data)',
-        f'bm.free()',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "extrude_face", "object": "{object_name}", "face_index": {face_index}, "distance": {distance}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_op("extrude_face", {"object_name": object_name, "face_index": face_index, "distance": distance})
     
     return {
         "success": result["success"],
@@ -104,19 +119,7 @@ def inset_faces(object_name: str, thickness: float = 0.1, depth: float = 0.0) ->
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'import bmesh',
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.select_all(action="SELECT")',
-        f'bpy.ops.mesh.inset(thickness={thickness}, depth={depth})',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "inset_faces", "object": "{object_name}", "thickness": {thickness}, "depth": {depth}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_op("inset_faces", {"object_name": object_name, "thickness": thickness, "depth": depth})
     
     return {
         "success": result["success"],
@@ -136,20 +139,18 @@ def bevel_edges(object_name: str, offset: float = 0.1, segments: int = 1) -> Dic
         segments: Number of bevel segments
     
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result ("skipped" when offset is 0 and the object was only checked)
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.select_all(action="SELECT")',
-        f'bpy.ops.mesh.bevel(offset={offset}, segments={segments})',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "bevel_edges", "object": "{object_name}", "offset": {offset}, "segments": {segments}}})'
-    ]
+    if offset < 0:
+        return {
+            "success": False,
+            "error": f"Bevel offset must not be negative: {offset}"
+        }
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    if offset == 0:
+        return noop_result("bevel_edges", object_name, {"offset": offset, "segments": segments})
+    
+    result = get_blender_manager().run_op("bevel_edges", {"object_name": object_name, "offset": offset, "segments": segments})
     
     return {
         "success": result["success"],
@@ -169,19 +170,18 @@ def loop_cut(object_name: str, cuts: int = 1, smoothness: float = 0.0) -> Dict[s
         smoothness: Smoothness factor
     
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result ("skipped" when cuts is 0 and the object was only checked)
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.loopcut_slide(MESH_OT_loopcut={{"number_cuts": {cuts}, "smoothness": {smoothness}}})',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "loop_cut", "object": "{object_name}", "cuts": {cuts}, "smoothness": {smoothness}}})'
-    ]
+    if cuts < 0:
+        return {
+            "success": False,
+            "error": f"Number of cuts must not be negative: {cuts}"
+        }
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    if cuts == 0:
+        return noop_result("loop_cut", object_name, {"cuts": cuts, "smoothness": smoothness})
+    
+    result = get_blender_manager().run_op("loop_cut", {"object_name": object_name, "cuts": cuts, "smoothness": smoothness})
     
     return {
         "success": result["success"],
@@ -202,14 +202,7 @@ def scale_object(object_name: str, scale: Tuple[float, float, float] = (1.0, 1.0
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'obj.scale = {scale}',
-        f'results.append({{"action": "scale_object", "object": "{object_name}", "scale": {scale}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().set_transform(object_name, "scale", list(scale))
     
     return {
         "success": result["success"],
@@ -230,15 +223,7 @@ def rotate_object(object_name: str, rotation: Tuple[float, float, float] = (0.0,
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'import mathutils',
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'obj.rotation_euler = {rotation}',
-        f'results.append({{"action": "rotate_object", "object": "{object_name}", "rotation": {rotation}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().set_transform(object_name, "rotation_euler", list(rotation))
     
     return {
         "success": result["success"],
@@ -259,14 +244,7 @@ def move_object(object_name: str, location: Tuple[float, float, float]) -> Dict[
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'obj.location = {location}',
-        f'results.append({{"action": "move_object", "object": "{object_name}", "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().set_transform(object_name, "location", list(location))
     
     return {
         "success": result["success"],
@@ -0,0 +1,97 @@
+"""
+Background asyncio event loop shared by synchronous and asynchronous callers
+Coroutines submitted from any thread run on one loop in a daemon thread, so blocking
+tool functions and the MCP server's own event loop can both drive the same async code.
+"""
+import asyncio
+import concurrent.futures
+import os
+import threading
+from typing import Any, Coroutine, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it is installed.
+    
+    Set BLENDER_MCP_USE_UVLOOP=0 to always use the standard asyncio loop.
+    """
+    if uvloop is not None and os.environ.get("BLENDER_MCP_USE_UVLOOP", "1") != "0":
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+class AsyncLoopThread:
+    """An asyncio event loop running forever in a daemon thread."""
+    
+    def __init__(self, name: str = "blender-mcp-loop"):
+        """Initialize the loop handle; the thread is started on first submit().
+        
+        Args:
+            name: Name of the loop thread
+        """
+        self.name = name
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start the loop thread if it is not already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self.loop = new_event_loop()
+            started = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self.loop, started), name=self.name, daemon=True)
+            self._thread.start()
+            started.wait()
+            logger.debug(f"Started event loop thread {self.name}")
+    
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, started: threading.Event):
+        """Thread body: run the loop until stop() is called."""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+        loop.close()
+    
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the loop thread.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Future for the coroutine's result, usable from any thread
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the loop thread and wait for its result.
+        
+        Raises:
+            RuntimeError: If called from the loop thread itself, which would deadlock
+        """
+        if self._thread is threading.current_thread():
+            coro.close()
+            raise RuntimeError("AsyncLoopThread.run() called from its own loop thread")
+        return self.submit(coro).result()
+    
+    async def wrap(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Await a coroutine on the loop thread from another event loop."""
+        return await asyncio.wrap_future(self.submit(coro))
+    
+    def stop(self):
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        thread.join()
@@ -3,31 +3,573 @@ Blender Python API integration module for MCP server
 Handles Blender subprocess management and bpy operations
 """
 import subprocess
+import shutil
 import sys
 import os
+import io
 import tempfile
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import contextlib
+import functools
+import traceback
+import time
+import threading
+import queue
+import asyncio
+import atexit
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import logging
+from async_loop import AsyncLoopThread
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bootstrap script run by the persistent Blender worker process
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blender_worker.py")
+
+# Arguments starting the worker. Importing it as a module rather than running it with
+# --python lets Python reuse the cached bytecode in __pycache__ instead of recompiling
+WORKER_ARGS = ["--python-expr", (
+    f"import sys; sys.path.insert(0, {os.path.dirname(WORKER_SCRIPT)!r}); "
+    "import blender_worker; blender_worker.main()"
+)]
+
+# Prefix of reply lines written by the worker (see blender_worker.py)
+WORKER_REPLY_PREFIX = "BLENDER_MCP_REPLY:"
+
+# Prefix of the per-call completion lines of a streamed "run" request
+WORKER_CALL_PREFIX = "BLENDER_MCP_CALL:"
+
+# ops_library operations that only read and change the objects named in their args,
+# so calls on disjoint objects can run on separate workers (see independent_groups)
+OBJECT_LOCAL_OPS = frozenset({
+    "create_primitive", "create_mesh_from_vertices", "set_transforms", "check_object",
+    "add_modifiers", "apply_modifier", "extrude_face", "inset_faces", "bevel_edges",
+    "loop_cut", "loop_subdivide", "smooth_object", "mesh_pipeline", "qem_decimate",
+    "triangulate_mesh", "add_uv_mapping"
+})
+
+# ops_library operations that leave object transforms and material assignments alone
+# (see SceneState.record)
+STATE_PRESERVING_OPS = frozenset({
+    "check_object", "add_modifiers", "apply_modifier", "extrude_face", "inset_faces", "bevel_edges",
+    "loop_cut", "loop_subdivide", "smooth_object", "mesh_pipeline", "qem_decimate",
+    "triangulate_mesh", "add_uv_mapping", "save_blend", "create_material",
+    "create_glass_material", "create_metal_material", "create_emission_material"
+})
+
+# Seconds a Blender run may take unless the caller supplies a larger budget
+DEFAULT_TIMEOUT = 30
+
+# Scripts up to this size are passed with --python-expr; larger ones are piped to
+# Blender's stdin. Linux allows 128 KiB per argument, Windows 32K for the whole command line.
+MAX_INLINE_SCRIPT_BYTES = 24 * 1024 if os.name == "nt" else 100_000
+
+# Bootstrap for scripts too large for the command line: read the script from stdin
+STDIN_SCRIPT_EXPR = 'import sys; exec(compile(sys.stdin.read(), "<blender_mcp>", "exec"))'
+
+# Memory-backed directory for the session's temporary files, when the platform has one
+SCRIPT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# On-disk cache of the located Blender executable, keyed by platform
+BLENDER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".blender_mcp_cache")
+
+# Operations prepended to a generated script by create_basic_script(clear_scene=True)
+CLEAR_SCENE_OPERATIONS = [
+    "bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes) + list(bpy.data.materials))"
+]
+
+# Template for generated scripts; operations are inserted between prefix and suffix
+SCRIPT_TEMPLATE = '''
+import bpy
+import bmesh
+import json
+import sys
+import traceback
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def encode(data):
+    return orjson.dumps(data).decode() if orjson is not None else json.dumps(data)
+
+def report(data, marker):
+    # Write to the results file passed as "-- --results <path>", else print to stdout
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if len(args) == 2 and args[0] == "--results":
+        with open(args[1], "w") as f:
+            f.write(encode(data))
+    else:
+        print(marker, encode(data))
+
+def main():
+    try:
+        results = []
+        
+        {operations}
+        
+        # Success output
+        report({"success": True, "results": results}, "BLENDER_MCP_SUCCESS:")
+        
+    except Exception as e:
+        error_info = {
+            "success": False,
+            "error": str(e),
+            "traceback": traceback.format_exc()
+        }
+        report(error_info, "BLENDER_MCP_ERROR:")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
+'''
+SCRIPT_PREFIX, SCRIPT_SUFFIX = SCRIPT_TEMPLATE.split("{operations}")
+
+# Joins operations at the indentation of the template's try block
+OPERATION_SEPARATOR = "\n        "
+
+# Only the last lines of Blender's output are kept, without render progress lines
+OUTPUT_TAIL_LINES = 200
+PROGRESS_LINE = re.compile(r"^(Fra:|\s*\|)")
+
+# Output pipes are read in large chunks; single output lines may be up to MAX_OUTPUT_LINE bytes
+PIPE_BUFFER_SIZE = 1 << 16
+MAX_OUTPUT_LINE = 1 << 20
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured Blender output, replacing undecodable bytes."""
+    return data.decode("utf-8", errors="replace")
+
+def _tail_text(text: str) -> str:
+    """Drop progress lines from captured text and keep its last OUTPUT_TAIL_LINES lines."""
+    lines = (line for line in text.splitlines(keepends=True) if not PROGRESS_LINE.match(line))
+    return "".join(collections.deque(lines, maxlen=OUTPUT_TAIL_LINES))
+
+def _collect_tail(stream, tail: "collections.deque[str]"):
+    """Read a binary stream line by line, keeping the non-progress lines in tail."""
+    for raw in stream:
+        line = _decode_output(raw)
+        if not PROGRESS_LINE.match(line):
+            tail.append(line)
+
+async def _collect_tail_async(stream: asyncio.StreamReader, tail: "collections.deque[str]"):
+    """Asynchronous _collect_tail() for asyncio subprocess pipes."""
+    async for raw in stream:
+        line = _decode_output(raw)
+        if not PROGRESS_LINE.match(line):
+            tail.append(line)
+
+async def _feed_stdin(stream: Optional[asyncio.StreamWriter], data: Optional[bytes]):
+    """Write data to a subprocess's stdin pipe and close it."""
+    if stream is None:
+        return
+    stream.write(data)
+    await stream.drain()
+    stream.close()
+
+def _run_captured(cmd: List[str], timeout: float) -> Tuple[int, str, str]:
+    """Run a command, streaming its output so only the tails are held in memory.
+    
+    Args:
+        cmd: Command line
+        timeout: Seconds before the process is killed
+        
+    Returns:
+        (returncode, stdout tail, stderr tail)
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process ran out of time
+    """
+    process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               bufsize=PIPE_BUFFER_SIZE)
+    tails = (collections.deque(maxlen=OUTPUT_TAIL_LINES), collections.deque(maxlen=OUTPUT_TAIL_LINES))
+    readers = [
+        threading.Thread(target=_collect_tail, args=(stream, tail), daemon=True)
+        for stream, tail in zip((process.stdout, process.stderr), tails)
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+    return process.returncode, "".join(tails[0]), "".join(tails[1])
+
+def _dumps(data: Any) -> str:
+    """Encode a worker message as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
+def _loads(data: Any) -> Any:
+    """Decode a JSON worker message (str or bytes), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _check_time_budget(started: float, timeout: float):
+    """Warn when a Blender run used more than half of its time budget."""
+    elapsed = time.monotonic() - started
+    if elapsed > timeout / 2:
+        logger.warning(f"Blender run took {elapsed:.1f}s of its {timeout:.0f}s timeout")
+
+def _call_objects(op_name: str, args: Dict[str, Any]) -> List[str]:
+    """Names of the objects an OBJECT_LOCAL_OPS call creates or uses."""
+    if op_name == "set_transforms":
+        return list(args["transforms"])
+    if op_name in ("create_primitive", "create_mesh_from_vertices"):
+        return [args["name"]]
+    return [args["object_name"]]
+
+def independent_groups(calls: List[Tuple[str, Dict[str, Any]]]) -> Optional[List[List[Tuple[str, Dict[str, Any]]]]]:
+    """Split calls into groups that touch disjoint objects and create every object they use.
+    
+    Such groups can run on separate workers starting from empty scenes (see
+    BlenderManager.execute_parallel). Calls keep their order within a group.
+    
+    Args:
+        calls: (op_name, args) pairs, in execution order
+        
+    Returns:
+        The groups, or None if a call is not in OBJECT_LOCAL_OPS or uses an
+        object that is not created earlier in its group
+    """
+    if any(op_name not in OBJECT_LOCAL_OPS for op_name, _ in calls):
+        return None
+    # Object name -> index of its group; groups sharing an object are merged
+    group_of: Dict[str, int] = {}
+    groups: Dict[int, List[int]] = {}
+    for index, (op_name, args) in enumerate(calls):
+        names = _call_objects(op_name, args)
+        targets = sorted({group_of[name] for name in names if name in group_of})
+        group = targets[0] if targets else index
+        members = groups.setdefault(group, [])
+        for other in targets[1:]:
+            members.extend(groups.pop(other))
+        members.append(index)
+        for name, owner in group_of.items():
+            if owner in targets:
+                group_of[name] = group
+        for name in names:
+            group_of[name] = group
+    
+    result = []
+    for members in groups.values():
+        group_calls = [calls[index] for index in sorted(members)]
+        created = set()
+        for op_name, args in group_calls:
+            if op_name in ("create_primitive", "create_mesh_from_vertices"):
+                created.add(args["name"])
+            elif not created.issuperset(_call_objects(op_name, args)):
+                return None
+        result.append(group_calls)
+    return result
+
+class BlenderWorker:
+    """A persistent Blender process serving JSON requests over stdin/stdout."""
+    
+    def __init__(self, blender_executable: str, startup_args: List[str]):
+        """Initialize the worker handle; the process is started by start().
+        
+        Args:
+            blender_executable: Path to Blender executable
+            startup_args: Arguments selecting the startup scene (see BlenderManager.startup_args)
+        """
+        self.blender_executable = blender_executable
+        self.startup_args = startup_args
+        self.process: Optional[subprocess.Popen] = None
+        # Requests sent to this process, for recycling it after BLENDER_MCP_WORKER_MAX_JOBS
+        self.jobs = 0
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+    
+    def start(self) -> Dict[str, Any]:
+        """Launch the worker process and health-check it with a ping.
+        
+        Returns:
+            The ping reply (with "blender_version" on success)
+        """
+        cmd = [self.blender_executable] + self.startup_args + WORKER_ARGS
+        logger.info(f"Starting Blender worker: {' '.join(cmd)}")
+        try:
+            self.process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        self._lines = queue.Queue()
+        reader = threading.Thread(
+            target=self._read_output,
+            args=(self.process.stdout, self._lines),
+            daemon=True
+        )
+        reader.start()
+        return self.request({"command": "ping"}, timeout=60)
+    
+    def alive(self) -> bool:
+        """Return True if the worker process is running."""
+        return self.process is not None and self.process.poll() is None
+    
+    @staticmethod
+    def _read_output(stream, lines: "queue.Queue[Optional[str]]"):
+        """Forward worker stdout lines to a queue; None marks end of stream."""
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+    
+    def request(self, request: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT,
+                on_call: Optional[Callable[[int, List[Any]], None]] = None) -> Dict[str, Any]:
+        """Send one request to the worker and wait for its reply.
+        
+        Args:
+            request: JSON-serializable request (see blender_worker.handle_request)
+            timeout: Seconds the whole request may take before the worker is killed
+            on_call: For "run" requests, called as on_call(index, records) as each
+                call completes, before the reply arrives
+            
+        Returns:
+            Decoded reply; non-reply output lines are prepended to its "stdout"
+        """
+        # "run" requests stream each call's records as a line of their own, so the
+        # reply stays small and records are decoded while later calls still run
+        streamed: Optional[List[Any]] = None
+        if request.get("command") == "run":
+            request = dict(request, stream=True)
+            streamed = []
+        with self._lock:
+            if self.process is None:
+                return {"success": False, "error": "Blender worker is not running"}
+            output: "collections.deque[str]" = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+            # Output lines do not extend the budget, so a request that keeps printing is still killed
+            deadline = time.monotonic() + timeout
+            try:
+                self.process.stdin.write(_dumps(request) + "\n")
+                self.process.stdin.flush()
+                self.jobs += 1
+                while True:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if line is None:
+                        return {"success": False, "error": "Blender worker exited unexpectedly", "stdout": "".join(output)}
+                    if line.startswith(WORKER_REPLY_PREFIX):
+                        break
+                    if line.startswith(WORKER_CALL_PREFIX):
+                        if streamed is not None:
+                            completion = _loads(line[len(WORKER_CALL_PREFIX):])
+                            streamed.extend(completion["results"])
+                            if on_call is not None:
+                                on_call(completion["index"], completion["results"])
+                        continue
+                    if not PROGRESS_LINE.match(line):
+                        output.append(line)
+            except queue.Empty:
+                self.shutdown()
+                return {"success": False, "error": "Blender script execution timed out", "timeout": True}
+            except OSError as e:
+                self.shutdown()
+                return {"success": False, "error": f"Blender worker pipe error: {e}"}
+        
+        response = _loads(line[len(WORKER_REPLY_PREFIX):])
+        if streamed is not None:
+            response["results"] = streamed + response.get("results", [])
+        response["stdout"] = _tail_text("".join(output) + response.get("stdout", ""))
+        return response
+    
+    def shutdown(self):
+        """Stop the worker process, if running."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+class SceneState:
+    """Client-side record of object transforms not yet sent to Blender.
+    
+    Transform tools only assign attributes, so while a batch is open they are
+    collected here (last value wins) and lowered to one set_transforms call.
+    
+    It also remembers the transforms and materials that calls on a persistent
+    backend have set, so a call setting the same values again can be skipped.
+    """
+    
+    def __init__(self):
+        """Initialize with no pending transforms."""
+        self.transforms: Dict[str, Dict[str, List[float]]] = {}
+        # Object name -> attribute ("location", ..., "material") -> value set in Blender
+        self.applied: Dict[str, Dict[str, Any]] = {}
+    
+    def redundant(self, op_name: str, args: Dict[str, Any]) -> bool:
+        """Whether a call would only set values the objects already have.
+        
+        Args:
+            op_name: Name of the ops_library operation
+            args: Its arguments
+        """
+        if op_name == "set_transforms":
+            return all(
+                self.applied.get(name, {}).get(attribute) == list(value)
+                for name, values in args["transforms"].items()
+                for attribute, value in values.items()
+            )
+        if op_name == "apply_material_to_object":
+            return self.applied.get(args["object_name"], {}).get("material") == args["material_name"]
+        return False
+    
+    def record(self, calls: List[Tuple[str, Dict[str, Any]]], success: bool):
+        """Update the applied values after calls ran on a persistent backend.
+        
+        Calls that may change objects in ways not tracked here forget everything,
+        as does any failure, since a failed call may have partly run.
+        
+        Args:
+            calls: (op_name, args) pairs that were run
+            success: Whether all of them completed
+        """
+        if not success:
+            self.applied.clear()
+            return
+        for op_name, args in calls:
+            if op_name == "set_transforms":
+                for name, values in args["transforms"].items():
+                    self.applied.setdefault(name, {}).update((k, list(v)) for k, v in values.items())
+            elif op_name == "apply_material_to_object":
+                self.applied.setdefault(args["object_name"], {})["material"] = args["material_name"]
+            elif op_name in ("create_primitive", "create_mesh_from_vertices"):
+                self.applied.pop(args["name"], None)
+            elif op_name in ("create_and_apply_material", "add_noise_texture"):
+                self.applied.pop(args["object_name"], None)
+            elif op_name not in STATE_PRESERVING_OPS:
+                self.applied.clear()
+    
+    def set(self, object_name: str, attribute: str, value: List[float]):
+        """Record a transform attribute for an object.
+        
+        Args:
+            object_name: Name of the Blender object
+            attribute: "location", "scale" or "rotation_euler"
+            value: (x, y, z) values
+        """
+        self.transforms.setdefault(object_name, {})[attribute] = value
+    
+    def drain(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return the pending transforms as calls and clear them."""
+        if not self.transforms:
+            return []
+        transforms, self.transforms = self.transforms, {}
+        return [("set_transforms", {"transforms": transforms})]
+
 class BlenderManager:
     """Manages Blender subprocess and Python API interactions."""
     
+    # Blender executable found by _find_blender(), shared by all instances
+    _blender_path_cache: Optional[str] = None
+    
     def __init__(self, blender_executable: Optional[str] = None):
         """Initialize Blender manager.
         
         Args:
             blender_executable: Path to Blender executable. If None, tries to find it.
         """
-        self.blender_executable = blender_executable or self._find_blender()
-        self.temp_dir = tempfile.mkdtemp(prefix="blender_mcp_")
+        self._bpy = self._load_bpy_module()
+        # The bpy module replaces the Blender executable when it is available
+        if blender_executable or self._bpy is None:
+            self.blender_executable = blender_executable or self._find_blender()
+        else:
+            self.blender_executable = None
+        # Everything cleanup() must release, closed in reverse order of registration
+        self._exit_stack = contextlib.ExitStack()
+        # Session files (empty scene template, mesh sidecars, per-call directories), memory-backed if possible
+        self.temp_dir = self._exit_stack.enter_context(tempfile.TemporaryDirectory(prefix="blender_mcp_", dir=SCRIPT_DIR))
+        # Empty scene template replacing --factory-startup, built on first launch
+        self._empty_blend: Optional[str] = None
+        # Op calls queued while a batch is open (None when not batching)
+        self._pending: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+        self._pending_extra_time = 0.0
+        # Transforms recorded during a batch, flushed before the next call
+        self.scene_state = SceneState()
+        # Persistent worker process, started lazily on first use
+        self.use_worker = os.environ.get("BLENDER_MCP_PERSISTENT_WORKER", "1") != "0"
+        self._worker: Optional[BlenderWorker] = None
+        # Requests after which the worker is restarted on a saved copy of its scene (0: never)
+        self.worker_max_jobs = int(os.environ.get("BLENDER_MCP_WORKER_MAX_JOBS", "1000"))
+        # Serializes worker (re)starts between the warm-up thread and tool calls
+        self._worker_lock = threading.Lock()
+        # Extra workers for execute_parallel(), started on demand
+        self._pool: List[BlenderWorker] = []
+        self.max_workers = int(os.environ.get("BLENDER_MCP_WORKERS", os.cpu_count() or 1))
+        # Event loop thread running one-shot Blender processes for sync and async callers alike
+        self.loop_thread = AsyncLoopThread()
+        # Limits concurrent one-shot processes, created on loop_thread
+        self._async_slots: Optional[asyncio.Semaphore] = None
+        # One-shot processes currently running on loop_thread
+        self._processes: Set[asyncio.subprocess.Process] = set()
+        # Serializes in-process bpy runs, which share global state and redirect stdout
+        self._bpy_lock = threading.Lock()
+        self._exit_stack.callback(self.loop_thread.stop)
+        self._exit_stack.callback(self.shutdown_worker)
+        self._exit_stack.callback(self._kill_processes)
+        atexit.register(self.cleanup)
+        
+    @property
+    def in_process(self) -> bool:
+        """True when operations run against the in-process bpy module."""
+        return self._bpy is not None
+    
+    @property
+    def batch_open(self) -> bool:
+        """True between begin_batch() and commit() or cancel_batch()."""
+        return self._pending is not None
+    
+    def _load_bpy_module(self) -> Any:
+        """Import the bpy Python module for in-process execution.
+        
+        Set BLENDER_MCP_USE_BPY_MODULE=0 to force the Blender subprocess instead.
         
+        Returns:
+            The bpy module, or None if unavailable or disabled
+        """
+        if os.environ.get("BLENDER_MCP_USE_BPY_MODULE", "1") == "0":
+            return None
+        try:
+            import bpy
+        except ImportError:
+            return None
+        logger.info(f"Using in-process bpy module (Blender {bpy.app.version_string})")
+        return bpy
+    
     def _find_blender(self) -> str:
-        """Try to find Blender executable in common locations."""
+        """Try to find Blender executable in common locations.
+        
+        The result is cached on the class and in BLENDER_PATH_CACHE (per platform),
+        so later lookups and cold starts skip the search while the file is still executable.
+        """
+        cached = BlenderManager._blender_path_cache or self._read_blender_path_cache()
+        if cached and os.path.isfile(cached) and os.access(cached, os.X_OK):
+            BlenderManager._blender_path_cache = cached
+            return cached
+        
         common_paths = [
-            "blender",  # In PATH
             r"C:\Program Files\Blender Foundation\Blender 4.5\blender.exe",
             r"C:\Program Files\Blender Foundation\Blender 4.4\blender.exe",
             r"C:\Program Files\Blender Foundation\Blender 4.3\blender.exe",
@@ -40,120 +582,802 @@ class BlenderManager:
             "/Applications/Blender.app/Contents/MacOS/Blender"
         ]
         
-        for path in common_paths:
-            if os.path.exists(path) or subprocess.run(["where" if os.name == "nt" else "which", path], 
-                                                     capture_output=True).returncode == 0:
-                logger.info(f"Found Blender at: {path}")
-                return path
-                
-        raise RuntimeError("Blender executable not found. Please install Blender or provide the path.")
+        path = shutil.which("blender") or next((p for p in common_paths if os.path.isfile(p)), None)
+        if path is None:
+            raise RuntimeError("Blender executable not found. Please install Blender or provide the path.")
+        
+        logger.info(f"Found Blender at: {path}")
+        BlenderManager._blender_path_cache = path
+        self._write_blender_path_cache(path)
+        return path
+    
+    @staticmethod
+    def _read_blender_path_cache() -> Optional[str]:
+        """Return the Blender path cached on disk for this platform, if any."""
+        try:
+            with open(BLENDER_PATH_CACHE) as f:
+                return json.load(f).get(sys.platform)
+        except (OSError, ValueError, AttributeError):
+            return None
     
-    def execute_blender_script(self, script: str, blend_file: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _write_blender_path_cache(path: str):
+        """Store the Blender path for this platform in the on-disk cache."""
+        try:
+            try:
+                with open(BLENDER_PATH_CACHE) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+            cache[sys.platform] = path
+            with open(BLENDER_PATH_CACHE, "w") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.debug(f"Could not write Blender path cache: {e}")
+    
+    def startup_args(self) -> List[str]:
+        """Return the Blender arguments for a background process on an empty scene.
+        
+        The first call saves an empty factory scene to empty.blend in temp_dir; later
+        processes open that file instead of parsing factory startup and deleting the
+        default objects. Falls back to --factory-startup if the file cannot be made.
+        """
+        if self._empty_blend is None:
+            path = os.path.join(self.temp_dir, "empty.blend")
+            expr = ("import bpy; bpy.ops.wm.read_factory_settings(use_empty=True); "
+                    f"bpy.ops.wm.save_as_mainfile(filepath={path!r})")
+            try:
+                subprocess.run([self.blender_executable, "--background", "--factory-startup", "--python-expr", expr],
+                               capture_output=True, timeout=60)
+            except Exception as e:
+                logger.warning(f"Could not create empty scene template: {e}")
+            self._empty_blend = path if os.path.isfile(path) else ""
+        
+        if self._empty_blend:
+            return [self._empty_blend, "--background"]
+        return ["--background", "--factory-startup"]
+    
+    def execute_blender_script(self, script: str, blend_file: Optional[str] = None,
+                               timeout: Optional[float] = None) -> Dict[str, Any]:
         """Execute a Python script in Blender and return results.
         
         Args:
             script: Python script to execute in Blender
             blend_file: Optional .blend file to load
+            timeout: Seconds before Blender is killed (defaults to DEFAULT_TIMEOUT)
             
         Returns:
             Dictionary with execution results
         """
-        try:
-            # Create temporary script file
-            script_file = os.path.join(self.temp_dir, "temp_script.py")
-            with open(script_file, "w") as f:
-                f.write(script)
+        timeout = timeout or DEFAULT_TIMEOUT
+        if self._bpy is not None and not blend_file:
+            return self._execute_script_in_process(script)
+        
+        if not blend_file and self.ensure_worker():
+            response = self._worker.request({"command": "script", "code": script}, timeout=timeout)
+            return {
+                "success": response["success"],
+                "results": response.get("results", []),
+                "stdout": response.get("stdout", ""),
+                "stderr": response.get("traceback") or response.get("error", ""),
+                "returncode": response.get("returncode", 0 if response["success"] else 1)
+            }
+        
+        return self.loop_thread.run(self._run_script_process(script, blend_file, timeout))
+    
+    async def aexecute_blender_script(self, script: str, blend_file: Optional[str] = None,
+                                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Awaitable execute_blender_script() that does not block the event loop.
+        
+        One-shot Blender processes run on the manager's loop thread, at most max_workers
+        at a time. The in-process module and the persistent worker are a single Blender
+        instance, so those calls run in a thread and take turns.
+        
+        Args:
+            script: Python script to execute in Blender
+            blend_file: Optional .blend file to load
+            timeout: Seconds before Blender is killed (defaults to DEFAULT_TIMEOUT)
             
-            # Build Blender command
-            cmd = [self.blender_executable]
+        Returns:
+            Dictionary with execution results
+        """
+        # Worker startup blocks too, so anything that may use it goes to a thread
+        if (self._bpy is not None or (self.use_worker and self.blender_executable)) and not blend_file:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.execute_blender_script, script, blend_file, timeout)
+        
+        return await self.loop_thread.wrap(self._run_script_process(script, blend_file, timeout or DEFAULT_TIMEOUT))
+    
+    async def _run_script_process(self, script: str, blend_file: Optional[str], timeout: float) -> Dict[str, Any]:
+        """Run a script in a one-shot Blender process (on loop_thread), streaming its output."""
+        if self._async_slots is None:
+            self._async_slots = asyncio.Semaphore(self.max_workers)
+        async with self._async_slots:
+            try:
+                with tempfile.TemporaryDirectory(prefix="blender_mcp_call_", dir=self.temp_dir) as call_dir:
+                    cmd, results_path, stdin_data = self._script_command(script, blend_file, call_dir)
+                    started = time.monotonic()
+                    # Never inherit our stdin, which is the MCP channel when serving over stdio
+                    proc = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdin=asyncio.subprocess.PIPE if stdin_data else asyncio.subprocess.DEVNULL,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        limit=MAX_OUTPUT_LINE
+                    )
+                    self._processes.add(proc)
+                    tails = (collections.deque(maxlen=OUTPUT_TAIL_LINES), collections.deque(maxlen=OUTPUT_TAIL_LINES))
+                    try:
+                        await asyncio.wait_for(asyncio.gather(
+                            _feed_stdin(proc.stdin, stdin_data),
+                            _collect_tail_async(proc.stdout, tails[0]),
+                            _collect_tail_async(proc.stderr, tails[1]),
+                            proc.wait()
+                        ), timeout)
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                        await proc.wait()
+                        return {"success": False, "error": "Blender script execution timed out", "timeout": True}
+                    finally:
+                        self._processes.discard(proc)
+                    report = self._read_results_file(results_path)
+                _check_time_budget(started, timeout)
+                return self._script_result(proc.returncode, "".join(tails[0]), "".join(tails[1]), report)
+            except Exception as e:
+                logger.error(f"Error executing Blender script: {e}")
+                return {"success": False, "error": str(e)}
+    
+    def _script_command(self, script: str, blend_file: Optional[str],
+                        call_dir: str) -> Tuple[List[str], str, Optional[bytes]]:
+        """Build the Blender command line for a one-shot script run.
+        
+        Args:
+            script: Python script to execute in Blender
+            blend_file: Optional .blend file to load
+            call_dir: Per-call directory for the results file
             
-            if blend_file:
-                cmd.append(blend_file)
+        Returns:
+            (command, path of the results file the script writes, bytes to send to stdin or None)
+        """
+        cmd = [self.blender_executable]
+        
+        if blend_file:
+            cmd.append(blend_file)
+        else:
+            cmd.extend(self.startup_args())  # Run without UI, from an empty scene
+        
+        # Small scripts go on the command line; larger ones through stdin, never to disk
+        encoded = script.encode()
+        stdin_data = None
+        if len(encoded) < MAX_INLINE_SCRIPT_BYTES:
+            cmd.extend(["--python-expr", script])
+        else:
+            cmd.extend(["--python-expr", STDIN_SCRIPT_EXPR])
+            stdin_data = encoded
+        
+        # Results are written to a side file instead of being mixed into stdout
+        results_path = os.path.join(call_dir, "results.json")
+        cmd.extend(["--", "--results", results_path])
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing Blender command: %s", " ".join(cmd))
+        return cmd, results_path, stdin_data
+    
+    @staticmethod
+    def _script_result(returncode: int, stdout: str, stderr: str, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the execute_blender_script() result from a finished process."""
+        # stderr is only read by callers on failure
+        return {
+            "success": returncode == 0,
+            "results": report.get("results", []),
+            "stdout": stdout,
+            "stderr": stderr if returncode != 0 else "",
+            "returncode": returncode
+        }
+    
+    @staticmethod
+    def _read_results_file(path: str) -> Dict[str, Any]:
+        """Load a results file written by a Blender run.
+        
+        Returns:
+            The decoded record, or an empty dict if the run did not write one
+        """
+        try:
+            with open(path, "rb") as f:
+                return _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def _execute_script_in_process(self, script: str) -> Dict[str, Any]:
+        """Run a complete generated script against the in-process bpy module.
+        
+        The script's printed output is captured so it never reaches the MCP stdio channel,
+        and its report line is decoded into "results" like a worker reply.
+        """
+        import ops_library
+        
+        namespace = {"__name__": "blender_mcp_script"}
+        stdout = io.StringIO()
+        error = ""
+        try:
+            with self._bpy_lock, contextlib.redirect_stdout(stdout):
+                exec(ops_library.compile_source(script), namespace)
+                namespace["main"]()
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except SyntaxError:
+            # A Blender process reports a script that does not compile as a failed run
+            returncode = 1
+            error = traceback.format_exc()
+        
+        output, report = ops_library.split_report(stdout.getvalue())
+        return {
+            "success": returncode == 0,
+            "results": report.get("results", []),
+            "stdout": _tail_text(output),
+            "stderr": (error or report.get("traceback", "")) if returncode != 0 else "",
+            "returncode": returncode
+        }
+    
+    def _execute_calls_in_process(self, calls: List[Tuple[str, Dict[str, Any]]],
+                                  on_call: Optional[Callable[[int, List[Any]], None]] = None) -> Dict[str, Any]:
+        """Execute op calls directly against the in-process bpy module.
+        
+        Results are returned as Python objects instead of being marshalled through stdout.
+        """
+        import ops_library
+        
+        results: List[Any] = []
+        stdout = io.StringIO()
+        completed = 0
+        
+        def count_call(index: int, records: List[Any]):
+            nonlocal completed
+            completed = index + 1
+            if on_call is not None:
+                on_call(index, records)
+        
+        try:
+            with self._bpy_lock, contextlib.redirect_stdout(stdout):
+                ops_library.run_calls(calls, results, count_call)
+        except Exception as e:
+            logger.error(f"Error executing operations in-process: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "results": results,
+                "completed": completed,
+                "stdout": _tail_text(stdout.getvalue()),
+                "stderr": traceback.format_exc()
+            }
+        
+        return {"success": True, "results": results, "completed": completed,
+                "stdout": _tail_text(stdout.getvalue()), "stderr": ""}
+    
+    def ensure_worker(self) -> bool:
+        """Make sure the persistent Blender worker is running and responsive.
+        
+        Starts (or restarts after a crash) the worker and health-checks it with a ping.
+        After worker_max_jobs requests the worker is replaced by a fresh process that
+        opens a saved copy of its scene, bounding memory growth. If the worker cannot
+        be started it is disabled and callers fall back to one Blender subprocess per call.
+        
+        Returns:
+            True if the worker is available
+        """
+        if not self.use_worker or not self.blender_executable:
+            return False
+        with self._worker_lock:
+            if self._worker is not None and self._worker.alive():
+                if not self.worker_max_jobs or self._worker.jobs < self.worker_max_jobs:
+                    return True
+                startup_args = self._recycle_worker()
             else:
-                cmd.append("--background")  # Run without UI
-                cmd.append("--factory-startup")  # Start with clean scene
+                if self._worker is not None:
+                    logger.warning("Blender worker stopped, restarting")
+                startup_args = self.startup_args()
             
-            cmd.extend(["--python", script_file])
+            self._worker = BlenderWorker(self.blender_executable, startup_args)
+            response = self._worker.start()
+            if not response["success"]:
+                logger.warning(f"Persistent Blender worker unavailable, using one process per call: {response.get('error')}")
+                self.shutdown_worker()
+                self.use_worker = False
+                return False
+        
+        logger.info(f"Persistent Blender worker ready (Blender {response.get('blender_version')})")
+        # A fresh worker only has what was saved in its startup file, so cached data may be stale
+        self.scene_state.applied.clear()
+        _notify_scene_reset()
+        return True
+    
+    def _recycle_worker(self) -> List[str]:
+        """Save the worker's scene and stop it.
+        
+        Returns:
+            Startup arguments for a new worker that reopens the saved scene
+        """
+        path = os.path.join(self.temp_dir, "recycled.blend")
+        logger.info(f"Recycling Blender worker after {self._worker.jobs} requests")
+        response = self._worker.request({"op": "save_blend", "args": {"filepath": path}})
+        self._worker.shutdown()
+        if response["success"] and os.path.isfile(path):
+            return [path, "--background"]
+        logger.warning(f"Could not save the recycled worker's scene, starting empty: {response.get('error')}")
+        return self.startup_args()
+    
+    def warm_up(self) -> bool:
+        """Start the backend ahead of the first operation.
+        
+        Returns:
+            True if an in-process module or persistent worker is ready
+        """
+        return self._bpy is not None or self.ensure_worker()
+    
+    def ping(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Check that Blender runs, using the backend operations would use.
+        
+        With the persistent worker this is its startup handshake (or a ping if it
+        is already running); otherwise Blender is run once.
+        
+        Args:
+            timeout: Time budget in seconds (defaults to DEFAULT_TIMEOUT)
             
-            # Execute Blender
-            logger.info(f"Executing Blender command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        Returns:
+            Dictionary with "success" and, on success, "blender_version"
+        """
+        if self._bpy is not None:
+            return {"success": True, "blender_version": self._bpy.app.version_string}
+        timeout = timeout or DEFAULT_TIMEOUT
+        if self.ensure_worker():
+            return self._worker.request({"command": "ping"}, timeout=timeout)
+        return self._execute_request_subprocess({"command": "ping"}, timeout)
+    
+    def reset_scene(self) -> Dict[str, Any]:
+        """Delete all objects from the current scene (queued if a batch is open)."""
+        _notify_scene_reset()
+        return self.run_calls([("reset_scene", {})])
+    
+    def shutdown_worker(self):
+        """Stop the persistent worker and any pool workers."""
+        worker, self._worker = self._worker, None
+        pool, self._pool = self._pool, []
+        for w in ([worker] if worker else []) + pool:
+            w.shutdown()
+    
+    def begin_batch(self) -> bool:
+        """Start deferring operations until commit() is called.
+        
+        Returns:
+            True if a new batch was started, False if one was already open
+        """
+        if self._pending is not None:
+            return False
+        self._pending = []
+        self._pending_extra_time = 0.0
+        return True
+    
+    def cancel_batch(self):
+        """Drop all operations queued since begin_batch() without running them."""
+        self._pending = None
+        self.scene_state.drain()
+    
+    def run_operations(self, operations: List[str], timeout: Optional[float] = None,
+                       params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a list of generated operation lines, or queue them if a batch is open.
+        
+        Operations should read changing values from PARAMS["..."] instead of embedding
+        them as literals: identical source then hits the compiled code cache on every call.
+        
+        Args:
+            operations: List of Python operations to perform
+            timeout: Time budget in seconds (defaults to DEFAULT_TIMEOUT)
+            params: JSON-serializable values exposed to the operations as PARAMS
             
-            # Clean up temp script
-            os.remove(script_file)
+        Returns:
+            Dictionary with execution results (marked "deferred" when queued)
+        """
+        return self.run_calls([("exec_operations", {"code": "\n".join(operations), "params": params or {}})], timeout)
+    
+    def run_op(self, op_name: str, args: Dict[str, Any], timeout: Optional[float] = None,
+               clear_scene: bool = False) -> Dict[str, Any]:
+        """Run a single ops_library operation, or queue it if a batch is open.
+        
+        Args:
+            op_name: Name of the operation registered in ops_library
+            args: JSON-serializable arguments for the operation
+            timeout: Time budget in seconds (defaults to DEFAULT_TIMEOUT)
+            clear_scene: Delete all objects before running the operation
             
-            return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode
-            }
+        Returns:
+            Dictionary with execution results (marked "deferred" when queued)
+        """
+        calls = [("reset_scene", {})] if clear_scene else []
+        return self.run_calls(calls + [(op_name, args)], timeout)
+    
+    def run_calls(self, calls: List[Tuple[str, Dict[str, Any]]], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run a list of (op_name, args) calls, or queue them if a batch is open.
+        
+        Budgets above DEFAULT_TIMEOUT add their extra time to the batch's budget.
+        """
+        if self._pending is not None:
+            self._pending.extend(self.scene_state.drain())
+            self._pending.extend(calls)
+            self._pending_extra_time += max(0, (timeout or DEFAULT_TIMEOUT) - DEFAULT_TIMEOUT)
+            return {"success": True, "deferred": True}
+        return self.execute_calls(calls, timeout)
+    
+    def set_transform(self, object_name: str, attribute: str, value: List[float]) -> Dict[str, Any]:
+        """Set an object's location, scale or rotation_euler.
+        
+        While a batch is open the value is only recorded in scene_state, and consecutive
+        transforms are sent as a single set_transforms call.
+        
+        Args:
+            object_name: Name of the Blender object
+            attribute: "location", "scale" or "rotation_euler"
+            value: (x, y, z) values
             
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Blender script execution timed out",
-                "timeout": True
-            }
-        except Exception as e:
-            logger.error(f"Error executing Blender script: {e}")
+        Returns:
+            Dictionary with execution results (marked "deferred" when recorded)
+        """
+        if self._pending is None:
+            return self.execute_calls([("set_transforms", {"transforms": {object_name: {attribute: value}}})])
+        self.scene_state.set(object_name, attribute, value)
+        return {"success": True, "deferred": True}
+    
+    def flush_transforms(self) -> Dict[str, Any]:
+        """Queue the transforms recorded so far as one call in the open batch."""
+        if self._pending is not None:
+            self._pending.extend(self.scene_state.drain())
+        return {"success": True, "deferred": self._pending is not None}
+    
+    def execute_batch(self, ops_list: List[List[str]]) -> Dict[str, Any]:
+        """Execute several operation lists in a single Blender run.
+        
+        Args:
+            ops_list: Operation lists to concatenate, in execution order
+            
+        Returns:
+            Dictionary with execution results, including the "results" list
+        """
+        return self.execute_calls([("exec_operations", {"code": "\n".join(ops)}) for ops in ops_list])
+    
+    def execute_calls(self, calls: List[Tuple[str, Dict[str, Any]]],
+                      timeout: Optional[float] = None,
+                      on_call: Optional[Callable[[int, List[Any]], None]] = None) -> Dict[str, Any]:
+        """Execute ops_library calls in a single Blender run.
+        
+        The scene is not cleared first: the in-process module and the persistent worker
+        keep objects from earlier calls, while a one-shot process starts from empty.blend.
+        Include a ("reset_scene", {}) call to clear it explicitly.
+        
+        Args:
+            calls: (op_name, args) pairs, in execution order
+            timeout: Seconds before Blender is killed (defaults to DEFAULT_TIMEOUT)
+            on_call: Called as on_call(index, records) as each call completes, with the
+                records it appended. One-shot processes reply only at the end, so
+                there it is not called.
+            
+        Returns:
+            Dictionary with execution results, including the "results" list and
+            the number of calls "completed" before any failure. A single call that
+            would only set values its objects already have is not run and is
+            marked "skipped".
+        """
+        if len(calls) == 1 and self.scene_state.redundant(*calls[0]):
+            return self._skipped_result()
+        timeout = timeout or DEFAULT_TIMEOUT
+        started = time.monotonic()
+        if self._bpy is not None:
+            result = self._execute_calls_in_process(list(calls), on_call)
+            _check_time_budget(started, timeout)
+            self.scene_state.record(calls, result["success"])
+            return result
+        
+        if self.ensure_worker():
+            response = self._worker.request({"command": "run", "calls": list(calls)}, timeout=timeout, on_call=on_call)
+            self.scene_state.record(calls, response["success"])
+        else:
+            # One-shot processes start from empty.blend, so nothing carries over
+            self.scene_state.applied.clear()
+            response = self._execute_request_subprocess({"command": "run", "calls": list(calls)}, timeout)
+        _check_time_budget(started, timeout)
+        return self._calls_result(response)
+    
+    @staticmethod
+    def _skipped_result() -> Dict[str, Any]:
+        """Result of a call skipped because it would not change the scene."""
+        return {"success": True, "skipped": True, "results": [], "completed": 1, "stdout": "", "stderr": ""}
+    
+    @staticmethod
+    def _calls_result(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a worker reply into the result dictionary returned to tools."""
+        return {
+            "success": response["success"],
+            "results": response.get("results", []),
+            "completed": response.get("completed", 0),
+            "stdout": response.get("stdout", ""),
+            "stderr": response.get("traceback", response.get("error", "")) if not response["success"] else ""
+        }
+    
+    def rpc(self, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run a single {"op": name, "args": {...}} request.
+        
+        Outside a batch the request is written to the persistent worker as one JSON
+        frame; otherwise it is handled like run_op() (queued, in-process or one-shot).
+        
+        Args:
+            request: Operation name and JSON-serializable arguments
+            timeout: Time budget in seconds (defaults to DEFAULT_TIMEOUT)
+            
+        Returns:
+            Dictionary with execution results, including the "results" list
+        """
+        if self._pending is not None or self._bpy is not None or not self.ensure_worker():
+            return self.run_op(request["op"], request.get("args", {}), timeout)
+        
+        call = (request["op"], request.get("args", {}))
+        if self.scene_state.redundant(*call):
+            return self._skipped_result()
+        timeout = timeout or DEFAULT_TIMEOUT
+        started = time.monotonic()
+        response = self._worker.request(request, timeout=timeout)
+        self.scene_state.record([call], response["success"])
+        _check_time_budget(started, timeout)
+        return self._calls_result(response)
+    
+    def execute_parallel(self, call_groups: List[List[Tuple[str, Dict[str, Any]]]]) -> Dict[str, Any]:
+        """Execute independent groups of calls on several Blender workers at once.
+        
+        Up to max_workers pool workers take groups from a shared queue as they finish
+        their previous one, so a few slow groups do not hold up the rest. Each worker
+        starts from an empty scene and saves its result to a .blend file, which the
+        main worker appends to its own scene. Groups may only refer to objects they
+        create themselves. Falls back to execute_calls() when only one process is
+        available.
+        
+        Args:
+            call_groups: Lists of (op_name, args) pairs that do not depend on each other
+            
+        Returns:
+            Dictionary with execution results, including the combined "results" list
+        """
+        worker_count = min(len(call_groups), self.max_workers)
+        if worker_count < 2 or self._bpy is not None or not self.ensure_worker():
+            return self.execute_calls([call for group in call_groups for call in group])
+        
+        while len(self._pool) < worker_count:
+            self._pool.append(BlenderWorker(self.blender_executable, self.startup_args()))
+        # (group index, calls) jobs; deque.popleft() is atomic, so workers share it without a lock
+        jobs = collections.deque(enumerate(call_groups))
+        # Group index -> worker reply, so results keep the order of call_groups
+        replies: Dict[int, Dict[str, Any]] = {}
+        blend_paths = [os.path.join(self.temp_dir, f"pool_{index}.blend") for index in range(worker_count)]
+        
+        def drain(index: int) -> Dict[str, Any]:
+            worker = self._pool[index]
+            response = self._pool_request(worker, [("reset_scene", {})])
+            while response["success"]:
+                try:
+                    group_index, group = jobs.popleft()
+                except IndexError:
+                    return worker.request({"command": "run", "calls": [("save_blend", {"filepath": blend_paths[index]})]})
+                response = replies[group_index] = worker.request({"command": "run", "calls": list(group)})
+            # Leave the remaining groups unstarted
+            jobs.clear()
+            return response
+        
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            responses = list(executor.map(drain, range(worker_count)))
+        
+        for response in responses:
+            if not response["success"]:
+                return {
+                    "success": False,
+                    "results": response.get("results", []),
+                    "stdout": response.get("stdout", ""),
+                    "stderr": response.get("traceback", response.get("error", ""))
+                }
+        results: List[Any] = []
+        stdout = []
+        for group_index in sorted(replies):
+            results.extend(replies[group_index].get("results", []))
+            stdout.append(replies[group_index].get("stdout", ""))
+        
+        merged = self.execute_calls([("append_blend", {"filepath": path}) for path in blend_paths])
+        for path in blend_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        merged["results"] = results + merged["results"]
+        merged["stdout"] = "".join(stdout) + merged["stdout"]
+        return merged
+    
+    def _pool_request(self, worker: BlenderWorker, calls: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run calls on a pool worker, starting it first if needed."""
+        if not worker.alive():
+            response = worker.start()
+            if not response["success"]:
+                return response
+        return worker.request({"command": "run", "calls": calls})
+    
+    def _execute_request_subprocess(self, request: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+        """Run one worker request in a dedicated Blender process.
+        
+        The request is passed to blender_worker.py after "--", so no script file is written,
+        and the reply comes back through a results file rather than stdout.
+        """
+        with tempfile.TemporaryDirectory(prefix="blender_mcp_call_", dir=self.temp_dir) as call_dir:
+            reply_path = os.path.join(call_dir, "reply.json")
+            cmd = [self.blender_executable] + self.startup_args() + WORKER_ARGS + ["--", _dumps(request), reply_path]
+            try:
+                logger.debug("Executing Blender command for %d calls", len(request.get("calls", [])))
+                _, stdout, stderr = _run_captured(cmd, timeout)
+            except subprocess.TimeoutExpired:
+                return {"success": False, "error": "Blender script execution timed out", "timeout": True}
+            except Exception as e:
+                logger.error(f"Error executing Blender script: {e}")
+                return {"success": False, "error": str(e)}
+            
+            response = self._read_results_file(reply_path)
+        if not response:
             return {
                 "success": False,
-                "error": str(e)
+                "error": stderr or "Blender exited without a reply",
+                "stdout": stdout
             }
+        response["stdout"] = _tail_text(stdout + response.get("stdout", ""))
+        return response
+    
+    def commit(self, parallel: bool = False) -> Dict[str, Any]:
+        """Run all operations queued since begin_batch() in one Blender run.
+        
+        Args:
+            parallel: Run groups of calls on disjoint, newly created objects on
+                several workers with execute_parallel(); batches that cannot be
+                split that way still run in one Blender run
+        """
+        self.flush_transforms()
+        pending, self._pending = self._pending, None
+        if not pending:
+            return {"success": True, "results": []}
+        if parallel:
+            groups = independent_groups(pending)
+            if groups is not None and len(groups) > 1:
+                return self.execute_parallel(groups)
+        return self.execute_calls(pending, DEFAULT_TIMEOUT + self._pending_extra_time)
     
-    def create_basic_script(self, operations: List[str]) -> str:
+    def create_basic_script(self, operations: List[str], clear_scene: bool = False) -> str:
         """Create a basic Blender Python script with error handling.
         
         Args:
             operations: List of Python operations to perform
+            clear_scene: Delete all objects before running the operations
             
         Returns:
             Complete Python script string
         """
-        script_template = '''
-import bpy
-import bmesh
-import json
-import sys
-import traceback
-
-def main():
-    try:
-        # Clear existing mesh objects
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False, confirm=False)
-        
-        results = []
-        
-        {operations}
-        
-        # Success output
-        print("BLENDER_MCP_SUCCESS:", json.dumps({{"success": True, "results": results}}))
-        
-    except Exception as e:
-        error_info = {{
-            "success": False,
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }}
-        print("BLENDER_MCP_ERROR:", json.dumps(error_info))
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
+        if clear_scene:
+            operations = CLEAR_SCENE_OPERATIONS + operations
+        return self.create_basic_script_str(OPERATION_SEPARATOR.join(operations))
+    
+    @staticmethod
+    def create_basic_script_str(body: str) -> str:
+        """create_basic_script() for operations already joined with OPERATION_SEPARATOR.
         
-        operations_code = "\n        ".join(operations)
-        return script_template.format(operations=operations_code)
+        Args:
+            body: Joined operations
+            
+        Returns:
+            Complete Python script string
+        """
+        return SCRIPT_PREFIX + body + SCRIPT_SUFFIX
+    
+    def _kill_processes(self):
+        """Kill one-shot processes still running on loop_thread."""
+        for proc in list(self._processes):
+            # Scheduled on the loop, ahead of the stop() queued by the loop thread cleanup
+            self.loop_thread.loop.call_soon_threadsafe(proc.kill)
     
     def cleanup(self):
-        """Clean up temporary files."""
-        import shutil
+        """Stop all Blender processes and the loop thread and remove temporary files.
+        
+        Safe to call more than once; later calls do nothing.
+        """
         try:
-            shutil.rmtree(self.temp_dir)
+            self._exit_stack.close()
         except Exception as e:
-            logger.warning(f"Failed to clean up temp directory: {e}")
+            logger.warning(f"Failed to clean up Blender manager: {e}")
+
+# Global Blender manager instance, created on first use
+_instance: Optional[BlenderManager] = None
+
+def shutdown():
+    """Clean up the global manager, if it was created.
+    
+    The manager is dropped first, so a later get_blender_manager() call creates a
+    new one instead of returning the stopped manager.
+    """
+    global _instance
+    manager, _instance = _instance, None
+    if manager is not None:
+        manager.cleanup()
+
+def get_blender_manager() -> BlenderManager:
+    """Return the global Blender manager, creating it on first call."""
+    global _instance
+    if _instance is None:
+        _instance = BlenderManager()
+    return _instance
+
+def __getattr__(name: str) -> Any:
+    """Create the global manager lazily when blender_manager is accessed."""
+    if name == "blender_manager":
+        return get_blender_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def begin_batch() -> bool:
+    """Defer subsequent operations on the global manager until commit()."""
+    return get_blender_manager().begin_batch()
+
+def commit(parallel: bool = False) -> Dict[str, Any]:
+    """Run all deferred operations on the global manager in one Blender run."""
+    return get_blender_manager().commit(parallel)
 
-# Global Blender manager instance
-blender_manager = BlenderManager()
\ No newline at end of file
+def noop_result(action: str, object_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool result for a call that would not change its object.
+    
+    Only the check_object operation is run, so a no-op on a missing object
+    still fails like the real call would.
+    
+    Args:
+        action: Name of the tool
+        object_name: Name of the object the call targets
+        parameters: Parameters reported in the result
+    
+    Returns:
+        Dictionary with operation result, marked "skipped"
+    """
+    result = get_blender_manager().run_op("check_object", {"object_name": object_name})
+    return {
+        "success": result["success"],
+        "action": action,
+        "object_name": object_name,
+        "parameters": parameters,
+        "skipped": True,
+        "blender_output": result.get("stdout", ""),
+        "errors": result.get("stderr", "") if not result["success"] else None
+    }
+
+# Callbacks run when Blender data is reset (see on_scene_reset)
+_reset_callbacks: List[Callable[[], None]] = []
+
+def on_scene_reset(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback that drops client-side caches of Blender data.
+    
+    Called on reset_scene() and whenever a new persistent worker is started.
+    Can be used as a decorator.
+    """
+    _reset_callbacks.append(callback)
+    return callback
+
+def _notify_scene_reset():
+    """Run all registered scene reset callbacks."""
+    for callback in _reset_callbacks:
+        callback()
+
+async def run_async(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking tool function in a thread so the event loop stays responsive.
+    
+    Args:
+        func: Tool function such as materials.create_material
+        *args, **kwargs: Arguments for func
+        
+    Returns:
+        The function's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
\ No newline at end of file
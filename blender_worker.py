@@ -0,0 +1,151 @@
+"""
+Blender worker for the MCP server
+Runs inside Blender and executes JSON requests, either persistently from stdin
+(one request per line) or once from the arguments following "--":
+
+    blender empty.blend --background --python-expr "import sys; sys.path.insert(0, <dir>); import blender_worker; blender_worker.main()"
+    blender empty.blend --background --python-expr "import sys; sys.path.insert(0, <dir>); import blender_worker; blender_worker.main()" -- <request> <reply_path>
+
+where <dir> is the directory of this file (see WORKER_ARGS in blender_integration.py).
+"""
+import bpy
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import ops_library
+
+# orjson is used for framing when Blender's Python has it installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefix marking reply lines, so they can be told apart from Blender's own output
+REPLY_PREFIX = "BLENDER_MCP_REPLY:"
+
+# Prefix of the line written after each call of a streamed "run" request
+CALL_PREFIX = "BLENDER_MCP_CALL:"
+
+def run_calls(calls, stream=False):
+    """Execute a list of [op_name, args] calls against the current scene.
+    
+    The reply's "completed" is the number of calls that finished. With stream, a
+    CALL_PREFIX line with the call's index and records is written to stdout as each
+    call completes, ahead of the reply, and the reply's "results" only holds the
+    records not streamed yet (those of a failed call).
+    """
+    results = []
+    stdout = io.StringIO()
+    completed = 0
+    out = sys.stdout
+
+    def on_call(index, records):
+        nonlocal completed
+        completed = index + 1
+        if stream:
+            out.write(CALL_PREFIX + dumps({"index": index, "results": records}) + "\n")
+            out.flush()
+            # The parent keeps streamed records; drop them here instead of holding all of them
+            del results[:]
+
+    try:
+        with contextlib.redirect_stdout(stdout):
+            ops_library.run_calls(calls, results, on_call)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+            "results": results,
+            "completed": completed,
+            "stdout": stdout.getvalue()
+        }
+
+    return {"success": True, "results": results, "completed": completed, "stdout": stdout.getvalue()}
+
+def run_script(script):
+    """Execute a complete generated script as if it had been passed to --python.
+    
+    The script's report line is returned as the reply's "results" (and "error" and
+    "traceback" on failure) instead of being left in its output.
+    """
+    namespace = {"__name__": "__main__"}
+    stdout = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout):
+            exec(ops_library.compile_source(script), namespace)
+        returncode = 0
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else 1
+
+    output, report = ops_library.split_report(stdout.getvalue())
+    reply = {"success": returncode == 0, "returncode": returncode, "stdout": output,
+             "results": report.get("results", [])}
+    if returncode != 0:
+        reply["error"] = report.get("error", "")
+        reply["traceback"] = report.get("traceback", "")
+    return reply
+
+def handle_request(request):
+    """Dispatch a single decoded request."""
+    if "op" in request:
+        return run_calls([(request["op"], request.get("args", {}))])
+    command = request.get("command")
+    if command == "ping":
+        return {"success": True, "blender_version": bpy.app.version_string}
+    if command == "reset":
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        return {"success": True}
+    if command == "run":
+        return run_calls(request["calls"], request.get("stream", False))
+    if command == "script":
+        return run_script(request["code"])
+    return {"success": False, "error": f"Unknown command: {command}"}
+
+def dumps(data):
+    """Encode a reply as JSON, converting values JSON does not support to strings."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+def loads(line):
+    """Decode a JSON request."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def respond(line):
+    """Decode a request line and handle it."""
+    try:
+        return handle_request(loads(line))
+    except Exception as e:
+        return {"success": False, "error": str(e), "traceback": traceback.format_exc()}
+
+def reply(line):
+    """Handle a request line and write the prefixed reply to stdout."""
+    sys.stdout.write(REPLY_PREFIX + dumps(respond(line)) + "\n")
+    sys.stdout.flush()
+
+def main():
+    """Handle the request given after "--", or serve stdin until it is closed.
+    
+    A one-shot request writes its reply to the results file path following it.
+    """
+    if "--" in sys.argv:
+        request, reply_path = sys.argv[sys.argv.index("--") + 1:][:2]
+        with open(reply_path, "w") as f:
+            f.write(dumps(respond(request)))
+        return
+
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            reply(line)
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ Main entry point for the Blender MCP Server
 import sys
 import logging
 import asyncio
+import functools
+from types import ModuleType
+from typing import Any, Callable, Optional
+from async_loop import new_event_loop
 
 # Set up logging to go to stderr so it doesn't interfere with MCP stdio
 logging.basicConfig(
@@ -13,6 +17,29 @@ logging.basicConfig(
     stream=sys.stderr
 )
 
+# Event loop kept across main() calls, so re-entering the server reuses it
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the server's event loop, creating it on first use or after it was closed."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+@functools.lru_cache(maxsize=1)
+def _blender_integration() -> ModuleType:
+    """Import blender_integration on first use; later calls return the same module."""
+    import blender_integration
+    return blender_integration
+
+@functools.lru_cache(maxsize=1)
+def _server_main() -> Callable[[], Any]:
+    """Import the MCP server entry point on first use (not needed for --test)."""
+    from mcp_server import main as server_main
+    return server_main
+
 def main():
     """Main entry point to run the MCP server."""
     try:
@@ -21,11 +48,16 @@ def main():
         # Handle test mode
         if len(sys.argv) > 1 and sys.argv[1] == "--test":
             logger.info("Testing Blender MCP Server configuration...")
-            from blender_integration import blender_manager
+            integration = _blender_integration()
             try:
-                # Try to find Blender
-                blender_path = blender_manager._find_blender()
-                logger.info(f"Blender found at: {blender_path}")
+                # Start Blender the way the server would; the path lookup is cached on disk
+                manager = integration.get_blender_manager()
+                logger.info(f"Blender found at: {manager.blender_executable or 'bpy module'}")
+                logger.info(f"Blender path cache: {integration.BLENDER_PATH_CACHE}")
+                response = manager.ping()
+                if not response.get("success"):
+                    raise RuntimeError(response.get("error", "Blender did not respond"))
+                logger.info(f"Blender {response.get('blender_version')} is responding")
                 print("Server configuration test passed")
                 return
             except Exception as e:
@@ -34,8 +66,7 @@ def main():
                 sys.exit(1)
         
         # Import and run the MCP server
-        from mcp_server import main as server_main
-        asyncio.run(server_main())
+        _event_loop().run_until_complete(_server_main()())
         
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user")
@@ -43,6 +74,9 @@ def main():
     except Exception as e:
         logger.error(f"Server error: {e}")
         sys.exit(1)
+    finally:
+        # Stop Blender processes and remove temporary files before the interpreter exits
+        _blender_integration().shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
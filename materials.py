@@ -2,13 +2,159 @@
 Material and texture application system
 """
 from typing import Any, Dict, List, Optional, Tuple
+import functools
 import logging
-from blender_integration import blender_manager
+import re
+from blender_integration import get_blender_manager, on_scene_reset, run_async
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed in material names; Blender truncates names to 63 bytes
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.\- ]")
+MAX_NAME_LENGTH = 63
+
+def _clean(name: str) -> str:
+    """Strip unsupported characters from a material name and truncate it to Blender's limit."""
+    return _UNSAFE_NAME_CHARS.sub("", name)[:MAX_NAME_LENGTH]
+
+class MaterialResult:
+    """Result of a material tool call.
+    
+    Uses __slots__ instead of a per-instance dict. Call to_dict() where a plain
+    dictionary is needed (e.g. an MCP tool response); item access such as
+    result["success"] is supported for code written against the old dict results.
+    """
+    
+    __slots__ = ("success", "action", "object_name", "material_name", "properties",
+                 "parameters", "deferred", "blender_output", "errors")
+    
+    # Tool-specific fields, left out of to_dict() when not set
+    _OPTIONAL_FIELDS = ("object_name", "material_name", "properties", "parameters", "deferred")
+    
+    def __init__(self, success: bool, action: str, object_name: Optional[str] = None,
+                 material_name: Optional[str] = None, properties: Optional[Dict[str, Any]] = None,
+                 parameters: Optional[Dict[str, Any]] = None, deferred: Optional[bool] = None,
+                 blender_output: str = "", errors: Optional[str] = None):
+        """Initialize the result.
+        
+        Args:
+            success: Whether the Blender run succeeded
+            action: Action name reported to the caller
+            object_name: Object the tool acted on, if any
+            material_name: Material the tool created or applied, if any
+            properties: Material properties, for the creation tools
+            parameters: Texture parameters, for add_noise_texture
+            deferred: True when the call was queued in an open batch
+            blender_output: Captured Blender output
+            errors: Error output when the run failed
+        """
+        self.success = success
+        self.action = action
+        self.object_name = object_name
+        self.material_name = material_name
+        self.properties = properties
+        self.parameters = parameters
+        self.deferred = deferred
+        self.blender_output = blender_output
+        self.errors = errors
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a response dictionary."""
+        response = {"success": self.success, "action": self.action}
+        for field in self._OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                response[field] = value
+        response["blender_output"] = self.blender_output
+        response["errors"] = self.errors
+        return response
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__ or (key in self._OPTIONAL_FIELDS and getattr(self, key) is None):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get() over the to_dict() keys."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __repr__(self) -> str:
+        return f"MaterialResult({self.to_dict()!r})"
+
+def _resp(action: str, result: Dict[str, Any], **fields: Any) -> MaterialResult:
+    """Build a tool response from an execution result.
+    
+    Args:
+        action: Action name reported to the caller
+        result: Result of the Blender run
+        **fields: Tool-specific MaterialResult fields
+    
+    Returns:
+        MaterialResult for the call
+    """
+    return MaterialResult(
+        result["success"], action,
+        deferred=True if result.get("deferred") else None,
+        blender_output=result.get("stdout", ""),
+        errors=None if result["success"] else result.get("stderr", ""),
+        **fields
+    )
+
+class _Uncached(Exception):
+    """Carries a result that must not be cached (failed, or deferred to a batch)."""
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("stderr"))
+        self.result = result
+
+def _canonical(value: Any) -> Any:
+    """Round floats and turn sequences into tuples so equal parameters hash equally."""
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    return value
+
+@functools.lru_cache(maxsize=512)
+def _cached_create(kind: str, key: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Run a material-creating op once per distinct (kind, parameters) key."""
+    args = {k: list(v) if isinstance(v, tuple) else v for k, v in key}
+    result = get_blender_manager().rpc({"op": kind, "args": args})
+    if not result["success"] or result.get("deferred"):
+        raise _Uncached(result)
+    return result
+
+def _create(kind: str, **args: Any) -> Dict[str, Any]:
+    """Create a material, or return the earlier result for identical parameters.
+    
+    Inside an open batch the cache is bypassed, so every call is queued and
+    contributes its record to the batch's results.
+    
+    Args:
+        kind: Name of the material op in ops_library
+        **args: Op arguments
+    
+    Returns:
+        Dictionary with execution results
+    """
+    if get_blender_manager().batch_open:
+        return get_blender_manager().rpc({"op": kind, "args": args})
+    key = tuple((k, _canonical(v)) for k, v in args.items())
+    try:
+        return dict(_cached_create(kind, key))
+    except _Uncached as e:
+        return e.result
+
+@on_scene_reset
+def clear_material_cache():
+    """Forget created materials so the next identical request creates them again."""
+    _cached_create.cache_clear()
+
 def create_material(name: str, base_color: Tuple[float, float, float, float] = (0.8, 0.2, 0.2, 1.0), 
-                   metallic: float = 0.0, roughness: float = 0.5, emission_strength: float = 0.0) -> Dict[str, Any]:
+                   metallic: float = 0.0, roughness: float = 0.5, emission_strength: float = 0.0) -> MaterialResult:
     """Create a new material with basic properties.
     
     Args:
@@ -19,37 +165,24 @@ def create_material(name: str, base_color: Tuple[float, float, float, float] = (
         emission_strength: Emission strength
     
     Returns:
-        Dictionary with creation result
+        MaterialResult describing the created material
     """
-    operations = [
-        f'mat = bpy.data.materials.new(name="{name}")',
-        f'mat.use_nodes = True',
-        f'bsdf = mat.node_tree.nodes["Principled BSDF"]',
-        f'bsdf.inputs["Base Color"].default_value = {base_color}',
-        f'bsdf.inputs["Metallic"].default_value = {metallic}',
-        f'bsdf.inputs["Roughness"].default_value = {roughness}',
-        f'bsdf.inputs["Emission Strength"].default_value = {emission_strength}',
-        f'results.append({{"action": "create_material", "material": "{name}", "base_color": {base_color}, "metallic": {metallic}, "roughness": {roughness}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "create_material",
-        "material_name": name,
-        "properties": {
+    name = _clean(name)
+    result = _create("create_material", name=name, base_color=base_color, metallic=metallic,
+                     roughness=roughness, emission_strength=emission_strength)
+    
+    return _resp(
+        "create_material", result,
+        material_name=name,
+        properties={
             "base_color": base_color,
             "metallic": metallic,
             "roughness": roughness,
             "emission_strength": emission_strength
-        },
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+        }
+    )
 
-def apply_material_to_object(object_name: str, material_name: str) -> Dict[str, Any]:
+def apply_material_to_object(object_name: str, material_name: str) -> MaterialResult:
     """Apply a material to an object.
     
     Args:
@@ -57,32 +190,53 @@ def apply_material_to_object(object_name: str, material_name: str) -> Dict[str,
         material_name: Name of the material to apply
     
     Returns:
-        Dictionary with operation result
+        MaterialResult describing the operation
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'mat = bpy.data.materials["{material_name}"]',
-        f'if obj.data.materials:',
-        f'    obj.data.materials[0] = mat',
-        f'else:',
-        f'    obj.data.materials.append(mat)',
-        f'results.append({{"action": "apply_material", "object": "{object_name}", "material": "{material_name}"}})' 
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "apply_material",
-        "object_name": object_name,
-        "material_name": material_name,
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    material_name = _clean(material_name)
+    result = get_blender_manager().rpc({"op": "apply_material_to_object", "args": {"object_name": object_name, "material_name": material_name}})
+    
+    return _resp("apply_material", result, object_name=object_name, material_name=material_name)
+
+def create_and_apply_material(object_name: str, name: str,
+                              base_color: Tuple[float, float, float, float] = (0.8, 0.2, 0.2, 1.0),
+                              metallic: float = 0.0, roughness: float = 0.5,
+                              emission_strength: float = 0.0) -> MaterialResult:
+    """Create a material and apply it to an object in a single Blender run.
+    
+    Equivalent to create_material() followed by apply_material_to_object(), but
+    the new material is assigned directly, even if Blender had to rename it.
+    
+    Args:
+        object_name: Name of the object
+        name: Name for the material
+        base_color: RGBA color values (0.0-1.0)
+        metallic: Metallic factor (0.0-1.0)
+        roughness: Roughness factor (0.0-1.0)
+        emission_strength: Emission strength
+    
+    Returns:
+        MaterialResult describing the operation
+    """
+    name = _clean(name)
+    result = get_blender_manager().rpc({"op": "create_and_apply_material", "args": {
+        "object_name": object_name, "name": name, "base_color": list(base_color),
+        "metallic": metallic, "roughness": roughness, "emission_strength": emission_strength
+    }})
+    
+    return _resp(
+        "create_and_apply_material", result,
+        object_name=object_name,
+        material_name=name,
+        properties={
+            "base_color": base_color,
+            "metallic": metallic,
+            "roughness": roughness,
+            "emission_strength": emission_strength
+        }
+    )
 
 def create_glass_material(name: str, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), 
-                         ior: float = 1.45, transmission: float = 1.0) -> Dict[str, Any]:
+                         ior: float = 1.45, transmission: float = 1.0) -> MaterialResult:
     """Create a glass material.
     
     Args:
@@ -92,36 +246,19 @@ def create_glass_material(name: str, color: Tuple[float, float, float, float] =
         transmission: Transmission factor
     
     Returns:
-        Dictionary with creation result
+        MaterialResult describing the created material
     """
-    operations = [
-        f'mat = bpy.data.materials.new(name="{name}")',
-        f'mat.use_nodes = True',
-        f'bsdf = mat.node_tree.nodes["Principled BSDF"]',
-        f'bsdf.inputs["Base Color"].default_value = {color}',
-        f'bsdf.inputs["Metallic"].default_value = 0.0',
-        f'bsdf.inputs["Roughness"].default_value = 0.0',
-        f'bsdf.inputs["IOR"].default_value = {ior}',
-        f'bsdf.inputs["Transmission"].default_value = {transmission}',
-        f'bsdf.inputs["Alpha"].default_value = 0.1',
-        f'mat.blend_method = "BLEND"',
-        f'results.append({{"action": "create_glass_material", "material": "{name}", "ior": {ior}, "transmission": {transmission}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "create_glass_material",
-        "material_name": name,
-        "properties": {"color": color, "ior": ior, "transmission": transmission},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    name = _clean(name)
+    result = _create("create_glass_material", name=name, color=color, ior=ior, transmission=transmission)
+    
+    return _resp(
+        "create_glass_material", result,
+        material_name=name,
+        properties={"color": color, "ior": ior, "transmission": transmission}
+    )
 
 def create_metal_material(name: str, color: Tuple[float, float, float, float] = (0.7, 0.7, 0.7, 1.0),
-                         roughness: float = 0.2) -> Dict[str, Any]:
+                         roughness: float = 0.2) -> MaterialResult:
     """Create a metallic material.
     
     Args:
@@ -130,32 +267,19 @@ def create_metal_material(name: str, color: Tuple[float, float, float, float] =
         roughness: Surface roughness
     
     Returns:
-        Dictionary with creation result
+        MaterialResult describing the created material
     """
-    operations = [
-        f'mat = bpy.data.materials.new(name="{name}")',
-        f'mat.use_nodes = True',
-        f'bsdf = mat.node_tree.nodes["Principled BSDF"]',
-        f'bsdf.inputs["Base Color"].default_value = {color}',
-        f'bsdf.inputs["Metallic"].default_value = 1.0',
-        f'bsdf.inputs["Roughness"].default_value = {roughness}',
-        f'results.append({{"action": "create_metal_material", "material": "{name}", "color": {color}, "roughness": {roughness}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "create_metal_material",
-        "material_name": name,
-        "properties": {"color": color, "roughness": roughness},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    name = _clean(name)
+    result = _create("create_metal_material", name=name, color=color, roughness=roughness)
+    
+    return _resp(
+        "create_metal_material", result,
+        material_name=name,
+        properties={"color": color, "roughness": roughness}
+    )
 
 def create_emission_material(name: str, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0),
-                           strength: float = 5.0) -> Dict[str, Any]:
+                           strength: float = 5.0) -> MaterialResult:
     """Create an emissive/glowing material.
     
     Args:
@@ -164,32 +288,19 @@ def create_emission_material(name: str, color: Tuple[float, float, float, float]
         strength: Emission strength
     
     Returns:
-        Dictionary with creation result
+        MaterialResult describing the created material
     """
-    operations = [
-        f'mat = bpy.data.materials.new(name="{name}")',
-        f'mat.use_nodes = True',
-        f'bsdf = mat.node_tree.nodes["Principled BSDF"]',
-        f'bsdf.inputs["Base Color"].default_value = {color}',
-        f'bsdf.inputs["Emission"].default_value = {color}',
-        f'bsdf.inputs["Emission Strength"].default_value = {strength}',
-        f'results.append({{"action": "create_emission_material", "material": "{name}", "color": {color}, "strength": {strength}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "create_emission_material",
-        "material_name": name,
-        "properties": {"color": color, "strength": strength},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    name = _clean(name)
+    result = _create("create_emission_material", name=name, color=color, strength=strength)
+    
+    return _resp(
+        "create_emission_material", result,
+        material_name=name,
+        properties={"color": color, "strength": strength}
+    )
 
 def add_noise_texture(object_name: str, scale: float = 5.0, detail: float = 2.0, 
-                     roughness: float = 0.5, distortion: float = 0.0) -> Dict[str, Any]:
+                     roughness: float = 0.5, distortion: float = 0.0) -> MaterialResult:
     """Add procedural noise texture to an object's material.
     
     Args:
@@ -200,68 +311,100 @@ def add_noise_texture(object_name: str, scale: float = 5.0, detail: float = 2.0,
         distortion: Distortion amount
     
     Returns:
-        Dictionary with operation result
+        MaterialResult describing the operation
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'if not obj.data.materials:',
-        f'    mat = bpy.data.materials.new(name="{object_name}_Material")',
-        f'    mat.use_nodes = True',
-        f'    obj.data.materials.append(mat)',
-        f'else:',
-        f'    mat = obj.data.materials[0]',
-        f'    if not mat.use_nodes:',
-        f'        mat.use_nodes = True',
-        f'nodes = mat.node_tree.nodes',
-        f'links = mat.node_tree.links',
-        f'bsdf = nodes["Principled BSDF"]',
-        f'noise_tex = nodes.new(type="ShaderNodeTexNoise")',
-        f'noise_tex.inputs["Scale"].default_value = {scale}',
-        f'noise_tex.inputs["Detail"].default_value = {detail}',
-        f'noise_tex.inputs["Roughness"].default_value = {roughness}',
-        f'noise_tex.inputs["Distortion"].default_value = {distortion}',
-        f'links.new(noise_tex.outputs["Fac"], bsdf.inputs["Base Color"])',
-        f'results.append({{"action": "add_noise_texture", "object": "{object_name}", "scale": {scale}, "detail": {detail}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_noise_texture",
-        "object_name": object_name,
-        "parameters": {"scale": scale, "detail": detail, "roughness": roughness, "distortion": distortion},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    result = get_blender_manager().rpc({"op": "add_noise_texture", "args": {
+        "object_name": object_name, "scale": scale, "detail": detail,
+        "roughness": roughness, "distortion": distortion
+    }})
+    
+    return _resp(
+        "add_noise_texture", result,
+        object_name=object_name,
+        parameters={"scale": scale, "detail": detail, "roughness": roughness, "distortion": distortion}
+    )
 
-def add_uv_mapping(object_name: str) -> Dict[str, Any]:
+def add_uv_mapping(object_name: str) -> MaterialResult:
     """Add UV mapping to an object.
     
     Args:
         object_name: Name of the object
     
     Returns:
-        Dictionary with operation result
+        MaterialResult describing the operation
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.select_all(action="SELECT")',
-        f'bpy.ops.uv.unwrap(method="ANGLE_BASED", margin=0.001)',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "add_uv_mapping", "object": "{object_name}"}})' 
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_uv_mapping",
-        "object_name": object_name,
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
\ No newline at end of file
+    result = get_blender_manager().rpc({"op": "add_uv_mapping", "args": {"object_name": object_name}})
+    
+    return _resp("add_uv_mapping", result, object_name=object_name)
+
+class MaterialBatch:
+    """Run all material tool calls made inside a with-block in one Blender run.
+    
+    The tool functions return immediately (marked "deferred"); on exit the queued
+    operations are executed together and each call's result record is available
+    in call_results, in call order. Nested inside another open batch, the calls
+    simply join that batch.
+    
+    Example:
+        with MaterialBatch() as batch:
+            create_metal_material("Steel")
+            apply_material_to_object("Cube", "Steel")
+        batch.result["success"]
+    """
+    
+    def __init__(self):
+        """Initialize an empty batch."""
+        self.result: Optional[Dict[str, Any]] = None
+        self.call_results: List[Any] = []
+        self._owner = False
+    
+    def __enter__(self) -> "MaterialBatch":
+        self._owner = get_blender_manager().begin_batch()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if not self._owner:
+            return False
+        if exc_type is not None:
+            get_blender_manager().cancel_batch()
+            return False
+        self.result = get_blender_manager().commit()
+        # Every material operation appends exactly one record to results
+        self.call_results = self.result.get("results", [])
+        return False
+
+# ===== ASYNC VARIANTS =====
+# Awaitable wrappers that keep the event loop free while Blender runs, so several
+# material operations can be awaited together with asyncio.gather().
+
+async def acreate_material(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable create_material()."""
+    return await run_async(create_material, *args, **kwargs)
+
+async def acreate_and_apply_material(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable create_and_apply_material()."""
+    return await run_async(create_and_apply_material, *args, **kwargs)
+
+async def aapply_material_to_object(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable apply_material_to_object()."""
+    return await run_async(apply_material_to_object, *args, **kwargs)
+
+async def acreate_glass_material(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable create_glass_material()."""
+    return await run_async(create_glass_material, *args, **kwargs)
+
+async def acreate_metal_material(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable create_metal_material()."""
+    return await run_async(create_metal_material, *args, **kwargs)
+
+async def acreate_emission_material(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable create_emission_material()."""
+    return await run_async(create_emission_material, *args, **kwargs)
+
+async def aadd_noise_texture(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable add_noise_texture()."""
+    return await run_async(add_noise_texture, *args, **kwargs)
+
+async def aadd_uv_mapping(*args: Any, **kwargs: Any) -> MaterialResult:
+    """Awaitable add_uv_mapping()."""
+    return await run_async(add_uv_mapping, *args, **kwargs)
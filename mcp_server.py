@@ -4,12 +4,23 @@ Blender MCP Server - Provides 3D model generation capabilities through Blender P
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.types import Tool, TextContent
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
 import logging
 import os
+import re
 import sys
-import json
 import asyncio
+import collections
+import functools
+import json
+from async_loop import new_event_loop
+from blender_integration import get_blender_manager, on_scene_reset, run_async
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging to stderr to avoid interfering with stdio
 logging.basicConfig(
@@ -22,533 +33,575 @@ logger = logging.getLogger(__name__)
 # Create MCP server instance
 server = Server("blender-mcp-server")
 
+def _json(data: Any) -> str:
+    """Encode a tool response as compact JSON, using orjson when it is installed.
+    
+    Values JSON cannot represent are converted with str().
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+class ToolResponse:
+    """Response of a Blender-backed tool call.
+    
+    Uses __slots__ instead of a per-instance dict; to_json() encodes it straight to
+    the response text without an intermediate response dict per handler.
+    """
+    
+    __slots__ = ("success", "action", "object_name", "object_type", "parameters",
+                 "filepath", "format", "blender_output", "errors")
+    
+    # Tool-specific fields, left out of the response when not set
+    _OPTIONAL_FIELDS = ("action", "object_name", "object_type", "parameters", "filepath", "format")
+    
+    def __init__(self, success: bool, action: Optional[str] = None, object_name: Optional[str] = None,
+                 object_type: Optional[str] = None, parameters: Optional[Dict[str, Any]] = None,
+                 filepath: Optional[str] = None, format: Optional[str] = None,
+                 blender_output: str = "", errors: Optional[str] = None):
+        """Initialize the response.
+        
+        Args:
+            success: Whether the Blender run succeeded
+            action: Action name, for scene and file tools
+            object_name: Name of the created object, for primitive tools
+            object_type: Primitive type, for primitive tools
+            parameters: Parameters the object was created with, for primitive tools
+            filepath: Written file, for save and export tools
+            format: Export format, for export_model
+            blender_output: Captured Blender output
+            errors: Error output when the run failed
+        """
+        self.success = success
+        self.action = action
+        self.object_name = object_name
+        self.object_type = object_type
+        self.parameters = parameters
+        self.filepath = filepath
+        self.format = format
+        self.blender_output = blender_output
+        self.errors = errors
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any], **fields: Any) -> "ToolResponse":
+        """Build a response from an execution result and tool-specific fields."""
+        return cls(
+            result["success"],
+            blender_output=result.get("stdout", ""),
+            errors=None if result["success"] else result.get("stderr", ""),
+            **fields
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the response as a dictionary."""
+        response = {"success": self.success}
+        for field in self._OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                response[field] = value
+        response["blender_output"] = self.blender_output
+        response["errors"] = self.errors
+        return response
+    
+    def to_json(self) -> str:
+        """Encode the response as compact JSON text."""
+        return _json(self.to_dict())
+    
+    def __repr__(self) -> str:
+        return f"ToolResponse({self.to_dict()!r})"
+
+# Primitive creations submitted within BATCH_WINDOW_MS of each other run as one Blender request
+BATCH_SIZE = int(os.environ.get("BLENDER_MCP_BATCH_SIZE", "32"))
+BATCH_WINDOW_MS = float(os.environ.get("BLENDER_MCP_BATCH_WINDOW_MS", "10"))
+
+class OperationBatcher:
+    """Coalesces ops_library calls submitted close together into a single Blender run."""
+    
+    def __init__(self, batch_size: int = BATCH_SIZE, window_ms: float = BATCH_WINDOW_MS):
+        """Initialize the batcher; its queue and drain task start on first submit().
+        
+        Args:
+            batch_size: Maximum number of submissions combined into one run
+            window_ms: How long to wait for further submissions after the first one
+        """
+        self.batch_size = max(1, batch_size)
+        self.window = max(0.0, window_ms) / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, calls: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Queue calls and wait for the combined run that executes them.
+        
+        Args:
+            calls: (op_name, args) pairs for BlenderManager.execute_calls()
+        
+        Returns:
+            Result of the combined execute_calls() call
+        """
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.ensure_future(self._drain())
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((calls, future))
+        return await future
+    
+    async def _collect(self) -> List[Tuple[List[Tuple[str, Dict[str, Any]]], "asyncio.Future[Dict[str, Any]]"]]:
+        """Wait for a submission, then gather others arriving within the window."""
+        loop = asyncio.get_event_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.window
+        while len(batch) < self.batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _drain(self):
+        """Run queued submissions batch by batch for the lifetime of the event loop.
+        
+        A submission is answered as soon as its last call completes, with the records
+        of its own calls; submissions not completed by then get the combined result.
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = await self._collect()
+            calls = [call for submitted, _ in batch for call in submitted]
+            # Index of the last call of each submission -> (its first call index, future)
+            last_calls: Dict[int, Tuple[int, "asyncio.Future[Dict[str, Any]]"]] = {}
+            start = 0
+            for submitted, future in batch:
+                if submitted:
+                    last_calls[start + len(submitted) - 1] = (start, future)
+                start += len(submitted)
+            records: List[Any] = []
+            # Call index -> position of its first record in records
+            offsets: Dict[int, int] = {}
+            
+            def on_call(index: int, call_records: List[Any]):
+                # Runs in the executor thread while the batch is still executing
+                offsets[index] = len(records)
+                records.extend(call_records)
+                if index in last_calls:
+                    first, future = last_calls[index]
+                    result = {"success": True, "results": records[offsets[first]:], "stdout": "", "stderr": ""}
+                    loop.call_soon_threadsafe(_resolve, future, result)
+            
+            logger.debug("Running %d batched submission(s) as one request", len(batch))
+            try:
+                result = await run_async(get_blender_manager().execute_calls, calls, on_call=on_call)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+
+def _resolve(future: "asyncio.Future[Dict[str, Any]]", result: Dict[str, Any]):
+    """Set a submission's result unless it was already answered or cancelled."""
+    if not future.done():
+        future.set_result(result)
+
+primitive_batcher = OperationBatcher()
+
 # Tool definitions
+# Responses of the informational tools never change, so they are serialized once.
+# Tool responses are read by MCP clients, so all of them use compact JSON.
+_SERVER_INFO_TEXT = _json({
+    "name": "Blender MCP Server",
+    "version": "1.0.0",
+    "description": "MCP server for 3D model generation using Blender",
+    "capabilities": [
+        "create_primitive_objects",
+        "modify_meshes", 
+        "apply_materials",
+        "scene_management",
+        "file_operations"
+    ]
+})
+
+_TOOL_NAMES_TEXT = _json([
+    "create_cube",
+    "create_sphere", 
+    "create_cylinder",
+    "create_plane",
+    "create_cone",
+    "save_blend_file",
+    "export_model",
+    "clear_scene",
+    "get_server_info",
+    "list_available_tools"
+])
+
 async def handle_get_server_info(arguments: dict) -> List[TextContent]:
     """Get information about the Blender MCP server capabilities."""
-    from blender_integration import blender_manager
-    
-    result = {
-        "name": "Blender MCP Server",
-        "version": "1.0.0",
-        "description": "MCP server for 3D model generation using Blender",
-        "capabilities": [
-            "create_primitive_objects",
-            "modify_meshes", 
-            "apply_materials",
-            "scene_management",
-            "file_operations"
-        ]
-    }
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [TextContent(type="text", text=_SERVER_INFO_TEXT)]
 
 async def handle_list_available_tools(arguments: dict) -> List[TextContent]:
     """List all available 3D modeling tools."""
-    tools = [
-        "create_cube",
-        "create_sphere", 
-        "create_cylinder",
-        "create_plane",
-        "create_cone",
-        "save_blend_file",
-        "export_model",
-        "clear_scene",
-        "get_server_info",
-        "list_available_tools"
-    ]
-    return [TextContent(type="text", text=json.dumps(tools, indent=2))]
+    return [TextContent(type="text", text=_TOOL_NAMES_TEXT)]
 
-async def handle_create_cube(arguments: dict) -> List[TextContent]:
-    """Create a cube in the Blender scene."""
-    from blender_integration import blender_manager
-    
-    size = arguments.get("size", 2.0)
-    location = arguments.get("location", [0, 0, 0])
-    name = arguments.get("name", "Cube")
-    
-    operations = [
-        f'bpy.ops.mesh.primitive_cube_add(size={size}, location={tuple(location)})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cube", "size": {size}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "object_name": name,
-        "object_type": "cube",
-        "parameters": {"size": size, "location": location},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
-    
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+# Primitive tools (create_<kind>): tool description, bpy.ops.mesh operator and numeric
+# parameters as (name, description, default). Their handlers and schemas are built from this table.
+PRIMITIVES = {
+    "cube": ("Create a cube in the Blender scene", "primitive_cube_add", [
+        ("size", "Size of the cube", 2.0)
+    ]),
+    "sphere": ("Create a UV sphere in the Blender scene", "primitive_uv_sphere_add", [
+        ("radius", "Radius of the sphere", 1.0)
+    ]),
+    "cylinder": ("Create a cylinder in the Blender scene", "primitive_cylinder_add", [
+        ("radius", "Radius of the cylinder", 1.0),
+        ("depth", "Height/depth of the cylinder", 2.0)
+    ]),
+    "plane": ("Create a plane in the Blender scene", "primitive_plane_add", [
+        ("size", "Size of the plane", 2.0)
+    ]),
+    "cone": ("Create a cone in the Blender scene", "primitive_cone_add", [
+        ("radius1", "Bottom radius of the cone", 1.0),
+        ("radius2", "Top radius of the cone (0 for pointed)", 0.0),
+        ("depth", "Height of the cone", 2.0)
+    ])
+}
 
-async def handle_create_sphere(arguments: dict) -> List[TextContent]:
-    """Create a UV sphere in the Blender scene."""
-    from blender_integration import blender_manager
-    
-    radius = arguments.get("radius", 1.0)
-    location = arguments.get("location", [0, 0, 0])
-    name = arguments.get("name", "Sphere")
-    
-    operations = [
-        f'bpy.ops.mesh.primitive_uv_sphere_add(radius={radius}, location={tuple(location)})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "sphere", "radius": {radius}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "object_name": name,
-        "object_type": "sphere",
-        "parameters": {"radius": radius, "location": location},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
-    
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+# Responses of successful primitive creations, keyed by their JSON-encoded call
+PRIMITIVE_CACHE_SIZE = 256
+_primitive_cache: "collections.OrderedDict[str, str]" = collections.OrderedDict()
 
-async def handle_create_cylinder(arguments: dict) -> List[TextContent]:
-    """Create a cylinder in the Blender scene."""
-    from blender_integration import blender_manager
-    
-    radius = arguments.get("radius", 1.0)
-    depth = arguments.get("depth", 2.0)
-    location = arguments.get("location", [0, 0, 0])
-    name = arguments.get("name", "Cylinder")
-    
-    operations = [
-        f'bpy.ops.mesh.primitive_cylinder_add(radius={radius}, depth={depth}, location={tuple(location)})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cylinder", "radius": {radius}, "depth": {depth}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "object_name": name,
-        "object_type": "cylinder", 
-        "parameters": {"radius": radius, "depth": depth, "location": location},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
-    
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+# Responses of primitive creations still running, keyed like _primitive_cache
+_primitive_inflight: "Dict[str, asyncio.Future[str]]" = {}
 
-async def handle_create_plane(arguments: dict) -> List[TextContent]:
-    """Create a plane in the Blender scene."""
-    from blender_integration import blender_manager
-    
-    size = arguments.get("size", 2.0)
-    location = arguments.get("location", [0, 0, 0])
-    name = arguments.get("name", "Plane")
-    
-    operations = [
-        f'bpy.ops.mesh.primitive_plane_add(size={size}, location={tuple(location)})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "plane", "size": {size}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "object_name": name,
-        "object_type": "plane",
-        "parameters": {"size": size, "location": location},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
-    
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+@on_scene_reset
+def clear_primitive_cache():
+    """Forget created primitives so the next identical request creates them again."""
+    _primitive_cache.clear()
 
-async def handle_create_cone(arguments: dict) -> List[TextContent]:
-    """Create a cone in the Blender scene."""
-    from blender_integration import blender_manager
-    
-    radius1 = arguments.get("radius1", 1.0)
-    radius2 = arguments.get("radius2", 0.0)
-    depth = arguments.get("depth", 2.0)
-    location = arguments.get("location", [0, 0, 0])
-    name = arguments.get("name", "Cone")
-    
-    operations = [
-        f'bpy.ops.mesh.primitive_cone_add(radius1={radius1}, radius2={radius2}, depth={depth}, location={tuple(location)})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cone", "radius1": {radius1}, "radius2": {radius2}, "depth": {depth}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "object_name": name,
-        "object_type": "cone",
-        "parameters": {"radius1": radius1, "radius2": radius2, "depth": depth, "location": location},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
+def _make_primitive_handler(kind: str, operator: str,
+                            params: List[Tuple[str, str, float]]) -> Callable[[dict], Awaitable[List[TextContent]]]:
+    """Build the create_<kind> tool handler.
+    
+    The handler sends a create_primitive call to ops_library instead of generating a
+    script, so the worker runs precompiled code and only the arguments cross the pipe.
+    
+    Args:
+        kind: Primitive type, e.g. "cube"
+        operator: bpy.ops.mesh operator that adds the primitive
+        params: Numeric parameters as (name, description, default)
+    
+    Returns:
+        Coroutine function taking the tool arguments
+    """
+    defaults = tuple((param, default) for param, _, default in params)
+    default_name = kind.capitalize()
+    
+    async def handle_create_primitive(arguments: dict) -> List[TextContent]:
+        parameters = {param: arguments.get(param, default) for param, default in defaults}
+        location = arguments.get("location", [0, 0, 0])
+        name = arguments.get("name", default_name)
+        
+        call = ("create_primitive", {"kind": kind, "operator": operator, "params": parameters,
+                                     "location": location, "name": name})
+        key = _json(call)
+        while True:
+            cached = _primitive_cache.get(key)
+            if cached is not None:
+                # The same object was already created; reuse it unless something removed it since
+                check = await run_async(get_blender_manager().run_op, "check_object", {"object_name": name})
+                if check["success"]:
+                    _primitive_cache.move_to_end(key)
+                    return [TextContent(type="text", text=cached)]
+                _primitive_cache.pop(key, None)
+            
+            pending = _primitive_inflight.get(key)
+            if pending is None:
+                break
+            # An identical call is running; share its response instead of creating a second object
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                return [TextContent(type="text", text=pending.result())]
+        
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        _primitive_inflight[key] = future
+        try:
+            result = await primitive_batcher.submit([call])
+            
+            text = ToolResponse.from_result(
+                result, object_name=name, object_type=kind, parameters={**parameters, "location": location}
+            ).to_json()
+            
+            if result["success"]:
+                _primitive_cache[key] = text
+                if len(_primitive_cache) > PRIMITIVE_CACHE_SIZE:
+                    _primitive_cache.popitem(last=False)
+            future.set_result(text)
+        except BaseException:
+            # Waiting duplicates then run the call themselves
+            future.cancel()
+            raise
+        finally:
+            del _primitive_inflight[key]
+        
+        return [TextContent(type="text", text=text)]
+    
+    handle_create_primitive.__name__ = f"handle_create_{kind}"
+    handle_create_primitive.__doc__ = f"{PRIMITIVES[kind][0]}."
+    return handle_create_primitive
+
+def _primitive_tool(kind: str, description: str, params: List[Tuple[str, str, float]]) -> Tool:
+    """Build the create_<kind> tool definition from its PRIMITIVES entry."""
+    properties = {
+        param: {"type": "number", "description": param_description, "default": default}
+        for param, param_description, default in params
     }
-    
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    properties["location"] = {
+        "type": "array",
+        "items": {"type": "number"},
+        "description": "Location as [x, y, z] array",
+        "default": [0, 0, 0]
+    }
+    properties["name"] = {
+        "type": "string",
+        "description": f"Name for the {kind} object",
+        "default": kind.capitalize()
+    }
+    return Tool(name=f"create_{kind}", description=description,
+                inputSchema={"type": "object", "properties": properties})
 
 async def handle_clear_scene(arguments: dict) -> List[TextContent]:
-    """Clear all objects from the Blender scene."""
-    from blender_integration import blender_manager
+    """Clear all objects, meshes and materials from the Blender scene.
     
-    operations = [
-        'bpy.ops.object.select_all(action="SELECT")',
-        'bpy.ops.object.delete(use_global=False, confirm=False)',
-        'results.append({"action": "clear_scene", "status": "completed"})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    reset_scene() also drops the primitive and material caches.
+    """
+    result = await run_async(get_blender_manager().reset_scene)
     
-    response = {
-        "success": result["success"],
-        "action": "clear_scene",
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    response = ToolResponse.from_result(result, action="clear_scene")
     
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    return [TextContent(type="text", text=response.to_json())]
+
+# Characters allowed in output file paths; anything else could break out of the script literal
+_SAFE_PATH = re.compile(r"[\w./\-\\: ]+")
+
+@functools.lru_cache(maxsize=256)
+def _resolve_output_path(filepath: str, extension: str) -> str:
+    """Validate an output path, add the extension if missing and make it absolute.
+    
+    Args:
+        filepath: Path given to the tool
+        extension: Required file extension, without the dot
+    
+    Returns:
+        Normalized absolute path
+    
+    Raises:
+        ValueError: If the path contains unsupported characters
+    """
+    if not _SAFE_PATH.fullmatch(filepath):
+        raise ValueError(f"Invalid filepath: {filepath!r}")
+    if not filepath.endswith(f'.{extension}'):
+        filepath += f'.{extension}'
+    return os.path.abspath(filepath)
+
+# Output directories already created by _prepare_output_path()
+_created_directories: Set[str] = set()
+
+async def _prepare_output_path(filepath: str, extension: str) -> str:
+    """Resolve an output path with _resolve_output_path() and create its directory.
+    
+    The directory is created in a thread so a slow file system does not block the event
+    loop, and only the first time it is used.
+    """
+    filepath = _resolve_output_path(filepath, extension)
+    directory = os.path.dirname(filepath)
+    if directory not in _created_directories:
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(os.makedirs, directory, exist_ok=True)
+        )
+        _created_directories.add(directory)
+    return filepath
 
 async def handle_save_blend_file(arguments: dict) -> List[TextContent]:
     """Save the current Blender scene to a .blend file."""
-    from blender_integration import blender_manager
-    
     filepath = arguments.get("filepath", "")
     if not filepath:
-        return [TextContent(type="text", text=json.dumps({"success": False, "error": "filepath is required"}))]
+        return [TextContent(type="text", text=_json({"success": False, "error": "filepath is required"}))]
     
-    if not filepath.endswith('.blend'):
-        filepath += '.blend'
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    try:
+        filepath = await _prepare_output_path(filepath, 'blend')
+    except ValueError as e:
+        return [TextContent(type="text", text=_json({"success": False, "error": str(e)}))]
     
     operations = [
-        f'bpy.ops.wm.save_as_mainfile(filepath=r"{filepath}")',
-        f'results.append({{"action": "save_blend_file", "filepath": r"{filepath}", "status": "completed"}})'
+        f'bpy.ops.wm.save_as_mainfile(filepath={filepath!r})',
+        f'results.append({{"action": "save_blend_file", "filepath": {filepath!r}, "status": "completed"}})'
     ]
     
+    blender_manager = get_blender_manager()
     script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "action": "save_blend_file",
-        "filepath": filepath,
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    result = await blender_manager.aexecute_blender_script(script)
     
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    response = ToolResponse.from_result(result, action="save_blend_file", filepath=filepath)
+    
+    return [TextContent(type="text", text=response.to_json())]
+
+# Export operation per supported format
+_EXPORT_TEMPLATES = {
+    "obj": "bpy.ops.export_scene.obj(filepath={filepath!r}, use_selection={selected_only})",
+    "fbx": "bpy.ops.export_scene.fbx(filepath={filepath!r}, use_selection={selected_only})",
+    "stl": "bpy.ops.export_mesh.stl(filepath={filepath!r}, use_selection={selected_only})",
+    "ply": "bpy.ops.export_mesh.ply(filepath={filepath!r}, use_selection={selected_only})"
+}
 
 async def handle_export_model(arguments: dict) -> List[TextContent]:
     """Export 3D model to various formats."""
-    from blender_integration import blender_manager
-    
     filepath = arguments.get("filepath", "")
     format = arguments.get("format", "obj").lower()
-    selected_only = arguments.get("selected_only", False)
+    selected_only = bool(arguments.get("selected_only", False))
     
     if not filepath:
-        return [TextContent(type="text", text=json.dumps({"success": False, "error": "filepath is required"}))]
+        return [TextContent(type="text", text=_json({"success": False, "error": "filepath is required"}))]
     
-    supported_formats = ['obj', 'fbx', 'stl', 'ply']
-    
-    if format not in supported_formats:
-        return [TextContent(type="text", text=json.dumps({
+    if format not in _EXPORT_TEMPLATES:
+        return [TextContent(type="text", text=_json({
             "success": False,
-            "error": f"Unsupported format: {format}. Supported: {supported_formats}"
+            "error": f"Unsupported format: {format}. Supported: {list(_EXPORT_TEMPLATES)}"
         }))]
     
-    # Ensure proper file extension
-    if not filepath.endswith(f'.{format}'):
-        filepath += f'.{format}'
-    
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    # Generate export operation based on format
-    if format == 'obj':
-        export_op = f'bpy.ops.export_scene.obj(filepath=r"{filepath}", use_selection={selected_only})'
-    elif format == 'fbx':
-        export_op = f'bpy.ops.export_scene.fbx(filepath=r"{filepath}", use_selection={selected_only})'
-    elif format == 'stl':
-        export_op = f'bpy.ops.export_mesh.stl(filepath=r"{filepath}", use_selection={selected_only})'
-    elif format == 'ply':
-        export_op = f'bpy.ops.export_mesh.ply(filepath=r"{filepath}", use_selection={selected_only})'
+    # Ensure proper file extension and that the directory exists
+    try:
+        filepath = await _prepare_output_path(filepath, format)
+    except ValueError as e:
+        return [TextContent(type="text", text=_json({"success": False, "error": str(e)}))]
     
     operations = [
-        export_op,
-        f'results.append({{"action": "export_model", "filepath": r"{filepath}", "format": "{format}", "status": "completed"}})'
+        _EXPORT_TEMPLATES[format].format(filepath=filepath, selected_only=selected_only),
+        f'results.append({{"action": "export_model", "filepath": {filepath!r}, "format": "{format}", "status": "completed"}})'
     ]
     
+    blender_manager = get_blender_manager()
     script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    response = {
-        "success": result["success"],
-        "action": "export_model",
-        "filepath": filepath,
-        "format": format,
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    result = await blender_manager.aexecute_blender_script(script)
     
-    return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    response = ToolResponse.from_result(result, action="export_model", filepath=filepath, format=format)
+    
+    return [TextContent(type="text", text=response.to_json())]
+
+# Tool definitions advertised on every session handshake
+_TOOLS = [
+    Tool(
+        name="get_server_info",
+        description="Get information about the Blender MCP server capabilities",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="list_available_tools",
+        description="List all available 3D modeling tools",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    *[_primitive_tool(kind, description, params) for kind, (description, _, params) in PRIMITIVES.items()],
+    Tool(
+        name="clear_scene",
+        description="Clear all objects from the Blender scene",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="save_blend_file",
+        description="Save the current Blender scene to a .blend file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filepath": {
+                    "type": "string",
+                    "description": "Path where to save the .blend file"
+                }
+            },
+            "required": ["filepath"]
+        }
+    ),
+    Tool(
+        name="export_model",
+        description="Export 3D model to various formats (obj, fbx, stl, ply)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filepath": {
+                    "type": "string",
+                    "description": "Output file path"
+                },
+                "format": {
+                    "type": "string",
+                    "description": "Export format",
+                    "enum": ["obj", "fbx", "stl", "ply"],
+                    "default": "obj"
+                },
+                "selected_only": {
+                    "type": "boolean",
+                    "description": "Export only selected objects",
+                    "default": False
+                }
+            },
+            "required": ["filepath"]
+        }
+    )
+]
 
 # Register all tools
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List all available tools."""
-    return [
-        Tool(
-            name="get_server_info",
-            description="Get information about the Blender MCP server capabilities",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="list_available_tools",
-            description="List all available 3D modeling tools",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="create_cube",
-            description="Create a cube in the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "size": {
-                        "type": "number",
-                        "description": "Size of the cube",
-                        "default": 2.0
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location as [x, y, z] array",
-                        "default": [0, 0, 0]
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the cube object",
-                        "default": "Cube"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="create_sphere",
-            description="Create a UV sphere in the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "radius": {
-                        "type": "number",
-                        "description": "Radius of the sphere",
-                        "default": 1.0
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location as [x, y, z] array",
-                        "default": [0, 0, 0]
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the sphere object",
-                        "default": "Sphere"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="create_cylinder",
-            description="Create a cylinder in the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "radius": {
-                        "type": "number",
-                        "description": "Radius of the cylinder",
-                        "default": 1.0
-                    },
-                    "depth": {
-                        "type": "number",
-                        "description": "Height/depth of the cylinder",
-                        "default": 2.0
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location as [x, y, z] array",
-                        "default": [0, 0, 0]
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the cylinder object",
-                        "default": "Cylinder"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="create_plane",
-            description="Create a plane in the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "size": {
-                        "type": "number",
-                        "description": "Size of the plane",
-                        "default": 2.0
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location as [x, y, z] array",
-                        "default": [0, 0, 0]
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the plane object",
-                        "default": "Plane"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="create_cone",
-            description="Create a cone in the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "radius1": {
-                        "type": "number",
-                        "description": "Bottom radius of the cone",
-                        "default": 1.0
-                    },
-                    "radius2": {
-                        "type": "number",
-                        "description": "Top radius of the cone (0 for pointed)",
-                        "default": 0.0
-                    },
-                    "depth": {
-                        "type": "number",
-                        "description": "Height of the cone",
-                        "default": 2.0
-                    },
-                    "location": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Location as [x, y, z] array",
-                        "default": [0, 0, 0]
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Name for the cone object",
-                        "default": "Cone"
-                    }
-                }
-            }
-        ),
-        Tool(
-            name="clear_scene",
-            description="Clear all objects from the Blender scene",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="save_blend_file",
-            description="Save the current Blender scene to a .blend file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filepath": {
-                        "type": "string",
-                        "description": "Path where to save the .blend file"
-                    }
-                },
-                "required": ["filepath"]
-            }
-        ),
-        Tool(
-            name="export_model",
-            description="Export 3D model to various formats (obj, fbx, stl, ply)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filepath": {
-                        "type": "string",
-                        "description": "Output file path"
-                    },
-                    "format": {
-                        "type": "string",
-                        "description": "Export format",
-                        "enum": ["obj", "fbx", "stl", "ply"],
-                        "default": "obj"
-                    },
-                    "selected_only": {
-                        "type": "boolean",
-                        "description": "Export only selected objects",
-                        "default": False
-                    }
-                },
-                "required": ["filepath"]
-            }
-        )
-    ]
+    return _TOOLS
+
+# Tool name -> handler, shared by every call_tool() invocation
+_HANDLERS: Mapping[str, Callable[[dict], Awaitable[List[TextContent]]]] = MappingProxyType({
+    "get_server_info": handle_get_server_info,
+    "list_available_tools": handle_list_available_tools,
+    **{
+        f"create_{kind}": _make_primitive_handler(kind, operator, params)
+        for kind, (_, operator, params) in PRIMITIVES.items()
+    },
+    "clear_scene": handle_clear_scene,
+    "save_blend_file": handle_save_blend_file,
+    "export_model": handle_export_model
+})
 
 # Register tool handlers
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool calls."""
-    handlers = {
-        "get_server_info": handle_get_server_info,
-        "list_available_tools": handle_list_available_tools,
-        "create_cube": handle_create_cube,
-        "create_sphere": handle_create_sphere,
-        "create_cylinder": handle_create_cylinder,
-        "create_plane": handle_create_plane,
-        "create_cone": handle_create_cone,
-        "clear_scene": handle_clear_scene,
-        "save_blend_file": handle_save_blend_file,
-        "export_model": handle_export_model
-    }
-    
-    handler = handlers.get(name)
+    handler = _HANDLERS.get(name)
     if not handler:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
     
     try:
         return await handler(arguments)
     except Exception as e:
-        logger.error(f"Error in tool {name}: {e}")
-        return [TextContent(type="text", text=json.dumps({
+        logger.error("Error in tool %s: %s", name, e)
+        return [TextContent(type="text", text=_json({
             "success": False,
             "error": str(e)
         }))]
 
+async def warm_up_blender():
+    """Start the Blender worker in the background so the first tool call does not wait for it."""
+    try:
+        blender_manager = get_blender_manager()
+        await asyncio.get_running_loop().run_in_executor(None, blender_manager.warm_up)
+    except Exception as e:
+        logger.warning("Blender warm-up failed: %s", e)
+
 # Main function to run the server
 async def main():
     """Main entry point for the MCP server."""
@@ -556,16 +609,23 @@ async def main():
     
     logger.info("Starting Blender MCP Server...")
     logger.info("Available tools: Basic primitives, scene management, file operations")
+    warm_up = asyncio.ensure_future(warm_up_blender())
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="blender-mcp-server",
-                server_version="1.0.0"
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="blender-mcp-server",
+                    server_version="1.0.0"
+                )
             )
-        )
+    finally:
+        # Do not leave the task pending when the server stops before Blender started
+        warm_up.cancel()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(main())
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Client-side mesh preprocessing helpers
+Works on the flat arrays uploaded to Blender (float32 coordinates, int32 loop_start,
+loop_total and vertex_index). Uses Numba-compiled kernels when numba is installed,
+NumPy when only numpy is available, and plain Python otherwise.
+"""
+from array import array
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+def _from_ndarray(typecode: str, data) -> array:
+    """Copy a NumPy array into an array.array with one buffer copy."""
+    out = array(typecode)
+    out.frombytes(data.tobytes())
+    return out
+
+def pack_mesh(vertices: List[Tuple[float, float, float]], faces: List[List[int]]) -> Tuple[array, array, array, array]:
+    """Flatten vertices and faces into the arrays Mesh.foreach_set expects.
+    
+    With numpy installed, vertices (and faces given as an (F, K) integer array of
+    same-size faces) are converted in bulk instead of element by element.
+    
+    Args:
+        vertices: List (or (N, 3) array) of (x, y, z) vertex coordinates
+        faces: List of face indices (each face is a list of vertex indices)
+    
+    Returns:
+        (coords, loop_start, loop_total, vertex_index) arrays
+    """
+    if np is not None:
+        coords = _from_ndarray("f", np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1))
+        if isinstance(faces, np.ndarray) and faces.ndim == 2:
+            face_count, size = faces.shape
+            loop_total = _from_ndarray("i", np.full(face_count, size, dtype=np.int32))
+            loop_start = _from_ndarray("i", np.arange(0, face_count * size, size, dtype=np.int32))
+            vertex_index = _from_ndarray("i", np.ascontiguousarray(faces, dtype=np.int32).reshape(-1))
+            return coords, loop_start, loop_total, vertex_index
+    else:
+        coords = array("f", [c for v in vertices for c in v])
+    loop_total = array("i", [len(f) for f in faces])
+    loop_start = array("i")
+    corners = 0
+    for count in loop_total:
+        loop_start.append(corners)
+        corners += count
+    vertex_index = array("i", [i for f in faces for i in f])
+    return coords, loop_start, loop_total, vertex_index
+
+def validate_mesh(coords: array, loop_total: array, vertex_index: array) -> Optional[str]:
+    """Check packed faces before any kernel indexes the coordinates with them.
+    
+    Args:
+        coords: Flat float32 array of x, y, z values
+        loop_total: Number of corners of each face
+        vertex_index: Vertex index of each corner
+    
+    Returns:
+        Error message for the first problem found, or None if the faces are valid
+    """
+    vertex_count = len(coords) // 3
+    if np is not None:
+        totals = np.frombuffer(loop_total, dtype=np.int32)
+        indices = np.frombuffer(vertex_index, dtype=np.int32)
+        small = np.flatnonzero(totals < 3)
+        if len(small):
+            return f"Face {small[0]} has {totals[small[0]]} vertices; faces need at least 3"
+        invalid = np.flatnonzero((indices < 0) | (indices >= vertex_count))
+        if len(invalid):
+            return f"Vertex index {indices[invalid[0]]} is out of range for {vertex_count} vertices"
+        return None
+    
+    for face, total in enumerate(loop_total):
+        if total < 3:
+            return f"Face {face} has {total} vertices; faces need at least 3"
+    for index in vertex_index:
+        if not 0 <= index < vertex_count:
+            return f"Vertex index {index} is out of range for {vertex_count} vertices"
+    return None
+
+def compute_bounds(coords: array) -> Dict[str, List[float]]:
+    """Compute the bounding box and centroid of a flat coordinate array.
+    
+    Args:
+        coords: Flat float32 array of x, y, z values
+    
+    Returns:
+        Dictionary with "min", "max" and "centroid" as [x, y, z] lists
+    """
+    if not coords:
+        return {"min": [0.0] * 3, "max": [0.0] * 3, "centroid": [0.0] * 3}
+    
+    if np is not None:
+        points = np.frombuffer(coords, dtype=np.float32).reshape(-1, 3)
+        return {
+            "min": points.min(axis=0).tolist(),
+            "max": points.max(axis=0).tolist(),
+            "centroid": points.mean(axis=0, dtype=np.float64).tolist()
+        }
+    
+    axes = [coords[i::3] for i in range(3)]
+    count = len(axes[0])
+    return {
+        "min": [min(axis) for axis in axes],
+        "max": [max(axis) for axis in axes],
+        "centroid": [sum(axis) / count for axis in axes]
+    }
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _face_normals_kernel(points, loop_start, loop_total, vertex_index, out_normals):
+        """Newell's method per face, parallel over faces."""
+        for f in prange(loop_start.shape[0]):
+            start = loop_start[f]
+            total = loop_total[f]
+            nx = 0.0
+            ny = 0.0
+            nz = 0.0
+            for k in range(total):
+                a = vertex_index[start + k]
+                b = vertex_index[start + (k + 1) % total]
+                nx += (points[a, 1] - points[b, 1]) * (points[a, 2] + points[b, 2])
+                ny += (points[a, 2] - points[b, 2]) * (points[a, 0] + points[b, 0])
+                nz += (points[a, 0] - points[b, 0]) * (points[a, 1] + points[b, 1])
+            length = (nx * nx + ny * ny + nz * nz) ** 0.5
+            if length > 0.0:
+                out_normals[f, 0] = nx / length
+                out_normals[f, 1] = ny / length
+                out_normals[f, 2] = nz / length
+            else:
+                out_normals[f, 0] = 0.0
+                out_normals[f, 1] = 0.0
+                out_normals[f, 2] = 0.0
+
+def compute_face_normals(coords: array, loop_start: array, loop_total: array, vertex_index: array) -> List[List[float]]:
+    """Compute unit face normals for polygons of any size (Newell's method).
+    
+    Degenerate faces get a zero normal.
+    
+    Args:
+        coords: Flat float32 array of x, y, z values
+        loop_start: First corner of each face
+        loop_total: Number of corners of each face
+        vertex_index: Vertex index of each corner
+    
+    Returns:
+        List of [x, y, z] normals, one per face
+    """
+    if np is not None:
+        points = np.frombuffer(coords, dtype=np.float32).reshape(-1, 3)
+        starts = np.frombuffer(loop_start, dtype=np.int32)
+        totals = np.frombuffer(loop_total, dtype=np.int32)
+        indices = np.frombuffer(vertex_index, dtype=np.int32)
+    
+        if njit is not None:
+            normals = np.empty((len(starts), 3), dtype=np.float32)
+            _face_normals_kernel(points, starts, totals, indices, normals)
+            return normals.tolist()
+    
+        if not len(starts):
+            return []
+        # Index of the next corner within the same face, for every corner
+        face_of_corner = np.repeat(np.arange(len(starts)), totals)
+        offset = np.arange(len(indices)) - starts[face_of_corner]
+        following = starts[face_of_corner] + (offset + 1) % totals[face_of_corner]
+        a = points[indices].astype(np.float64)
+        b = points[indices[following]].astype(np.float64)
+        cross = np.stack([
+            (a[:, 1] - b[:, 1]) * (a[:, 2] + b[:, 2]),
+            (a[:, 2] - b[:, 2]) * (a[:, 0] + b[:, 0]),
+            (a[:, 0] - b[:, 0]) * (a[:, 1] + b[:, 1])
+        ], axis=1)
+        normals = np.add.reduceat(cross, np.minimum(starts, len(indices) - 1), axis=0)
+        normals[totals == 0] = 0.0
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+        return normals.tolist()
+    
+    normals = []
+    for start, total in zip(loop_start, loop_total):
+        n = [0.0, 0.0, 0.0]
+        for k in range(total):
+            a = vertex_index[start + k]
+            b = vertex_index[start + (k + 1) % total]
+            ax, ay, az = coords[3 * a:3 * a + 3]
+            bx, by, bz = coords[3 * b:3 * b + 3]
+            n[0] += (ay - by) * (az + bz)
+            n[1] += (az - bz) * (ax + bx)
+            n[2] += (ax - bx) * (ay + by)
+        length = (n[0] ** 2 + n[1] ** 2 + n[2] ** 2) ** 0.5
+        normals.append([c / length for c in n] if length > 0 else [0.0, 0.0, 0.0])
+    return normals
@@ -3,10 +3,65 @@ Modifier system for advanced object manipulation
 """
 from typing import Any, Dict, List, Optional, Tuple
 import logging
-from blender_integration import blender_manager
+import math
+from blender_integration import get_blender_manager, noop_result, run_async
 
 logger = logging.getLogger(__name__)
 
+def _result(action: str, object_name: str, result: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+    """Tool result for a Blender run; fields go between object_name and blender_output."""
+    success = result["success"]
+    return {
+        "success": success,
+        "action": action,
+        "object_name": object_name,
+        **fields,
+        "blender_output": result.get("stdout", ""),
+        "errors": None if success else result.get("stderr", "")
+    }
+
+def _error_result(action: str, object_name: str, message: str) -> Dict[str, Any]:
+    """Tool result for a call rejected before reaching Blender."""
+    return {
+        "success": False,
+        "action": action,
+        "object_name": object_name,
+        "blender_output": "",
+        "errors": message
+    }
+
+def _run_modifier_spec(action: str, object_name: str, spec: Dict[str, Any],
+                       parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Add one modifier to an object with the add_modifiers operation.
+    
+    Args:
+        action: Action name reported to the caller
+        object_name: Name of the object
+        spec: Modifier spec from one of the _*_spec() builders
+        parameters: Parameters reported to the caller
+    
+    Returns:
+        Dictionary with operation result
+    """
+    result = get_blender_manager().run_op("add_modifiers", {"object_name": object_name, "modifiers": [spec]})
+    return _result(action, object_name, result, parameters=parameters)
+
+# Each _*_spec() builder returns the ops_library add_modifiers spec of one modifier
+# ({"type", "name", "settings"}, settings being modifier attribute values)
+# and the parameters reported to the caller.
+
+def _array_spec(count: int = 3, offset: Tuple[float, float, float] = (2.0, 0.0, 0.0),
+                use_relative_offset: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_array_modifier()."""
+    if count < 1:
+        raise ValueError(f"Array count must be at least 1, got {count}")
+    spec = {"type": "ARRAY", "name": "Array", "settings": {
+        "count": count,
+        "use_relative_offset": use_relative_offset,
+        "relative_offset_displace": list(offset)
+    }}
+    return spec, {"count": count, "offset": offset, "use_relative_offset": use_relative_offset}
+
 def add_array_modifier(object_name: str, count: int = 3, offset: Tuple[float, float, float] = (2.0, 0.0, 0.0),
                       use_relative_offset: bool = True) -> Dict[str, Any]:
     """Add array modifier to duplicate objects.
@@ -18,29 +73,30 @@ def add_array_modifier(object_name: str, count: int = 3, offset: Tuple[float, fl
         use_relative_offset: Use relative offset (vs absolute)
     
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result ("skipped" when count is 1 and the object was only checked)
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Array", type="ARRAY")',
-        f'modifier.count = {count}',
-        f'modifier.use_relative_offset = {use_relative_offset}',
-        f'modifier.relative_offset_displace = {offset}',
-        f'results.append({{"action": "add_array_modifier", "object": "{object_name}", "count": {count}, "offset": {offset}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_array_modifier",
-        "object_name": object_name,
-        "parameters": {"count": count, "offset": offset, "use_relative_offset": use_relative_offset},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    try:
+        spec, parameters = _array_spec(count, offset, use_relative_offset)
+    except ValueError as e:
+        return _error_result("add_array_modifier", object_name, str(e))
+    if count == 1:
+        # A single copy is the object itself
+        return noop_result("add_array_modifier", object_name, parameters)
+    return _run_modifier_spec("add_array_modifier", object_name, spec, parameters)
+
+def _mirror_spec(axis: str = "X", use_bisect: bool = False,
+                 merge_threshold: float = 0.001) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_mirror_modifier()."""
+    axes = axis.upper()
+    use_x, use_y, use_z = "X" in axes, "Y" in axes, "Z" in axes
+    if not (use_x or use_y or use_z):
+        raise ValueError(f"Mirror axis must contain X, Y or Z, got {axis!r}")
+    spec = {"type": "MIRROR", "name": "Mirror", "settings": {
+        "use_axis": [use_x, use_y, use_z],
+        "use_bisect_axis": [use_bisect and use_x, use_bisect and use_y, use_bisect and use_z],
+        "merge_threshold": merge_threshold
+    }}
+    return spec, {"axis": axis, "use_bisect": use_bisect, "merge_threshold": merge_threshold}
 
 def add_mirror_modifier(object_name: str, axis: str = "X", use_bisect: bool = False, 
                        merge_threshold: float = 0.001) -> Dict[str, Any]:
@@ -55,31 +111,19 @@ def add_mirror_modifier(object_name: str, axis: str = "X", use_bisect: bool = Fa
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Mirror", type="MIRROR")',
-        f'modifier.use_axis[0] = {"X" in axis.upper()}',
-        f'modifier.use_axis[1] = {"Y" in axis.upper()}', 
-        f'modifier.use_axis[2] = {"Z" in axis.upper()}',
-        f'modifier.use_bisect_axis[0] = {use_bisect and "X" in axis.upper()}',
-        f'modifier.use_bisect_axis[1] = {use_bisect and "Y" in axis.upper()}',
-        f'modifier.use_bisect_axis[2] = {use_bisect and "Z" in axis.upper()}',
-        f'modifier.merge_threshold = {merge_threshold}',
-        f'results.append({{"action": "add_mirror_modifier", "object": "{object_name}", "axis": "{axis}", "use_bisect": {use_bisect}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_mirror_modifier",
-        "object_name": object_name,
-        "parameters": {"axis": axis, "use_bisect": use_bisect, "merge_threshold": merge_threshold},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    try:
+        spec, parameters = _mirror_spec(axis, use_bisect, merge_threshold)
+    except ValueError as e:
+        return _error_result("add_mirror_modifier", object_name, str(e))
+    return _run_modifier_spec("add_mirror_modifier", object_name, spec, parameters)
+
+def _solidify_spec(thickness: float = 0.1, offset: float = -1.0) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_solidify_modifier()."""
+    spec = {"type": "SOLIDIFY", "name": "Solidify", "settings": {
+        "thickness": thickness,
+        "offset": offset
+    }}
+    return spec, {"thickness": thickness, "offset": offset}
 
 def add_solidify_modifier(object_name: str, thickness: float = 0.1, offset: float = -1.0) -> Dict[str, Any]:
     """Add solidify modifier to give thickness to surfaces.
@@ -92,26 +136,20 @@ def add_solidify_modifier(object_name: str, thickness: float = 0.1, offset: floa
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Solidify", type="SOLIDIFY")',
-        f'modifier.thickness = {thickness}',
-        f'modifier.offset = {offset}',
-        f'results.append({{"action": "add_solidify_modifier", "object": "{object_name}", "thickness": {thickness}, "offset": {offset}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_solidify_modifier",
-        "object_name": object_name,
-        "parameters": {"thickness": thickness, "offset": offset},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    spec, parameters = _solidify_spec(thickness, offset)
+    return _run_modifier_spec("add_solidify_modifier", object_name, spec, parameters)
+
+def _bevel_spec(width: float = 0.1, segments: int = 1,
+                limit_method: str = "NONE") -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_bevel_modifier()."""
+    if segments < 1:
+        raise ValueError(f"Bevel needs at least 1 segment, got {segments}")
+    spec = {"type": "BEVEL", "name": "Bevel", "settings": {
+        "width": width,
+        "segments": segments,
+        "limit_method": limit_method
+    }}
+    return spec, {"width": width, "segments": segments, "limit_method": limit_method}
 
 def add_bevel_modifier(object_name: str, width: float = 0.1, segments: int = 1, 
                       limit_method: str = "NONE") -> Dict[str, Any]:
@@ -126,30 +164,31 @@ def add_bevel_modifier(object_name: str, width: float = 0.1, segments: int = 1,
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Bevel", type="BEVEL")',
-        f'modifier.width = {width}',
-        f'modifier.segments = {segments}',
-        f'modifier.limit_method = "{limit_method}"',
-        f'results.append({{"action": "add_bevel_modifier", "object": "{object_name}", "width": {width}, "segments": {segments}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_bevel_modifier",
-        "object_name": object_name,
-        "parameters": {"width": width, "segments": segments, "limit_method": limit_method},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    try:
+        spec, parameters = _bevel_spec(width, segments, limit_method)
+    except ValueError as e:
+        return _error_result("add_bevel_modifier", object_name, str(e))
+    return _run_modifier_spec("add_bevel_modifier", object_name, spec, parameters)
+
+# Screw modifier axis enum index per axis letter
+_SCREW_AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2}
 
-def add_screw_modifier(object_name: str, angle: float = 6.28318, screw: float = 0.0, 
-                      iterations: int = 1, axis: str = "Z") -> Dict[str, Any]:
+def _screw_spec(angle: float = math.tau, screw: float = 0.0,
+                iterations: int = 1, axis: str = "Z",
+                angle_deg: Optional[float] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_screw_modifier()."""
+    if angle_deg is not None:
+        angle = math.radians(angle_deg)
+    spec = {"type": "SCREW", "name": "Screw", "settings": {
+        "angle": angle,
+        "screw_offset": screw,
+        "iterations": iterations,
+        "axis": _SCREW_AXIS_INDEX.get(axis.upper(), 2)
+    }}
+    return spec, {"angle": angle, "screw": screw, "iterations": iterations, "axis": axis}
+
+def add_screw_modifier(object_name: str, angle: float = math.tau, screw: float = 0.0, 
+                      iterations: int = 1, axis: str = "Z", angle_deg: Optional[float] = None) -> Dict[str, Any]:
     """Add screw modifier for spiral/helical shapes.
     
     Args:
@@ -158,35 +197,24 @@ def add_screw_modifier(object_name: str, angle: float = 6.28318, screw: float =
         screw: Screw offset along axis
         iterations: Number of iterations
         axis: Rotation axis ('X', 'Y', 'Z')
+        angle_deg: Rotation angle in degrees; overrides angle when given
     
     Returns:
         Dictionary with operation result
     """
-    axis_map = {"X": 0, "Y": 1, "Z": 2}
-    axis_index = axis_map.get(axis.upper(), 2)
-    
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Screw", type="SCREW")',
-        f'modifier.angle = {angle}',
-        f'modifier.screw_offset = {screw}',
-        f'modifier.iterations = {iterations}',
-        f'modifier.axis = {axis_index}',
-        f'results.append({{"action": "add_screw_modifier", "object": "{object_name}", "angle": {angle}, "screw": {screw}, "iterations": {iterations}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_screw_modifier",
-        "object_name": object_name,
-        "parameters": {"angle": angle, "screw": screw, "iterations": iterations, "axis": axis},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    spec, parameters = _screw_spec(angle, screw, iterations, axis, angle_deg)
+    return _run_modifier_spec("add_screw_modifier", object_name, spec, parameters)
+
+def _wave_spec(height: float = 0.5, width: float = 1.5, speed: float = 1.0,
+               start_position_object: float = 0.0) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_wave_modifier()."""
+    spec = {"type": "WAVE", "name": "Wave", "settings": {
+        "height": height,
+        "width": width,
+        "speed": speed,
+        "start_position_object": start_position_object
+    }}
+    return spec, {"height": height, "width": width, "speed": speed, "start_position_object": start_position_object}
 
 def add_wave_modifier(object_name: str, height: float = 0.5, width: float = 1.5, 
                      speed: float = 1.0, start_position_object: float = 0.0) -> Dict[str, Any]:
@@ -202,28 +230,16 @@ def add_wave_modifier(object_name: str, height: float = 0.5, width: float = 1.5,
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Wave", type="WAVE")',
-        f'modifier.height = {height}',
-        f'modifier.width = {width}',
-        f'modifier.speed = {speed}',
-        f'modifier.start_position_object = {start_position_object}',
-        f'results.append({{"action": "add_wave_modifier", "object": "{object_name}", "height": {height}, "width": {width}, "speed": {speed}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_wave_modifier",
-        "object_name": object_name,
-        "parameters": {"height": height, "width": width, "speed": speed, "start_position_object": start_position_object},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    spec, parameters = _wave_spec(height, width, speed, start_position_object)
+    return _run_modifier_spec("add_wave_modifier", object_name, spec, parameters)
+
+def _displacement_spec(strength: float = 1.0, mid_level: float = 0.5) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """add_modifiers spec and reported parameters for add_displacement_modifier()."""
+    spec = {"type": "DISPLACE", "name": "Displace", "settings": {
+        "strength": strength,
+        "mid_level": mid_level
+    }, "texture": {"type": "NOISE", "name": "DisplacementNoise", "settings": {"noise_scale": 0.25}}}
+    return spec, {"strength": strength, "mid_level": mid_level}
 
 def add_displacement_modifier(object_name: str, strength: float = 1.0, mid_level: float = 0.5) -> Dict[str, Any]:
     """Add displacement modifier with noise texture.
@@ -236,31 +252,8 @@ def add_displacement_modifier(object_name: str, strength: float = 1.0, mid_level
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'# Create displacement texture',
-        f'tex = bpy.data.textures.new(name="DisplacementNoise", type="NOISE")',
-        f'tex.noise_scale = 0.25',
-        f'# Add displacement modifier',
-        f'modifier = obj.modifiers.new(name="Displace", type="DISPLACE")',
-        f'modifier.texture = tex',
-        f'modifier.strength = {strength}',
-        f'modifier.mid_level = {mid_level}',
-        f'results.append({{"action": "add_displacement_modifier", "object": "{object_name}", "strength": {strength}, "mid_level": {mid_level}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
-    
-    return {
-        "success": result["success"],
-        "action": "add_displacement_modifier",
-        "object_name": object_name,
-        "parameters": {"strength": strength, "mid_level": mid_level},
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
+    spec, parameters = _displacement_spec(strength, mid_level)
+    return _run_modifier_spec("add_displacement_modifier", object_name, spec, parameters)
 
 def apply_modifier(object_name: str, modifier_name: str) -> Dict[str, Any]:
     """Apply a modifier to make it permanent.
@@ -272,21 +265,196 @@ def apply_modifier(object_name: str, modifier_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.modifier_apply(modifier="{modifier_name}")',
-        f'results.append({{"action": "apply_modifier", "object": "{object_name}", "modifier": "{modifier_name}"}})' 
-    ]
+    result = get_blender_manager().run_op("apply_modifier", {"object_name": object_name, "modifier_name": modifier_name})
+    return _result("apply_modifier", object_name, result, modifier_name=modifier_name)
+
+# Modifier type accepted by batch_add_modifiers() -> (action name, spec builder)
+MODIFIER_BUILDERS = {
+    "array": ("add_array_modifier", _array_spec),
+    "mirror": ("add_mirror_modifier", _mirror_spec),
+    "solidify": ("add_solidify_modifier", _solidify_spec),
+    "bevel": ("add_bevel_modifier", _bevel_spec),
+    "screw": ("add_screw_modifier", _screw_spec),
+    "wave": ("add_wave_modifier", _wave_spec),
+    "displacement": ("add_displacement_modifier", _displacement_spec)
+}
+
+def batch_add_modifiers(object_name: str, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add several modifiers in a single Blender run.
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    Specs are grouped by object, so each object is looked up and activated once;
+    within an object, modifiers are added in spec order.
     
-    return {
-        "success": result["success"],
-        "action": "apply_modifier",
-        "object_name": object_name,
-        "modifier_name": modifier_name,
-        "blender_output": result.get("stdout", ""),
-        "errors": result.get("stderr", "") if not result["success"] else None
-    }
\ No newline at end of file
+    Args:
+        object_name: Name of the object
+        specs: One dict per modifier, in stack order: "type" (a MODIFIER_BUILDERS key)
+            plus keyword arguments of the matching add_*_modifier function,
+            e.g. {"type": "bevel", "width": 0.05, "segments": 3}. An optional
+            "object_name" entry targets another object instead.
+    
+    Returns:
+        Dictionary with operation result; "modifiers" lists the object, action
+        and parameters of each spec
+    """
+    # Object name -> add_modifiers specs, in first-seen order
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    modifiers = []
+    for spec in specs:
+        spec = dict(spec)
+        target = spec.pop("object_name", object_name)
+        modifier_type = str(spec.pop("type", "")).lower()
+        if modifier_type not in MODIFIER_BUILDERS:
+            return _error_result("batch_add_modifiers", object_name,
+                                 f"Unknown modifier type: {modifier_type!r}. Supported: {list(MODIFIER_BUILDERS)}")
+        action, build = MODIFIER_BUILDERS[modifier_type]
+        try:
+            modifier_spec, parameters = build(**spec)
+        except (TypeError, ValueError) as e:
+            return _error_result("batch_add_modifiers", object_name,
+                                 f"Invalid {modifier_type} modifier parameters: {e}")
+        groups.setdefault(target, []).append(modifier_spec)
+        modifiers.append({"object_name": target, "action": action, "parameters": parameters})
+    
+    calls = [("add_modifiers", {"object_name": target, "modifiers": group}) for target, group in groups.items()]
+    result = get_blender_manager().run_calls(calls)
+    return _result("batch_add_modifiers", object_name, result, modifiers=modifiers)
+
+class ModifierChain:
+    """Ordered modifier steps on one object, executed together in a single Blender run.
+    
+    Steps run serially and stop at the first failure; the result reports the
+    status of every step and, on failure, the index of the step that failed.
+    
+    Example:
+        chain = ModifierChain("Cube").bevel(width=0.05, segments=3).mirror(axis="X")
+        result = chain.apply("Bevel").execute()
+    """
+    
+    def __init__(self, object_name: str):
+        """Initialize an empty chain.
+        
+        Args:
+            object_name: Name of the object every step acts on
+        """
+        self.object_name = object_name
+        self._steps: List[Tuple[str, Dict[str, Any], Tuple[str, Dict[str, Any]]]] = []
+    
+    def add(self, modifier_type: str, **params: Any) -> "ModifierChain":
+        """Append a modifier step.
+        
+        Args:
+            modifier_type: Key of MODIFIER_BUILDERS, e.g. "bevel"
+            **params: Keyword arguments of the matching add_*_modifier function
+        
+        Returns:
+            The chain, for chaining further calls
+        
+        Raises:
+            ValueError: If the modifier type is unknown or its parameters are invalid
+        """
+        if modifier_type not in MODIFIER_BUILDERS:
+            raise ValueError(f"Unknown modifier type: {modifier_type!r}. Supported: {list(MODIFIER_BUILDERS)}")
+        action, build = MODIFIER_BUILDERS[modifier_type]
+        spec, parameters = build(**params)
+        call = ("add_modifiers", {"object_name": self.object_name, "modifiers": [spec]})
+        self._steps.append((action, parameters, call))
+        return self
+    
+    def array(self, **params: Any) -> "ModifierChain":
+        """Append an add_array_modifier() step."""
+        return self.add("array", **params)
+    
+    def mirror(self, **params: Any) -> "ModifierChain":
+        """Append an add_mirror_modifier() step."""
+        return self.add("mirror", **params)
+    
+    def solidify(self, **params: Any) -> "ModifierChain":
+        """Append an add_solidify_modifier() step."""
+        return self.add("solidify", **params)
+    
+    def bevel(self, **params: Any) -> "ModifierChain":
+        """Append an add_bevel_modifier() step."""
+        return self.add("bevel", **params)
+    
+    def screw(self, **params: Any) -> "ModifierChain":
+        """Append an add_screw_modifier() step."""
+        return self.add("screw", **params)
+    
+    def wave(self, **params: Any) -> "ModifierChain":
+        """Append an add_wave_modifier() step."""
+        return self.add("wave", **params)
+    
+    def displacement(self, **params: Any) -> "ModifierChain":
+        """Append an add_displacement_modifier() step."""
+        return self.add("displacement", **params)
+    
+    def apply(self, modifier_name: str) -> "ModifierChain":
+        """Append an apply_modifier() step."""
+        call = ("apply_modifier", {"object_name": self.object_name, "modifier_name": modifier_name})
+        self._steps.append(("apply_modifier", {"modifier_name": modifier_name}, call))
+        return self
+    
+    def execute(self) -> Dict[str, Any]:
+        """Run all steps in one Blender run (or queue them in an open batch).
+        
+        Returns:
+            Dictionary with operation result; "steps" lists each step's action,
+            parameters and success, and "failed_step" is the index of the step
+            that raised, if any
+        """
+        # One call per step, so the number of completed calls shows how far the chain got
+        result = get_blender_manager().run_calls([call for _, _, call in self._steps])
+        
+        fields: Dict[str, Any] = {}
+        if result.get("deferred"):
+            fields["deferred"] = True
+            completed = 0
+        else:
+            completed = result.get("completed", 0) if not result["success"] else len(self._steps)
+            if not result["success"]:
+                fields["failed_step"] = completed
+        fields["steps"] = [
+            {"action": action, "parameters": parameters, "success": index < completed}
+            for index, (action, parameters, _) in enumerate(self._steps)
+        ]
+        return _result("modifier_chain", self.object_name, result, **fields)
+
+# ===== ASYNC VARIANTS =====
+# Awaitable wrappers that keep the event loop free while Blender runs, so modifier
+# calls can be submitted together and awaited with asyncio.gather().
+
+async def aadd_array_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_array_modifier()."""
+    return await run_async(add_array_modifier, *args, **kwargs)
+
+async def aadd_mirror_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_mirror_modifier()."""
+    return await run_async(add_mirror_modifier, *args, **kwargs)
+
+async def aadd_solidify_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_solidify_modifier()."""
+    return await run_async(add_solidify_modifier, *args, **kwargs)
+
+async def aadd_bevel_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_bevel_modifier()."""
+    return await run_async(add_bevel_modifier, *args, **kwargs)
+
+async def aadd_screw_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_screw_modifier()."""
+    return await run_async(add_screw_modifier, *args, **kwargs)
+
+async def aadd_wave_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_wave_modifier()."""
+    return await run_async(add_wave_modifier, *args, **kwargs)
+
+async def aadd_displacement_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable add_displacement_modifier()."""
+    return await run_async(add_displacement_modifier, *args, **kwargs)
+
+async def aapply_modifier(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable apply_modifier()."""
+    return await run_async(apply_modifier, *args, **kwargs)
+
+async def abatch_add_modifiers(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Awaitable batch_add_modifiers()."""
+    return await run_async(batch_add_modifiers, *args, **kwargs)
@@ -0,0 +1,805 @@
+"""
+Blender-side operation library
+Every operation is a fixed function that reads its parameters from a JSON-decoded
+args dict, so no user-supplied value is ever interpolated into Python source.
+Imported inside Blender by blender_worker.py, or directly when bpy is importable.
+"""
+import array
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import tempfile
+import bpy
+import bmesh
+
+# Blender bundles numpy; without it smooth_object falls back to bmesh.ops.smooth_vert
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Decodes report lines faster when installed in Blender's Python; json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Registry of operations by name
+OPS = {}
+
+def op(func):
+    """Register a function as a named operation."""
+    OPS[func.__name__] = func
+    return func
+
+# Directory of marshalled code objects shared by worker processes and one-shot runs
+# (BLENDER_MCP_CODE_CACHE=0 disables it)
+CODE_CACHE_DIR = os.environ.get("BLENDER_MCP_CODE_CACHE",
+                                os.path.join(os.path.expanduser("~"), ".cache", "blender_mcp", "code"))
+
+def _code_cache_digest(source):
+    """Hash of source and the bytecode format of this Python, stored at the start of its cache file."""
+    return hashlib.sha256(importlib.util.MAGIC_NUMBER + source.encode("utf-8")).digest()
+
+@functools.lru_cache(maxsize=None)
+def _code_cache_usable():
+    """Create CODE_CACHE_DIR private to this user; False if it cannot be or belongs to someone else."""
+    try:
+        os.makedirs(CODE_CACHE_DIR, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            info = os.stat(CODE_CACHE_DIR)
+            if info.st_uid != os.getuid():
+                return False
+            if info.st_mode & 0o077:
+                os.chmod(CODE_CACHE_DIR, 0o700)
+    except OSError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=256)
+def compile_source(source):
+    """Compile generated source once; repeated sources reuse the cached code object.
+    
+    Code objects are also marshalled to CODE_CACHE_DIR, so a fresh Blender process
+    loads sources seen by earlier ones instead of parsing them again. Each file
+    starts with the hash of its source; a file that does not match or cannot be
+    loaded is compiled again.
+    """
+    if CODE_CACHE_DIR == "0" or not _code_cache_usable():
+        return compile(source, "<blender_mcp>", "exec")
+    digest = _code_cache_digest(source)
+    path = os.path.join(CODE_CACHE_DIR, digest.hex() + ".marshal")
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:len(digest)] == digest:
+            return marshal.loads(data[len(digest):])
+    except Exception:
+        pass
+    code = compile(source, "<blender_mcp>", "exec")
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=CODE_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(digest)
+            marshal.dump(code, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+    return code
+
+# Markers of the line printed by the report() function of generated scripts
+REPORT_MARKERS = ("BLENDER_MCP_SUCCESS:", "BLENDER_MCP_ERROR:")
+
+def split_report(output):
+    """Separate a generated script's report line from the rest of its printed output.
+    
+    Returns:
+        (output without the report line, decoded report or an empty dict)
+    """
+    lines = []
+    report = {}
+    for line in output.splitlines(keepends=True):
+        if line.startswith(REPORT_MARKERS):
+            try:
+                payload = line.split(":", 1)[1]
+                report = orjson.loads(payload) if orjson is not None else json.loads(payload)
+                continue
+            except ValueError:
+                pass
+        lines.append(line)
+    return "".join(lines), report
+
+def run_calls(calls, results, on_call=None):
+    """Execute (op_name, args) calls in order, appending records to results.
+    
+    on_call, if given, is called as on_call(index, records) after each call with the
+    records that call appended.
+    """
+    for index, (name, args) in enumerate(calls):
+        start = len(results)
+        OPS[name](args, results)
+        if on_call is not None:
+            on_call(index, results[start:])
+
+# ===== SCENE =====
+
+@op
+def reset_scene(args, results):
+    """Delete all objects, meshes and materials so the following calls start from an empty scene.
+    
+    Removes the data blocks directly in one batch_remove call instead of running the
+    select_all and delete operators, which also leave the meshes and materials orphaned.
+    """
+    bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes) + list(bpy.data.materials))
+
+@op
+def save_blend(args, results):
+    """Save a copy of the current scene to a .blend file."""
+    bpy.ops.wm.save_as_mainfile(filepath=args["filepath"], copy=True, check_existing=False)
+
+@op
+def append_blend(args, results):
+    """Append all objects from a .blend file into the current scene."""
+    with bpy.data.libraries.load(args["filepath"]) as (data_from, data_to):
+        data_to.objects = data_from.objects
+    for obj in data_to.objects:
+        if obj is not None:
+            bpy.context.collection.objects.link(obj)
+
+def active_object(name):
+    """Look up an object by name and make it the active one.
+    
+    The view layer is only written when the active object changes, so consecutive
+    calls on the same object in a batch do not each trigger an active-object update.
+    """
+    obj = bpy.data.objects[name]
+    view_layer = bpy.context.view_layer
+    if view_layer.objects.active != obj:
+        view_layer.objects.active = obj
+    return obj
+
+@op
+def check_object(args, results):
+    """Fail with a KeyError unless the object exists (for tool calls that would not change it)."""
+    bpy.data.objects[args["object_name"]]
+    results.append({"action": "check_object", "object": args["object_name"]})
+
+@op
+def exec_operations(args, results):
+    """Execute generated operation lines (for tools not yet ported to this library).
+    
+    The lines read their values from PARAMS, so every call of a tool sends the same
+    source and reuses its compiled code object.
+    """
+    namespace = {"bpy": bpy, "bmesh": bmesh, "results": results, "active_object": active_object,
+                 "add_modifier": add_modifier, "PARAMS": args.get("params", {})}
+    exec(compile_source(args["code"]), namespace)
+
+# ===== PRIMITIVES =====
+
+@op
+def create_primitive(args, results):
+    """Add a mesh primitive with a bpy.ops.mesh.primitive_*_add operator and name it."""
+    if not args["operator"].startswith("primitive_"):
+        raise ValueError(f"Not a primitive operator: {args['operator']}")
+    add = getattr(bpy.ops.mesh, args["operator"])
+    add(location=args["location"], **args["params"])
+    obj = bpy.context.active_object
+    obj.name = args["name"]
+    results.append({"object": obj.name, "type": args["kind"], "location": args["location"]})
+
+# ===== MODIFIERS =====
+
+def _set_attributes(target, settings):
+    """Assign a dict of attribute values to a Blender struct."""
+    for attribute, value in settings.items():
+        setattr(target, attribute, value)
+
+def add_modifier(obj, name, modifier_type, **settings):
+    """Add a modifier to the end of obj's stack and assign its settings."""
+    modifier = obj.modifiers.new(name=name, type=modifier_type)
+    _set_attributes(modifier, settings)
+    return modifier
+
+def _add_modifier_stack(obj, specs):
+    """Add modifiers from {"type", "name", "settings"} specs to the end of obj's stack."""
+    for spec in specs:
+        modifier = add_modifier(obj, spec["name"], spec["type"])
+        texture = spec.get("texture")
+        if texture is not None:
+            tex = bpy.data.textures.new(name=texture["name"], type=texture["type"])
+            _set_attributes(tex, texture["settings"])
+            modifier.texture = tex
+        _set_attributes(modifier, spec["settings"])
+
+@op
+def add_modifiers(args, results):
+    """Add modifiers to an object from {"type", "name", "settings"} specs, in stack order.
+    
+    A spec may also carry a "texture" ({"type", "name", "settings"}) created for the modifier.
+    No records are appended: the tools report the parameters they sent.
+    """
+    obj = active_object(args["object_name"])
+    _add_modifier_stack(obj, args["modifiers"])
+
+@op
+def apply_modifier(args, results):
+    """Apply a modifier of an object, making its effect permanent."""
+    obj = active_object(args["object_name"])
+    bpy.ops.object.modifier_apply(modifier=args["modifier_name"])
+
+# ===== ADVANCED MESH EDITING =====
+
+@op
+def create_mesh_from_vertices(args, results):
+    """Build a mesh from the packed sidecar written by advanced_tools.
+    
+    In-process callers may pass the packed arrays themselves as "arrays" instead.
+    """
+    name = args["name"]
+    vertex_count = args["vertex_count"]
+    face_count = args["face_count"]
+    corner_count = args["corner_count"]
+
+    mesh = bpy.data.meshes.new(name)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
+    if "arrays" in args:
+        coords, loop_start, loop_total, vertex_index = args["arrays"]
+    else:
+        with open(args["payload_path"], "rb") as payload:
+            coords = array.array("f")
+            coords.fromfile(payload, vertex_count * 3)
+            loop_start = array.array("i")
+            loop_start.fromfile(payload, face_count)
+            loop_total = array.array("i")
+            loop_total.fromfile(payload, face_count)
+            vertex_index = array.array("i")
+            vertex_index.fromfile(payload, corner_count)
+
+    mesh.vertices.add(vertex_count)
+    mesh.vertices.foreach_set("co", coords)
+    mesh.loops.add(corner_count)
+    mesh.loops.foreach_set("vertex_index", vertex_index)
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", loop_total)
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    results.append({"object": name, "type": "custom_mesh", "vertices": vertex_count, "faces": face_count})
+
+@op
+def extrude_face(args, results):
+    """Extrude one face of an object along Z."""
+    obj = bpy.data.objects[args["object_name"]]
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bm.faces.ensure_lookup_table()
+    extruded = bmesh.ops.extrude_discrete_faces(bm, faces=[bm.faces[args["face_index"]]])
+    bmesh.ops.translate(bm, vec=(0, 0, args["distance"]), verts=extruded["faces"][0].verts)
+    bm.to_mesh(obj.data)
+    bm.free()
+    results.append({"action": "extrude_face", "object": args["object_name"],
+                    "face_index": args["face_index"], "distance": args["distance"]})
+
+@op
+def inset_faces(args, results):
+    """Inset all faces of an object."""
+    obj = active_object(args["object_name"])
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.mesh.inset(thickness=args["thickness"], depth=args["depth"])
+    bpy.ops.object.mode_set(mode="OBJECT")
+    results.append({"action": "inset_faces", "object": args["object_name"],
+                    "thickness": args["thickness"], "depth": args["depth"]})
+
+@op
+def bevel_edges(args, results):
+    """Bevel all edges of an object."""
+    obj = active_object(args["object_name"])
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.mesh.bevel(offset=args["offset"], segments=args["segments"])
+    bpy.ops.object.mode_set(mode="OBJECT")
+    results.append({"action": "bevel_edges", "object": args["object_name"],
+                    "offset": args["offset"], "segments": args["segments"]})
+
+@op
+def loop_cut(args, results):
+    """Add loop cuts to an object."""
+    obj = active_object(args["object_name"])
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.loopcut_slide(MESH_OT_loopcut={"number_cuts": args["cuts"], "smoothness": args["smoothness"]})
+    bpy.ops.object.mode_set(mode="OBJECT")
+    results.append({"action": "loop_cut", "object": args["object_name"],
+                    "cuts": args["cuts"], "smoothness": args["smoothness"]})
+
+# ===== SUBDIVISION AND SMOOTHING =====
+
+def _smooth_coords(mesh, iterations, factor):
+    """Move every vertex toward the mean of its edge neighbours, iterations times, in one pass."""
+    vertex_count = len(mesh.vertices)
+    coords = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3).astype(np.float64)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    a, b = edges[0::2], edges[1::2]
+    degree = np.bincount(edges, minlength=vertex_count)
+    connected = degree > 0
+    for _ in range(iterations):
+        sums = np.zeros_like(coords)
+        np.add.at(sums, a, coords[b])
+        np.add.at(sums, b, coords[a])
+        coords[connected] += factor * (sums[connected] / degree[connected, None] - coords[connected])
+    mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+    mesh.update()
+
+def _get_triangles(mesh):
+    """Read a mesh as float64 (N, 3) coordinates and (M, 3) loop triangles."""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return coords.reshape(-1, 3).astype(np.float64), triangles.reshape(-1, 3)
+
+def _set_triangles(mesh, coords, triangles):
+    """Replace a mesh's geometry with (N, 3) coordinates and (M, 3) triangles."""
+    mesh.clear_geometry()
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.astype(np.float32).ravel())
+    mesh.loops.add(triangles.size)
+    mesh.loops.foreach_set("vertex_index", triangles.astype(np.int32).ravel())
+    mesh.polygons.add(len(triangles))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, triangles.size, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+def _loop_subdivide(coords, triangles):
+    """One level of Loop subdivision of a triangle mesh, on (N, 3) coords and (M, 3) triangles.
+    
+    Every edge gets one new vertex, found by deduplicating the sorted edge pairs of all
+    triangles, and each triangle is split into four. Interior points use Loop's weights
+    (3/8 for the edge ends and 1/8 for the opposite corners, beta for the old vertices);
+    boundary edges and vertices use the 1/2 and 3/4, 1/8 boundary rules.
+    """
+    vertex_count = len(coords)
+    triangle_count = len(triangles)
+    # Sides (0, 1), (1, 2), (2, 0) of every triangle, side-major, and the corner opposite each
+    sides = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    opposite = np.concatenate([triangles[:, 2], triangles[:, 0], triangles[:, 1]])
+    edges, side_edge = np.unique(np.sort(sides, axis=1), axis=0, return_inverse=True)
+    side_edge = side_edge.reshape(-1)
+    a, b = edges[:, 0], edges[:, 1]
+    boundary = np.bincount(side_edge, minlength=len(edges)) == 1
+
+    opposite_sums = np.zeros((len(edges), 3))
+    np.add.at(opposite_sums, side_edge, coords[opposite])
+    edge_points = np.where(boundary[:, None],
+                           0.5 * (coords[a] + coords[b]),
+                           0.375 * (coords[a] + coords[b]) + 0.125 * opposite_sums)
+
+    valence = np.bincount(edges.ravel(), minlength=vertex_count)
+    neighbour_sums = np.zeros_like(coords)
+    np.add.at(neighbour_sums, a, coords[b])
+    np.add.at(neighbour_sums, b, coords[a])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(valence == 3, 3.0 / 16.0, 3.0 / (8.0 * valence))
+    vertex_points = (1.0 - valence * beta)[:, None] * coords + beta[:, None] * neighbour_sums
+    vertex_points[valence == 0] = coords[valence == 0]
+
+    boundary_edges = edges[boundary]
+    if len(boundary_edges):
+        boundary_sums = np.zeros_like(coords)
+        np.add.at(boundary_sums, boundary_edges[:, 0], coords[boundary_edges[:, 1]])
+        np.add.at(boundary_sums, boundary_edges[:, 1], coords[boundary_edges[:, 0]])
+        on_boundary = np.bincount(boundary_edges.ravel(), minlength=vertex_count) > 0
+        vertex_points[on_boundary] = 0.75 * coords[on_boundary] + 0.125 * boundary_sums[on_boundary]
+
+    # New vertex index of the point on each side of every triangle
+    ab, bc, ca = (vertex_count + side_edge).reshape(3, triangle_count)
+    v0, v1, v2 = triangles.T
+    new_triangles = np.concatenate([
+        np.stack([v0, ab, ca], axis=1),
+        np.stack([v1, bc, ab], axis=1),
+        np.stack([v2, ca, bc], axis=1),
+        np.stack([ab, bc, ca], axis=1),
+    ])
+    return np.concatenate([vertex_points, edge_points]), new_triangles
+
+@op
+def loop_subdivide(args, results):
+    """Bake Loop subdivision into an object's mesh without a SUBSURF modifier.
+    
+    The mesh is read as triangles with foreach_get, subdivided in numpy and written
+    back with foreach_set. Without numpy a SUBSURF modifier is added and applied instead.
+    """
+    obj = active_object(args["object_name"])
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    mesh = obj.data
+    levels = args["levels"]
+    if np is None:
+        modifier = obj.modifiers.new(name="SubdivisionSurface", type="SUBSURF")
+        modifier.levels = levels
+        with object_context(obj):
+            bpy.ops.object.modifier_apply(modifier=modifier.name)
+    else:
+        coords, triangles = _get_triangles(mesh)
+        for _ in range(levels):
+            coords, triangles = _loop_subdivide(coords, triangles)
+        _set_triangles(mesh, coords, triangles)
+    results.append({"action": "subdivide_surface", "object": args["object_name"], "levels": levels,
+                    "baked": True, "vertices": len(mesh.vertices), "faces": len(mesh.polygons)})
+
+@op
+def smooth_object(args, results):
+    """Smooth all vertices of an object and shade it smooth.
+    
+    All iterations run on a numpy copy of the vertex coordinates, written back once,
+    instead of one vertices_smooth operator call per iteration.
+    """
+    obj = active_object(args["object_name"])
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    if np is not None:
+        _smooth_coords(obj.data, args["iterations"], args["factor"])
+    else:
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        for _ in range(args["iterations"]):
+            bmesh.ops.smooth_vert(bm, verts=bm.verts, factor=args["factor"],
+                                  use_axis_x=True, use_axis_y=True, use_axis_z=True)
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
+    bpy.ops.object.shade_smooth()
+    results.append({"action": "smooth_object", "object": args["object_name"],
+                    "iterations": args["iterations"], "factor": args["factor"]})
+
+@op
+def mesh_pipeline(args, results):
+    """Stack the modifiers of several mesh steps and bake them with a single convert.
+    
+    convert evaluates the whole stack in one depsgraph pass instead of one
+    modifier_apply (and one evaluation of everything above it) per step.
+    Modifiers already on the object are baked along with the new ones.
+    """
+    obj = active_object(args["object_name"])
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    _add_modifier_stack(obj, args["modifiers"])
+    with object_context(obj):
+        bpy.ops.object.convert(target="MESH")
+    mesh = obj.data
+    results.append({"action": "mesh_pipeline", "object": args["object_name"],
+                    "steps": [spec["type"] for spec in args["modifiers"]],
+                    "vertices": len(mesh.vertices), "faces": len(mesh.polygons)})
+
+def _cluster_vertices(coords, target):
+    """Assign vertices to grid cells, sizing the grid so about target cells are occupied."""
+    origin = coords.min(axis=0)
+    extent = max(float((coords.max(axis=0) - origin).max()), 1e-12)
+    low, high = extent / len(coords), extent
+    for _ in range(24):
+        cell = (low * high) ** 0.5
+        cells = np.floor((coords - origin) / cell).astype(np.int64)
+        _, clusters = np.unique(cells, axis=0, return_inverse=True)
+        count = clusters.max() + 1
+        if count > target:
+            low = cell
+        else:
+            high = cell
+    cells = np.floor((coords - origin) / high).astype(np.int64)
+    _, clusters = np.unique(cells, axis=0, return_inverse=True)
+    return clusters.reshape(-1)
+
+def _qem_decimate(coords, triangles, ratio):
+    """Decimate a triangle mesh by quadric-error-metric vertex clustering.
+    
+    Vertices are merged per grid cell; each cell's vertex is placed where the sum of its
+    members' face quadrics (area-weighted planes) is smallest, regularized toward the
+    members' mean and clamped to their bounds. Collapsed and duplicate triangles are dropped.
+    """
+    target = max(int(len(coords) * ratio), 4)
+    if target >= len(coords):
+        return coords, triangles
+    clusters = _cluster_vertices(coords, target)
+    cluster_count = clusters.max() + 1
+
+    corners = coords[triangles]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    areas = np.linalg.norm(normals, axis=1)
+    unit = np.divide(normals, areas[:, None], out=np.zeros_like(normals), where=areas[:, None] > 0)
+    planes = np.concatenate([unit, -np.einsum("ij,ij->i", unit, corners[:, 0])[:, None]], axis=1)
+    face_quadrics = 0.5 * areas[:, None, None] * planes[:, :, None] * planes[:, None, :]
+    quadrics = np.zeros((cluster_count, 4, 4))
+    for corner in range(3):
+        np.add.at(quadrics, clusters[triangles[:, corner]], face_quadrics)
+
+    sizes = np.bincount(clusters, minlength=cluster_count)[:, None]
+    means = np.zeros((cluster_count, 3))
+    np.add.at(means, clusters, coords)
+    means /= sizes
+    lower = np.full((cluster_count, 3), np.inf)
+    upper = np.full((cluster_count, 3), -np.inf)
+    np.minimum.at(lower, clusters, coords)
+    np.maximum.at(upper, clusters, coords)
+
+    a = quadrics[:, :3, :3]
+    b = -quadrics[:, :3, 3]
+    weight = 1e-3 * np.trace(a, axis1=1, axis2=2) + 1e-12
+    a = a + weight[:, None, None] * np.eye(3)
+    b = b + weight[:, None] * means
+    points = np.clip(np.linalg.solve(a, b[:, :, None])[:, :, 0], lower, upper)
+
+    merged = clusters[triangles]
+    kept = ((merged[:, 0] != merged[:, 1]) & (merged[:, 1] != merged[:, 2])
+            & (merged[:, 2] != merged[:, 0]))
+    merged = merged[kept]
+    _, first = np.unique(np.sort(merged, axis=1), axis=0, return_index=True)
+    merged = merged[np.sort(first)]
+    used, merged = np.unique(merged, return_inverse=True)
+    return points[used], merged.reshape(-1, 3)
+
+@op
+def qem_decimate(args, results):
+    """Decimate an object's mesh in numpy with quadric-error vertex clustering.
+    
+    Reads the mesh as loop triangles with foreach_get and writes the simplified
+    triangles back with foreach_set, without a DECIMATE modifier. Without numpy a
+    COLLAPSE DECIMATE modifier is added and applied instead.
+    """
+    obj = active_object(args["object_name"])
+    if obj.mode != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+    mesh = obj.data
+    if np is None:
+        modifier = obj.modifiers.new(name="Decimate", type="DECIMATE")
+        modifier.ratio = args["ratio"]
+        with object_context(obj):
+            bpy.ops.object.modifier_apply(modifier=modifier.name)
+    else:
+        coords, triangles = _get_triangles(mesh)
+        coords, triangles = _qem_decimate(coords, triangles, args["ratio"])
+        _set_triangles(mesh, coords, triangles)
+    results.append({"action": "decimate_object", "object": args["object_name"], "ratio": args["ratio"],
+                    "backend": "qem", "vertices": len(mesh.vertices), "faces": len(mesh.polygons)})
+
+# quads_convert_to_tris operator method -> bmesh.ops.triangulate method
+TRIANGULATE_QUAD_METHODS = {"FIXED_ALTERNATE": "ALTERNATE", "SHORTEST_DIAGONAL": "SHORT_EDGE", "LONGEST_DIAGONAL": "LONG_EDGE"}
+TRIANGULATE_NGON_METHODS = {"CLIP": "EAR_CLIP"}
+
+@op
+def triangulate_mesh(args, results):
+    """Triangulate all faces of an object with bmesh, without entering edit mode."""
+    obj = bpy.data.objects[args["object_name"]]
+    if obj.mode != "OBJECT":
+        bpy.context.view_layer.objects.active = obj
+        bpy.ops.object.mode_set(mode="OBJECT")
+    quad_method = TRIANGULATE_QUAD_METHODS.get(args["quad_method"], args["quad_method"])
+    ngon_method = TRIANGULATE_NGON_METHODS.get(args["ngon_method"], args["ngon_method"])
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method=quad_method, ngon_method=ngon_method)
+    bm.to_mesh(obj.data)
+    bm.free()
+    obj.data.update()
+    results.append({"action": "triangulate_mesh", "object": args["object_name"],
+                    "quad_method": args["quad_method"], "ngon_method": args["ngon_method"]})
+
+# Transform attribute -> (tool action, result key) for set_transforms records
+TRANSFORM_ACTIONS = {
+    "location": ("move_object", "location"),
+    "scale": ("scale_object", "scale"),
+    "rotation_euler": ("rotate_object", "rotation"),
+}
+
+@op
+def set_transforms(args, results):
+    """Assign location/scale/rotation_euler values to objects by name."""
+    for object_name, attributes in args["transforms"].items():
+        obj = bpy.data.objects[object_name]
+        for attribute, value in attributes.items():
+            setattr(obj, attribute, value)
+            action, key = TRANSFORM_ACTIONS[attribute]
+            results.append({"action": action, "object": object_name, key: value})
+
+# ===== BOOLEAN OPERATIONS =====
+
+# Boolean modifier operation -> action name in result records
+BOOLEAN_ACTIONS = {"UNION": "boolean_union", "DIFFERENCE": "boolean_difference", "INTERSECT": "boolean_intersection"}
+
+@op
+def boolean(args, results):
+    """Apply a UNION/DIFFERENCE/INTERSECT Boolean of object2 onto object1 and remove object2."""
+    obj1 = bpy.data.objects[args["object1_name"]]
+    obj2 = bpy.data.objects[args["object2_name"]]
+    bpy.context.view_layer.objects.active = obj1
+    modifier = obj1.modifiers.new(name="Boolean", type="BOOLEAN")
+    modifier.operation = args["operation"]
+    modifier.object = obj2
+    solver = args["solver"]
+    # Blender 5.0 renamed the FAST solver to FLOAT
+    if solver == "FAST" and "FAST" not in modifier.bl_rna.properties["solver"].enum_items.keys():
+        solver = "FLOAT"
+    modifier.solver = solver
+    bpy.ops.object.modifier_apply(modifier=modifier.name)
+    obj1.name = args["result_name"]
+    bpy.data.objects.remove(obj2, do_unlink=True)
+    results.append({"action": BOOLEAN_ACTIONS[args["operation"]], "result_object": args["result_name"],
+                    "input_objects": [args["object1_name"], args["object2_name"]]})
+
+@op
+def duplicate_object(args, results):
+    """Copy an object (and its data) with a location offset."""
+    obj = bpy.data.objects[args["object_name"]]
+    offset = args["offset"]
+    new_obj = obj.copy()
+    new_obj.data = obj.data.copy()
+    new_obj.name = args["new_name"]
+    new_obj.location = (obj.location.x + offset[0], obj.location.y + offset[1], obj.location.z + offset[2])
+    bpy.context.collection.objects.link(new_obj)
+    results.append({"action": "duplicate_object", "original": args["object_name"],
+                    "duplicate": args["new_name"], "offset": offset})
+
+@op
+def join_objects(args, results):
+    """Join objects into the first one and rename it."""
+    objects_to_join = [bpy.data.objects[name] for name in args["object_names"]]
+    bpy.ops.object.select_all(action="DESELECT")
+    for obj in objects_to_join:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = objects_to_join[0]
+    bpy.ops.object.join()
+    bpy.context.active_object.name = args["result_name"]
+    results.append({"action": "join_objects", "input_objects": args["object_names"],
+                    "result_object": args["result_name"]})
+
+@op
+def separate_object_by_loose_parts(args, results):
+    """Split an object into its loose parts."""
+    obj = active_object(args["object_name"])
+    bpy.ops.object.mode_set(mode="EDIT")
+    bpy.ops.mesh.select_all(action="SELECT")
+    bpy.ops.mesh.separate(type="LOOSE")
+    bpy.ops.object.mode_set(mode="OBJECT")
+    separated_objects = [o.name for o in bpy.context.selected_objects]
+    results.append({"action": "separate_loose_parts", "original_object": args["object_name"],
+                    "separated_objects": separated_objects})
+
+# ===== MATERIALS =====
+
+def _new_bsdf_material(name):
+    """Create a node-based material and return it with its Principled BSDF node."""
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+    return mat, mat.node_tree.nodes["Principled BSDF"]
+
+def set_inputs(node, params):
+    """Assign shader node input default values from an {input name: value} dict."""
+    inputs = node.inputs
+    for key, value in params.items():
+        inputs[key].default_value = value
+
+# Fixed inputs of the glass and metal presets, merged under their parameters
+GLASS_INPUTS = {"Metallic": 0.0, "Roughness": 0.0, "Alpha": 0.1}
+METAL_INPUTS = {"Metallic": 1.0}
+
+@op
+def create_material(args, results):
+    """Create a Principled BSDF material with basic properties."""
+    _basic_material(args)
+    results.append({"action": "create_material", "material": args["name"], "base_color": args["base_color"],
+                    "metallic": args["metallic"], "roughness": args["roughness"]})
+
+def _basic_material(args):
+    """Create the material described by create_material args and return it."""
+    mat, bsdf = _new_bsdf_material(args["name"])
+    set_inputs(bsdf, {"Base Color": args["base_color"], "Metallic": args["metallic"],
+                      "Roughness": args["roughness"], "Emission Strength": args["emission_strength"]})
+    return mat
+
+def _assign_material(obj, mat):
+    """Put a material in an object's first material slot."""
+    if obj.data.materials:
+        obj.data.materials[0] = mat
+    else:
+        obj.data.materials.append(mat)
+
+@op
+def apply_material_to_object(args, results):
+    """Assign a material to an object's first material slot."""
+    _assign_material(bpy.data.objects[args["object_name"]], bpy.data.materials[args["material_name"]])
+    results.append({"action": "apply_material", "object": args["object_name"], "material": args["material_name"]})
+
+@op
+def create_and_apply_material(args, results):
+    """Create a material and assign it to an object, recording both in one result."""
+    mat = _basic_material(args)
+    _assign_material(bpy.data.objects[args["object_name"]], mat)
+    # Blender may have renamed the material if the name was taken
+    results.append({"action": "create_and_apply_material", "object": args["object_name"], "material": mat.name,
+                    "base_color": args["base_color"], "metallic": args["metallic"], "roughness": args["roughness"]})
+
+@op
+def create_glass_material(args, results):
+    """Create a transparent glass material."""
+    mat, bsdf = _new_bsdf_material(args["name"])
+    set_inputs(bsdf, {**GLASS_INPUTS, "Base Color": args["color"], "IOR": args["ior"],
+                      "Transmission": args["transmission"]})
+    mat.blend_method = "BLEND"
+    results.append({"action": "create_glass_material", "material": args["name"],
+                    "ior": args["ior"], "transmission": args["transmission"]})
+
+@op
+def create_metal_material(args, results):
+    """Create a fully metallic material."""
+    mat, bsdf = _new_bsdf_material(args["name"])
+    set_inputs(bsdf, {**METAL_INPUTS, "Base Color": args["color"], "Roughness": args["roughness"]})
+    results.append({"action": "create_metal_material", "material": args["name"],
+                    "color": args["color"], "roughness": args["roughness"]})
+
+@op
+def create_emission_material(args, results):
+    """Create an emissive material."""
+    mat, bsdf = _new_bsdf_material(args["name"])
+    set_inputs(bsdf, {"Base Color": args["color"], "Emission": args["color"], "Emission Strength": args["strength"]})
+    results.append({"action": "create_emission_material", "material": args["name"],
+                    "color": args["color"], "strength": args["strength"]})
+
+@op
+def add_noise_texture(args, results):
+    """Drive the Base Color of an object's material with a noise texture."""
+    object_name = args["object_name"]
+    obj = bpy.data.objects[object_name]
+    if not obj.data.materials:
+        mat = bpy.data.materials.new(name=object_name + "_Material")
+        mat.use_nodes = True
+        obj.data.materials.append(mat)
+    else:
+        mat = obj.data.materials[0]
+        if not mat.use_nodes:
+            mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    bsdf = nodes["Principled BSDF"]
+    noise_tex = nodes.new(type="ShaderNodeTexNoise")
+    set_inputs(noise_tex, {"Scale": args["scale"], "Detail": args["detail"],
+                           "Roughness": args["roughness"], "Distortion": args["distortion"]})
+    mat.node_tree.links.new(noise_tex.outputs["Fac"], bsdf.inputs["Base Color"])
+    results.append({"action": "add_noise_texture", "object": object_name,
+                    "scale": args["scale"], "detail": args["detail"]})
+
+def object_context(obj):
+    """Context for running operators on obj alone.
+    
+    Uses Context.temp_override (Blender 3.2+) so operators see obj without the
+    view layer's active object being changed; older versions make it active.
+    """
+    if hasattr(bpy.context, "temp_override"):
+        return bpy.context.temp_override(active_object=obj, object=obj, selected_objects=[obj],
+                                         selected_editable_objects=[obj])
+    bpy.context.view_layer.objects.active = obj
+    return contextlib.nullcontext()
+
+@op
+def add_uv_mapping(args, results):
+    """Unwrap an object's UVs."""
+    obj = bpy.data.objects[args["object_name"]]
+    mesh = obj.data
+    # Select everything through the mesh arrays, which edit mode picks up, instead of select_all
+    for elements in (mesh.vertices, mesh.edges, mesh.polygons):
+        elements.foreach_set("select", [True] * len(elements))
+    # There is no bmesh equivalent of unwrap, so it stays an operator
+    with object_context(obj):
+        bpy.ops.object.mode_set(mode="EDIT")
+        bpy.ops.uv.unwrap(method="ANGLE_BASED", margin=0.001)
+        bpy.ops.object.mode_set(mode="OBJECT")
+    results.append({"action": "add_uv_mapping", "object": args["object_name"]})
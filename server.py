@@ -8,14 +8,28 @@ from typing import Any, Dict, List, Optional, Tuple
 import logging
 import os
 import json
-from blender_integration import blender_manager
+from blender_integration import get_blender_manager
 
-# Import advanced tool modules
-from advanced_tools import *
-from boolean_operations import *
-from subdivide_smooth import *
-from materials import *
-from modifiers import *
+# Import advanced tool modules. Tool functions are imported by name rather than with *,
+# so a tool defined in this module cannot silently shadow the function it should call
+from advanced_tools import (
+    create_mesh_from_vertices, extrude_face, inset_faces, bevel_edges, loop_cut,
+    scale_object, rotate_object, move_object
+)
+from boolean_operations import (
+    boolean_union, boolean_difference, boolean_intersection, duplicate_object,
+    join_objects, separate_object_by_loose_parts
+)
+from subdivide_smooth import (
+    subdivide_surface, smooth_object, remesh_object, decimate_object,
+    add_edge_split, triangulate_mesh, mesh_pipeline
+)
+import materials
+from modifiers import (
+    add_array_modifier, add_mirror_modifier, add_solidify_modifier, add_bevel_modifier,
+    add_screw_modifier, add_wave_modifier, add_displacement_modifier, apply_modifier,
+    batch_add_modifiers
+)
 
 # Configure logging to stderr to avoid interfering with stdio
 logging.basicConfig(
@@ -59,6 +73,44 @@ def list_available_tools() -> List[str]:
         "set_render_settings"
     ]
 
+def _create_primitive(kind: str, operator: str, params: Dict[str, float],
+                      location: Tuple[float, float, float], name: str) -> Dict[str, Any]:
+    """Run the ops_library create_primitive operation (queued if a batch is open).
+    
+    Only the parameters are sent; Blender runs the library's precompiled code.
+    
+    Args:
+        kind: Primitive type, e.g. "cube"
+        operator: bpy.ops.mesh operator that adds the primitive
+        params: Keyword arguments for the operator
+        location: Location as (x, y, z) tuple
+        name: Name for the new object
+    
+    Returns:
+        Dictionary with execution results
+    """
+    return get_blender_manager().run_op("create_primitive", {
+        "kind": kind,
+        "operator": operator,
+        "params": params,
+        "location": list(location),
+        "name": name
+    })
+
+# Output directories already created by _ensure_directory()
+_created_directories = set()
+
+def _ensure_directory(filepath: str):
+    """Create the directory of an output file once; bare file names need none.
+    
+    Args:
+        filepath: Path of the file about to be written
+    """
+    directory = os.path.dirname(filepath)
+    if directory and directory not in _created_directories:
+        os.makedirs(directory, exist_ok=True)
+        _created_directories.add(directory)
+
 @mcp.tool()
 def create_cube(size: float = 2.0, location: Tuple[float, float, float] = (0, 0, 0), name: str = "Cube") -> Dict[str, Any]:
     """Create a cube in the Blender scene.
@@ -71,14 +123,7 @@ def create_cube(size: float = 2.0, location: Tuple[float, float, float] = (0, 0,
     Returns:
         Dictionary with creation result
     """
-    operations = [
-        f'bpy.ops.mesh.primitive_cube_add(size={size}, location={location})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cube", "size": {size}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = _create_primitive("cube", "primitive_cube_add", {"size": size}, location, name)
     
     return {
         "success": result["success"],
@@ -101,14 +146,7 @@ def create_sphere(radius: float = 1.0, location: Tuple[float, float, float] = (0
     Returns:
         Dictionary with creation result
     """
-    operations = [
-        f'bpy.ops.mesh.primitive_uv_sphere_add(radius={radius}, location={location})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "sphere", "radius": {radius}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = _create_primitive("sphere", "primitive_uv_sphere_add", {"radius": radius}, location, name)
     
     return {
         "success": result["success"],
@@ -132,14 +170,7 @@ def create_cylinder(radius: float = 1.0, depth: float = 2.0, location: Tuple[flo
     Returns:
         Dictionary with creation result
     """
-    operations = [
-        f'bpy.ops.mesh.primitive_cylinder_add(radius={radius}, depth={depth}, location={location})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cylinder", "radius": {radius}, "depth": {depth}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = _create_primitive("cylinder", "primitive_cylinder_add", {"radius": radius, "depth": depth}, location, name)
     
     return {
         "success": result["success"],
@@ -162,14 +193,7 @@ def create_plane(size: float = 2.0, location: Tuple[float, float, float] = (0, 0
     Returns:
         Dictionary with creation result
     """
-    operations = [
-        f'bpy.ops.mesh.primitive_plane_add(size={size}, location={location})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "plane", "size": {size}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = _create_primitive("plane", "primitive_plane_add", {"size": size}, location, name)
     
     return {
         "success": result["success"],
@@ -194,14 +218,7 @@ def create_cone(radius1: float = 1.0, radius2: float = 0.0, depth: float = 2.0,
     Returns:
         Dictionary with creation result
     """
-    operations = [
-        f'bpy.ops.mesh.primitive_cone_add(radius1={radius1}, radius2={radius2}, depth={depth}, location={location})',
-        f'bpy.context.active_object.name = "{name}"',
-        f'results.append({{"object": "{name}", "type": "cone", "radius1": {radius1}, "radius2": {radius2}, "depth": {depth}, "location": {location}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = _create_primitive("cone", "primitive_cone_add", {"radius1": radius1, "radius2": radius2, "depth": depth}, location, name)
     
     return {
         "success": result["success"],
@@ -215,14 +232,7 @@ def create_cone(radius1: float = 1.0, radius2: float = 0.0, depth: float = 2.0,
 @mcp.tool()
 def clear_scene() -> Dict[str, Any]:
     """Clear all objects from the Blender scene."""
-    operations = [
-        'bpy.ops.object.select_all(action="SELECT")',
-        'bpy.ops.object.delete(use_global=False, confirm=False)',
-        'results.append({"action": "clear_scene", "status": "completed"})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().reset_scene()
     
     return {
         "success": result["success"],
@@ -245,15 +255,14 @@ def save_blend_file(filepath: str) -> Dict[str, Any]:
         filepath += '.blend'
     
     # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    _ensure_directory(filepath)
     
     operations = [
-        f'bpy.ops.wm.save_as_mainfile(filepath=r"{filepath}")',
-        f'results.append({{"action": "save_blend_file", "filepath": r"{filepath}", "status": "completed"}})'
+        'bpy.ops.wm.save_as_mainfile(filepath=PARAMS["filepath"])',
+        'results.append({"action": "save_blend_file", "filepath": PARAMS["filepath"], "status": "completed"})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={"filepath": filepath})
     
     return {
         "success": result["success"],
@@ -289,25 +298,28 @@ def export_model(filepath: str, format: str = "obj", selected_only: bool = False
         filepath += f'.{format}'
     
     # Ensure directory exists
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    _ensure_directory(filepath)
     
     # Generate export operation based on format
     if format == 'obj':
-        export_op = f'bpy.ops.export_scene.obj(filepath=r"{filepath}", use_selection={selected_only})'
+        export_op = 'bpy.ops.export_scene.obj(filepath=PARAMS["filepath"], use_selection=PARAMS["selected_only"])'
     elif format == 'fbx':
-        export_op = f'bpy.ops.export_scene.fbx(filepath=r"{filepath}", use_selection={selected_only})'
+        export_op = 'bpy.ops.export_scene.fbx(filepath=PARAMS["filepath"], use_selection=PARAMS["selected_only"])'
     elif format == 'stl':
-        export_op = f'bpy.ops.export_mesh.stl(filepath=r"{filepath}", use_selection={selected_only})'
+        export_op = 'bpy.ops.export_mesh.stl(filepath=PARAMS["filepath"], use_selection=PARAMS["selected_only"])'
     elif format == 'ply':
-        export_op = f'bpy.ops.export_mesh.ply(filepath=r"{filepath}", use_selection={selected_only})'
+        export_op = 'bpy.ops.export_mesh.ply(filepath=PARAMS["filepath"], use_selection=PARAMS["selected_only"])'
     
     operations = [
         export_op,
-        f'results.append({{"action": "export_model", "filepath": r"{filepath}", "format": "{format}", "status": "completed"}})'
+        'results.append({"action": "export_model", "filepath": PARAMS["filepath"], "format": PARAMS["format"], "status": "completed"})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={
+        "filepath": filepath,
+        "format": format,
+        "selected_only": selected_only
+    })
     
     return {
         "success": result["success"],
@@ -318,199 +330,119 @@ def export_model(filepath: str, format: str = "obj", selected_only: bool = False
         "errors": result.get("stderr", "") if not result["success"] else None
     }
 
-# ===== ADVANCED MESH EDITING TOOLS =====
+# ===== BATCHING =====
 
 @mcp.tool()
-def create_mesh_from_vertices(vertices: List[Tuple[float, float, float]], 
-                             faces: List[List[int]], 
-                             name: str = "CustomMesh") -> Dict[str, Any]:
-    """Create a custom mesh from vertices and faces."""
-    return create_mesh_from_vertices(vertices, faces, name)
-
-@mcp.tool()
-def extrude_face(object_name: str, face_index: int, distance: float = 1.0) -> Dict[str, Any]:
-    """Extrude a specific face of an object."""
-    return extrude_face(object_name, face_index, distance)
-
-@mcp.tool()
-def inset_faces(object_name: str, thickness: float = 0.1, depth: float = 0.0) -> Dict[str, Any]:
-    """Inset faces of an object."""
-    return inset_faces(object_name, thickness, depth)
-
-@mcp.tool()
-def bevel_edges(object_name: str, offset: float = 0.1, segments: int = 1) -> Dict[str, Any]:
-    """Bevel edges of an object."""
-    return bevel_edges(object_name, offset, segments)
+def begin_batch() -> Dict[str, Any]:
+    """Queue the following tool calls instead of running each one in Blender.
+    
+    Queued tools report success without Blender output; commit_batch() runs them
+    all in a single Blender run and returns their combined result.
+    
+    Returns:
+        Dictionary with batch status
+    """
+    started = get_blender_manager().begin_batch()
+    return {
+        "success": started,
+        "action": "begin_batch",
+        "errors": None if started else "A batch is already open"
+    }
 
 @mcp.tool()
-def loop_cut(object_name: str, cuts: int = 1, smoothness: float = 0.0) -> Dict[str, Any]:
-    """Add loop cuts to an object."""
-    return loop_cut(object_name, cuts, smoothness)
+def commit_batch(parallel: bool = False) -> Dict[str, Any]:
+    """Run all tool calls queued since begin_batch() in one Blender run.
+    
+    With parallel=True, calls that build separate new objects (created, edited and
+    transformed within the batch) run on several Blender workers at once.
+    """
+    result = get_blender_manager().commit(parallel)
+    
+    return {
+        "success": result["success"],
+        "action": "commit_batch",
+        "results": result.get("results", []),
+        "blender_output": result.get("stdout", ""),
+        "errors": result.get("stderr", "") if not result["success"] else None
+    }
 
 @mcp.tool()
-def scale_object(object_name: str, scale: Tuple[float, float, float] = (1.0, 1.0, 1.0)) -> Dict[str, Any]:
-    """Scale an object along different axes."""
-    return scale_object(object_name, scale)
+def cancel_batch() -> Dict[str, Any]:
+    """Drop all tool calls queued since begin_batch() without running them."""
+    get_blender_manager().cancel_batch()
+    return {"success": True, "action": "cancel_batch"}
 
-@mcp.tool()
-def rotate_object(object_name: str, rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0)) -> Dict[str, Any]:
-    """Rotate an object."""
-    return rotate_object(object_name, rotation)
+# ===== ADVANCED MESH EDITING TOOLS =====
 
-@mcp.tool()
-def move_object(object_name: str, location: Tuple[float, float, float]) -> Dict[str, Any]:
-    """Move an object to a new location."""
-    return move_object(object_name, location)
+# The tool modules' functions are registered as they are: their signatures and
+# docstrings describe the tools, and calls skip a forwarding wrapper
+for _tool in (create_mesh_from_vertices, extrude_face, inset_faces, bevel_edges, loop_cut,
+              scale_object, rotate_object, move_object):
+    mcp.tool()(_tool)
 
 # ===== BOOLEAN OPERATIONS =====
 
-@mcp.tool()
-def boolean_union(object1_name: str, object2_name: str, result_name: str = "BooleanResult") -> Dict[str, Any]:
-    """Perform boolean union operation between two objects."""
-    return boolean_union(object1_name, object2_name, result_name)
-
-@mcp.tool()
-def boolean_difference(object1_name: str, object2_name: str, result_name: str = "BooleanResult") -> Dict[str, Any]:
-    """Perform boolean difference operation (subtract object2 from object1)."""
-    return boolean_difference(object1_name, object2_name, result_name)
-
-@mcp.tool()
-def boolean_intersection(object1_name: str, object2_name: str, result_name: str = "BooleanResult") -> Dict[str, Any]:
-    """Perform boolean intersection operation between two objects."""
-    return boolean_intersection(object1_name, object2_name, result_name)
-
-@mcp.tool()
-def duplicate_object(object_name: str, new_name: str = None, offset: Tuple[float, float, float] = (0, 0, 0)) -> Dict[str, Any]:
-    """Duplicate an object."""
-    return duplicate_object(object_name, new_name, offset)
-
-@mcp.tool()
-def join_objects(object_names: List[str], result_name: str = "JoinedObject") -> Dict[str, Any]:
-    """Join multiple objects into one."""
-    return join_objects(object_names, result_name)
-
-@mcp.tool()
-def separate_object_by_loose_parts(object_name: str) -> Dict[str, Any]:
-    """Separate an object into loose parts."""
-    return separate_object_by_loose_parts(object_name)
+for _tool in (boolean_union, boolean_difference, boolean_intersection, duplicate_object,
+              join_objects, separate_object_by_loose_parts):
+    mcp.tool()(_tool)
 
 # ===== SUBDIVISION AND SMOOTHING =====
 
-@mcp.tool()
-def subdivide_surface(object_name: str, levels: int = 1, render_levels: int = None) -> Dict[str, Any]:
-    """Apply subdivision surface modifier to an object."""
-    return subdivide_surface(object_name, levels, render_levels)
-
-@mcp.tool()
-def smooth_object(object_name: str, iterations: int = 1, factor: float = 0.5) -> Dict[str, Any]:
-    """Apply smooth shading and smoothing to an object."""
-    return smooth_object(object_name, iterations, factor)
-
-@mcp.tool()
-def remesh_object(object_name: str, octree_depth: int = 4, scale: float = 0.99, mode: str = "BLOCKS") -> Dict[str, Any]:
-    """Apply remesh modifier to create uniform topology."""
-    return remesh_object(object_name, octree_depth, scale, mode)
-
-@mcp.tool()
-def decimate_object(object_name: str, ratio: float = 0.5, decimate_type: str = "COLLAPSE") -> Dict[str, Any]:
-    """Reduce mesh complexity using decimation."""
-    return decimate_object(object_name, ratio, decimate_type)
-
-@mcp.tool()
-def add_edge_split(object_name: str, split_angle: float = 0.523599) -> Dict[str, Any]:
-    """Add edge split modifier for sharp edges."""
-    return add_edge_split(object_name, split_angle)
-
-@mcp.tool()
-def triangulate_mesh(object_name: str, quad_method: str = "BEAUTY", ngon_method: str = "BEAUTY") -> Dict[str, Any]:
-    """Triangulate mesh faces."""
-    return triangulate_mesh(object_name, quad_method, ngon_method)
+for _tool in (subdivide_surface, smooth_object, remesh_object, decimate_object,
+              add_edge_split, triangulate_mesh, mesh_pipeline):
+    mcp.tool()(_tool)
 
 # ===== MATERIALS AND TEXTURES =====
 
 @mcp.tool()
 def create_material(name: str, base_color: Tuple[float, float, float, float] = (0.8, 0.2, 0.2, 1.0), 
                    metallic: float = 0.0, roughness: float = 0.5, emission_strength: float = 0.0) -> Dict[str, Any]:
-    """Create a new material with basic properties."""
-    return create_material(name, base_color, metallic, roughness, emission_strength)
+    """Create a new material with basic properties. To also assign it to an object, prefer create_and_apply_material."""
+    return materials.create_material(name, base_color, metallic, roughness, emission_strength).to_dict()
 
 @mcp.tool()
 def apply_material_to_object(object_name: str, material_name: str) -> Dict[str, Any]:
-    """Apply a material to an object."""
-    return apply_material_to_object(object_name, material_name)
+    """Apply an existing material to an object. For a new material, use create_and_apply_material instead."""
+    return materials.apply_material_to_object(object_name, material_name).to_dict()
+
+@mcp.tool()
+def create_and_apply_material(object_name: str, name: str, base_color: Tuple[float, float, float, float] = (0.8, 0.2, 0.2, 1.0),
+                              metallic: float = 0.0, roughness: float = 0.5, emission_strength: float = 0.0) -> Dict[str, Any]:
+    """Create a new material and apply it to an object in a single step."""
+    return materials.create_and_apply_material(object_name, name, base_color, metallic, roughness, emission_strength).to_dict()
 
 @mcp.tool()
 def create_glass_material(name: str, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), 
                          ior: float = 1.45, transmission: float = 1.0) -> Dict[str, Any]:
     """Create a glass material."""
-    return create_glass_material(name, color, ior, transmission)
+    return materials.create_glass_material(name, color, ior, transmission).to_dict()
 
 @mcp.tool()
 def create_metal_material(name: str, color: Tuple[float, float, float, float] = (0.7, 0.7, 0.7, 1.0),
                          roughness: float = 0.2) -> Dict[str, Any]:
     """Create a metallic material."""
-    return create_metal_material(name, color, roughness)
+    return materials.create_metal_material(name, color, roughness).to_dict()
 
 @mcp.tool()
 def create_emission_material(name: str, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0),
                            strength: float = 5.0) -> Dict[str, Any]:
     """Create an emissive/glowing material."""
-    return create_emission_material(name, color, strength)
+    return materials.create_emission_material(name, color, strength).to_dict()
 
 @mcp.tool()
 def add_noise_texture(object_name: str, scale: float = 5.0, detail: float = 2.0, 
                      roughness: float = 0.5, distortion: float = 0.0) -> Dict[str, Any]:
     """Add procedural noise texture to an object's material."""
-    return add_noise_texture(object_name, scale, detail, roughness, distortion)
+    return materials.add_noise_texture(object_name, scale, detail, roughness, distortion).to_dict()
 
 @mcp.tool()
 def add_uv_mapping(object_name: str) -> Dict[str, Any]:
     """Add UV mapping to an object."""
-    return add_uv_mapping(object_name)
+    return materials.add_uv_mapping(object_name).to_dict()
 
 # ===== MODIFIERS =====
 
-@mcp.tool()
-def add_array_modifier(object_name: str, count: int = 3, offset: Tuple[float, float, float] = (2.0, 0.0, 0.0),
-                      use_relative_offset: bool = True) -> Dict[str, Any]:
-    """Add array modifier to duplicate objects."""
-    return add_array_modifier(object_name, count, offset, use_relative_offset)
-
-@mcp.tool()
-def add_mirror_modifier(object_name: str, axis: str = "X", use_bisect: bool = False, 
-                       merge_threshold: float = 0.001) -> Dict[str, Any]:
-    """Add mirror modifier to create symmetrical objects."""
-    return add_mirror_modifier(object_name, axis, use_bisect, merge_threshold)
-
-@mcp.tool()
-def add_solidify_modifier(object_name: str, thickness: float = 0.1, offset: float = -1.0) -> Dict[str, Any]:
-    """Add solidify modifier to give thickness to surfaces."""
-    return add_solidify_modifier(object_name, thickness, offset)
-
-@mcp.tool()
-def add_bevel_modifier(object_name: str, width: float = 0.1, segments: int = 1, 
-                      limit_method: str = "NONE") -> Dict[str, Any]:
-    """Add bevel modifier for rounded edges."""
-    return add_bevel_modifier(object_name, width, segments, limit_method)
-
-@mcp.tool()
-def add_screw_modifier(object_name: str, angle: float = 6.28318, screw: float = 0.0, 
-                      iterations: int = 1, axis: str = "Z") -> Dict[str, Any]:
-    """Add screw modifier for spiral/helical shapes."""
-    return add_screw_modifier(object_name, angle, screw, iterations, axis)
-
-@mcp.tool()
-def add_wave_modifier(object_name: str, height: float = 0.5, width: float = 1.5, 
-                     speed: float = 1.0, start_position_object: float = 0.0) -> Dict[str, Any]:
-    """Add wave modifier for wave distortion."""
-    return add_wave_modifier(object_name, height, width, speed, start_position_object)
-
-@mcp.tool()
-def add_displacement_modifier(object_name: str, strength: float = 1.0, mid_level: float = 0.5) -> Dict[str, Any]:
-    """Add displacement modifier with noise texture."""
-    return add_displacement_modifier(object_name, strength, mid_level)
-
-@mcp.tool()
-def apply_modifier(object_name: str, modifier_name: str) -> Dict[str, Any]:
-    """Apply a modifier to make it permanent."""
-    return apply_modifier(object_name, modifier_name)
\ No newline at end of file
+for _tool in (add_array_modifier, add_mirror_modifier, add_solidify_modifier, add_bevel_modifier,
+              add_screw_modifier, add_wave_modifier, add_displacement_modifier, apply_modifier,
+              batch_add_modifiers):
+    mcp.tool()(_tool)
\ No newline at end of file
@@ -1,37 +1,65 @@
 """
 Subdivision and smoothing tools for detailed mesh work
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 import logging
-from blender_integration import blender_manager
+import math
+from blender_integration import get_blender_manager, noop_result
 
 logger = logging.getLogger(__name__)
 
-def subdivide_surface(object_name: str, levels: int = 1, render_levels: int = None) -> Dict[str, Any]:
+def subdivide_surface(object_name: str, levels: int = 1, render_levels: int = None, bake: bool = False) -> Dict[str, Any]:
     """Apply subdivision surface modifier to an object.
     
+    With bake=True the mesh is instead subdivided in place with Loop subdivision
+    (triangulating it), computed on numpy arrays in Blender without a modifier.
+    
     Args:
         object_name: Name of the object to subdivide
         levels: Subdivision levels for viewport
         render_levels: Subdivision levels for rendering (uses levels if None)
+        bake: Bake `levels` levels of Loop subdivision into the mesh
     
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result ("skipped" when baking 0 levels, after only checking the object)
     """
+    if levels < 0:
+        return {
+            "success": False,
+            "error": f"Subdivision levels must not be negative: {levels}"
+        }
+    
+    if bake and levels == 0:
+        return noop_result("subdivide_surface", object_name, {"levels": levels, "bake": True})
+    
+    if bake:
+        result = get_blender_manager().run_op("loop_subdivide", {
+            "object_name": object_name,
+            "levels": levels
+        })
+        
+        return {
+            "success": result["success"],
+            "action": "subdivide_surface",
+            "object_name": object_name,
+            "parameters": {"levels": levels, "bake": True},
+            "blender_output": result.get("stdout", ""),
+            "errors": result.get("stderr", "") if not result["success"] else None
+        }
+    
     if render_levels is None:
         render_levels = levels
     
     operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="SubdivisionSurface", type="SUBSURF")',
-        f'modifier.levels = {levels}',
-        f'modifier.render_levels = {render_levels}',
-        f'results.append({{"action": "subdivide_surface", "object": "{object_name}", "levels": {levels}, "render_levels": {render_levels}}})'
+        'add_modifier(active_object(PARAMS["object_name"]), "SubdivisionSurface", "SUBSURF", levels=PARAMS["levels"], render_levels=PARAMS["render_levels"])',
+        'results.append({"action": "subdivide_surface", "object": PARAMS["object_name"], "levels": PARAMS["levels"], "render_levels": PARAMS["render_levels"]})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={
+        "object_name": object_name,
+        "levels": levels,
+        "render_levels": render_levels
+    })
     
     return {
         "success": result["success"],
@@ -53,20 +81,7 @@ def smooth_object(object_name: str, iterations: int = 1, factor: float = 0.5) ->
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.select_all(action="SELECT")',
-        f'for i in range({iterations}):',
-        f'    bpy.ops.mesh.vertices_smooth(factor={factor})',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'bpy.ops.object.shade_smooth()',
-        f'results.append({{"action": "smooth_object", "object": "{object_name}", "iterations": {iterations}, "factor": {factor}}})'
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_op("smooth_object", {"object_name": object_name, "iterations": iterations, "factor": factor})
     
     return {
         "success": result["success"],
@@ -97,18 +112,17 @@ def remesh_object(object_name: str, octree_depth: int = 4, scale: float = 0.99,
         }
     
     operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Remesh", type="REMESH")',
-        f'modifier.mode = "{mode}"',
-        f'modifier.octree_depth = {octree_depth}',
-        f'modifier.scale = {scale}',
-        f'bpy.ops.object.modifier_apply(modifier="Remesh")',
-        f'results.append({{"action": "remesh_object", "object": "{object_name}", "mode": "{mode}", "octree_depth": {octree_depth}, "scale": {scale}}})'
+        'add_modifier(active_object(PARAMS["object_name"]), "Remesh", "REMESH", mode=PARAMS["mode"], octree_depth=PARAMS["octree_depth"], scale=PARAMS["scale"])',
+        'bpy.ops.object.modifier_apply(modifier="Remesh")',
+        'results.append({"action": "remesh_object", "object": PARAMS["object_name"], "mode": PARAMS["mode"], "octree_depth": PARAMS["octree_depth"], "scale": PARAMS["scale"]})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={
+        "object_name": object_name,
+        "mode": mode,
+        "octree_depth": octree_depth,
+        "scale": scale
+    })
     
     return {
         "success": result["success"],
@@ -119,16 +133,23 @@ def remesh_object(object_name: str, octree_depth: int = 4, scale: float = 0.99,
         "errors": result.get("stderr", "") if not result["success"] else None
     }
 
-def decimate_object(object_name: str, ratio: float = 0.5, decimate_type: str = "COLLAPSE") -> Dict[str, Any]:
+def decimate_object(object_name: str, ratio: float = 0.5, decimate_type: str = "COLLAPSE", backend: str = "blender") -> Dict[str, Any]:
     """Reduce mesh complexity using decimation.
     
+    backend="qem" replaces the DECIMATE modifier with quadric-error-metric vertex
+    clustering computed on numpy arrays in Blender, which is much faster for
+    aggressive ratios on large meshes. It triangulates the mesh and only supports
+    the COLLAPSE type.
+    
     Args:
         object_name: Name of the object to decimate
         ratio: Reduction ratio (0.0 to 1.0)
         decimate_type: Type of decimation ('COLLAPSE', 'UNSUBDIV', 'DISSOLVE')
+        backend: 'blender' for the DECIMATE modifier or 'qem' for the numpy decimator
     
     Returns:
-        Dictionary with operation result
+        Dictionary with operation result ("skipped" when a COLLAPSE ratio of 1.0 would
+        keep every face, after only checking the object)
     """
     valid_types = ['COLLAPSE', 'UNSUBDIV', 'DISSOLVE']
     if decimate_type not in valid_types:
@@ -137,49 +158,88 @@ def decimate_object(object_name: str, ratio: float = 0.5, decimate_type: str = "
             "error": f"Invalid decimate type: {decimate_type}. Valid types: {valid_types}"
         }
     
+    valid_backends = ['blender', 'qem']
+    if backend not in valid_backends:
+        return {
+            "success": False,
+            "error": f"Invalid decimate backend: {backend}. Valid backends: {valid_backends}"
+        }
+    
+    if not 0.0 <= ratio <= 1.0:
+        return {
+            "success": False,
+            "error": f"Decimate ratio must be between 0.0 and 1.0: {ratio}"
+        }
+    
+    if decimate_type == "COLLAPSE" and ratio == 1.0:
+        return noop_result("decimate_object", object_name, {"type": decimate_type, "ratio": ratio, "backend": backend})
+    
+    if backend == "qem":
+        if decimate_type != "COLLAPSE":
+            return {
+                "success": False,
+                "error": f"The qem backend only supports COLLAPSE decimation, not {decimate_type}"
+            }
+        
+        result = get_blender_manager().run_op("qem_decimate", {
+            "object_name": object_name,
+            "ratio": ratio
+        })
+        
+        return {
+            "success": result["success"],
+            "action": "decimate_object",
+            "object_name": object_name,
+            "parameters": {"type": decimate_type, "ratio": ratio, "backend": backend},
+            "blender_output": result.get("stdout", ""),
+            "errors": result.get("stderr", "") if not result["success"] else None
+        }
+    
     operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="Decimate", type="DECIMATE")',
-        f'modifier.decimate_type = "{decimate_type}"',
-        f'modifier.ratio = {ratio}',
-        f'bpy.ops.object.modifier_apply(modifier="Decimate")',
-        f'results.append({{"action": "decimate_object", "object": "{object_name}", "type": "{decimate_type}", "ratio": {ratio}}})'
+        'add_modifier(active_object(PARAMS["object_name"]), "Decimate", "DECIMATE", decimate_type=PARAMS["decimate_type"], ratio=PARAMS["ratio"])',
+        'bpy.ops.object.modifier_apply(modifier="Decimate")',
+        'results.append({"action": "decimate_object", "object": PARAMS["object_name"], "type": PARAMS["decimate_type"], "ratio": PARAMS["ratio"]})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={
+        "object_name": object_name,
+        "decimate_type": decimate_type,
+        "ratio": ratio
+    })
     
     return {
         "success": result["success"],
         "action": "decimate_object",
         "object_name": object_name,
-        "parameters": {"type": decimate_type, "ratio": ratio},
+        "parameters": {"type": decimate_type, "ratio": ratio, "backend": backend},
         "blender_output": result.get("stdout", ""),
         "errors": result.get("stderr", "") if not result["success"] else None
     }
 
-def add_edge_split(object_name: str, split_angle: float = 0.523599) -> Dict[str, Any]:
+def add_edge_split(object_name: str, split_angle: float = math.radians(30.0),
+                   split_angle_deg: Optional[float] = None) -> Dict[str, Any]:
     """Add edge split modifier for sharp edges.
     
     Args:
         object_name: Name of the object
-        split_angle: Angle threshold in radians (default ~30 degrees)
+        split_angle: Angle threshold in radians (default 30 degrees)
+        split_angle_deg: Angle threshold in degrees; overrides split_angle when given
     
     Returns:
         Dictionary with operation result
     """
+    if split_angle_deg is not None:
+        split_angle = math.radians(split_angle_deg)
+    
     operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'modifier = obj.modifiers.new(name="EdgeSplit", type="EDGE_SPLIT")',
-        f'modifier.split_angle = {split_angle}',
-        f'modifier.use_edge_angle = True',
-        f'results.append({{"action": "add_edge_split", "object": "{object_name}", "split_angle": {split_angle}}})'
+        'add_modifier(active_object(PARAMS["object_name"]), "EdgeSplit", "EDGE_SPLIT", split_angle=PARAMS["split_angle"], use_edge_angle=True)',
+        'results.append({"action": "add_edge_split", "object": PARAMS["object_name"], "split_angle": PARAMS["split_angle"]})'
     ]
     
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_operations(operations, params={
+        "object_name": object_name,
+        "split_angle": split_angle
+    })
     
     return {
         "success": result["success"],
@@ -201,18 +261,11 @@ def triangulate_mesh(object_name: str, quad_method: str = "BEAUTY", ngon_method:
     Returns:
         Dictionary with operation result
     """
-    operations = [
-        f'obj = bpy.data.objects["{object_name}"]',
-        f'bpy.context.view_layer.objects.active = obj',
-        f'bpy.ops.object.mode_set(mode="EDIT")',
-        f'bpy.ops.mesh.select_all(action="SELECT")',
-        f'bpy.ops.mesh.quads_convert_to_tris(quad_method="{quad_method}", ngon_method="{ngon_method}")',
-        f'bpy.ops.object.mode_set(mode="OBJECT")',
-        f'results.append({{"action": "triangulate_mesh", "object": "{object_name}", "quad_method": "{quad_method}", "ngon_method": "{ngon_method}"}})' 
-    ]
-    
-    script = blender_manager.create_basic_script(operations)
-    result = blender_manager.execute_blender_script(script)
+    result = get_blender_manager().run_op("triangulate_mesh", {
+        "object_name": object_name,
+        "quad_method": quad_method,
+        "ngon_method": ngon_method
+    })
     
     return {
         "success": result["success"],
@@ -221,4 +274,55 @@ def triangulate_mesh(object_name: str, quad_method: str = "BEAUTY", ngon_method:
         "parameters": {"quad_method": quad_method, "ngon_method": ngon_method},
         "blender_output": result.get("stdout", ""),
         "errors": result.get("stderr", "") if not result["success"] else None
-    }
\ No newline at end of file
+    }
+
+def mesh_pipeline(object_name: str, steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run several modifier steps on an object and apply them all at once.
+    
+    Each step is a modifier type plus its settings, e.g.
+    [{"type": "SUBSURF", "levels": 2}, {"type": "SMOOTH", "iterations": 5},
+    {"type": "DECIMATE", "ratio": 0.5}]. The modifiers are stacked in order and
+    baked with a single convert, so the stack is evaluated once rather than once per step.
+    Modifiers already on the object are applied as well.
+    
+    Args:
+        object_name: Name of the object to process
+        steps: Modifier steps; "type" is the Blender modifier type, an optional "name"
+            names the modifier and every other key is set on it
+    
+    Returns:
+        Dictionary with operation result
+    """
+    if not steps:
+        return {
+            "success": False,
+            "error": "mesh_pipeline needs at least one step"
+        }
+    
+    modifiers = []
+    for index, step in enumerate(steps):
+        if "type" not in step:
+            return {
+                "success": False,
+                "error": f"Step {index} has no modifier type: {step}"
+            }
+        settings = {key: value for key, value in step.items() if key not in ("type", "name")}
+        modifiers.append({
+            "type": step["type"],
+            "name": step.get("name", f"Pipeline{index}"),
+            "settings": settings
+        })
+    
+    result = get_blender_manager().run_op("mesh_pipeline", {
+        "object_name": object_name,
+        "modifiers": modifiers
+    })
+    
+    return {
+        "success": result["success"],
+        "action": "mesh_pipeline",
+        "object_name": object_name,
+        "parameters": {"steps": steps},
+        "blender_output": result.get("stdout", ""),
+        "errors": result.get("stderr", "") if not result["success"] else None
+    }